@@ -4,12 +4,180 @@ PyAim Cross-Platform Tracker
 マウスとゲームパッドの両方に対応したエイムトレーニングツール
 """
 
-from src.game import Game
+import argparse
+import sys
+
+
+def parse_args():
+    """コマンドライン引数を解析"""
+    parser = argparse.ArgumentParser(description="PyAim Cross-Platform Tracker")
+    parser.add_argument(
+        "--export", metavar="DIR",
+        help="セッション履歴を列指向形式でDIRに書き出して終了",
+    )
+    parser.add_argument(
+        "--export-format", choices=["npz", "npy"], default="npz",
+        help="エクスポート形式（npz: 圧縮, npy: 列ごとのメモリマップ用ファイル）",
+    )
+    parser.add_argument(
+        "--import", dest="import_paths", nargs="+", metavar="FILE",
+        help="CSV / JSON Lines の記録をセッション履歴に取り込んで終了（重複する記録は読み飛ばす）",
+    )
+    parser.add_argument(
+        "--import-mode", choices=["tracking", "flicking"], default=None,
+        help="mode 列がない入力のモード",
+    )
+    parser.add_argument(
+        "--renderer", choices=["surface", "texture"], default=None,
+        help="描画バックエンド（surface: ソフトウェアblit, texture: SDL2 Renderer）",
+    )
+    parser.add_argument(
+        "--render-benchmark", action="store_true",
+        help="両方の描画バックエンドで同じシーンを描画し、1フレームあたりの時間を表示して終了",
+    )
+    parser.add_argument(
+        "--profile-scene", metavar="SCENE",
+        help="このシーン（launcher/tracking/flicking/stats/replay、* で起動直後）に入るたびにプロファイルを取る",
+    )
+    parser.add_argument(
+        "--profile-frames", type=int, metavar="N",
+        help="プロファイルするフレーム数（省略時はシーンを離れるまで）",
+    )
+    parser.add_argument(
+        "--profiler", choices=["sample", "cprofile"], default="sample",
+        help="プロファイラ（sample: サンプリング, cprofile: cProfile）",
+    )
+    parser.add_argument(
+        "--live-bus", action="store_true",
+        help="毎フレームの状態を共有メモリに公開する（ダッシュボード・配信用オーバーレイ向け）",
+    )
+    parser.add_argument(
+        "--dashboard", action="store_true",
+        help="--live-bus で起動したゲームの状態を表示するダッシュボードを開く（別プロセスで実行）",
+    )
+    parser.add_argument(
+        "--bots", action="store_true",
+        help="ボットにTracking/Flickingをヘッドレス・最高速度でプレイさせ、処理速度とスコアのずれを表示して終了",
+    )
+    parser.add_argument(
+        "--bot-presets", nargs="+", choices=["novice", "average", "expert"], default=None, metavar="NAME",
+        help="プレイさせるボット（novice/average/expert、省略時は全部）",
+    )
+    parser.add_argument(
+        "--bot-sessions", type=int, default=4, metavar="N",
+        help="ボット・モード・フレームレートごとのセッション数（フレームレートを複数指定した場合は40以上）",
+    )
+    parser.add_argument(
+        "--bot-fps", type=int, nargs="+", default=[144], metavar="FPS",
+        help="シミュレーションのフレームレート（複数指定するとフレームレートによるスコアのずれを調べる）",
+    )
+    parser.add_argument(
+        "--bot-workers", type=int, default=None, metavar="N",
+        help="ボットを動かすプロセス数（省略時はCPU数）",
+    )
+    parser.add_argument(
+        "--bot-no-render", action="store_true",
+        help="ボットのセッションで描画を行わない（更新処理だけを計測する）",
+    )
+    parser.add_argument(
+        "--bot-baseline", metavar="FILE",
+        help="ボットのスコアをFILEの基準値と比べる（FILEがなければ今回の結果を保存）",
+    )
+    parser.add_argument(
+        "--calibrate", action="store_true",
+        help="ターゲットの速さ・半径とボットの組をシミュレーションで掃引し、難易度の段階を data/difficulty.json に書き出して終了",
+    )
+    parser.add_argument(
+        "--calibrate-sessions", type=int, default=200, metavar="N",
+        help="掃引の組ごとのセッション数",
+    )
+    parser.add_argument(
+        "--calibrate-workers", type=int, default=None, metavar="N",
+        help="掃引に使うプロセス数（省略時はCPU数）",
+    )
+    parser.add_argument(
+        "--alloc-diagnostics", action="store_true",
+        help="起動時からアロケーション診断を有効にする（F10で切り替え、終了時に集計を表示）",
+    )
+    parser.add_argument(
+        "--alloc-check", action="store_true",
+        help="各シーンをヘッドレスで動かし、定常状態のメモリ確保が予算を超えたら終了コード1で終了",
+    )
+    return parser.parse_args()
 
 
 def main():
     """エントリーポイント"""
-    game = Game()
+    args = parse_args()
+
+    if args.export:
+        from src.export import export_sessions
+        for path in export_sessions(args.export, fmt=args.export_format):
+            print(f"書き出し: {path}")
+        return
+
+    if args.import_paths:
+        from src.importer import import_sessions
+
+        def show_progress(done, total, report):
+            percent = done / total * 100 if total else 100.0
+            print(f"\r取り込み中: {percent:5.1f}%  {report.total_imported}件", end="", flush=True)
+
+        failed = False
+        for path in args.import_paths:
+            print(f"インポート: {path}")
+            try:
+                report = import_sessions(path, mode=args.import_mode, progress=show_progress)
+            except Exception as e:
+                print(f"\nインポートエラー: {e}")
+                failed = True
+                continue
+            print()
+            print(report.format())
+        sys.exit(1 if failed else 0)
+
+    if args.render_benchmark:
+        from src.benchmark import run_render_benchmark
+        run_render_benchmark()
+        return
+
+    if args.alloc_check:
+        from src.alloc_diagnostics import run_allocation_check
+        sys.exit(0 if run_allocation_check(args.renderer) else 1)
+
+    if args.bots:
+        from src.bots import run_bot_benchmark
+        ok = run_bot_benchmark(
+            args.bot_presets, args.bot_sessions, args.bot_fps, args.bot_workers,
+            render=not args.bot_no_render, render_backend=args.renderer,
+            baseline_path=args.bot_baseline,
+        )
+        sys.exit(0 if ok else 1)
+
+    if args.calibrate:
+        from src.calibration import run_calibration
+        sys.exit(0 if run_calibration(args.calibrate_sessions, args.calibrate_workers) else 1)
+
+    if args.dashboard:
+        from src.dashboard import run_dashboard
+        run_dashboard()
+        return
+
+    from src import profiling
+    profiling.configure(args.profiler, scene=args.profile_scene, frames=args.profile_frames)
+
+    live_bus = None
+    if args.live_bus:
+        from src.live_bus import LiveTelemetryBus
+        try:
+            live_bus = LiveTelemetryBus()
+        except OSError as e:
+            print(f"ライブテレメトリを開始できません: {e}")
+
+    from src.game import Game
+    game = Game(args.renderer, live_bus=live_bus)
+    if args.alloc_diagnostics:
+        game.toggle_alloc_diagnostics()
     game.run()
 
 
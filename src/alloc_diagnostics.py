@@ -0,0 +1,288 @@
+"""
+アロケーション診断モジュール
+
+1フレームごとに確保されたメモリブロック数（sys.getallocatedblocks）と
+バイト数（tracemalloc）を計測し、Scene.update と Scene.render のどちらで
+確保されたかを区別して集計する。
+
+- 診断モード: ゲーム中に F10 で開始/終了し、シーンごとの集計を表示する
+- 予算チェック（--alloc-check）: 各シーンをヘッドレスで一定フレーム動かし、
+  定常状態の確保量が予算を超えたシーンがあれば失敗として終了コード1を返す
+
+ブロック数はフレーム前後の差（解放されずに残った分）、
+バイト数は tracemalloc のピーク（フレーム内で一時的に確保された分を含む）で見る。
+"""
+
+import sys
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+# 計測区間
+PHASE_UPDATE = "update"
+PHASE_DRAW = "draw"
+PHASES = (PHASE_UPDATE, PHASE_DRAW)
+
+# 予算チェックの既定値
+CHECK_WARMUP_FRAMES = 300
+CHECK_FRAMES = 600
+
+# 定常状態の予算（区間ごと）
+# 残留ブロック数は1フレームあたりの平均、一時確保はフレーム内ピークの最大値
+BUDGET_BLOCKS_PER_FRAME = 0.05
+BUDGET_PEAK_BYTES = 4 * 1024
+
+# 予算チェックで動かすシーン
+CHECK_SCENES = ("launcher", "tracking", "flicking", "stats", "replay")
+
+
+def _noop() -> None:
+    return None
+
+
+class PhaseStats:
+    """1区間（update / draw）の集計"""
+
+    __slots__ = ("frames", "blocks", "bytes", "peak_bytes", "max_blocks")
+
+    def __init__(self):
+        self.frames = 0
+        self.blocks = 0         # 残留ブロック数の合計
+        self.bytes = 0          # 残留バイト数の合計
+        self.peak_bytes = 0     # フレーム内一時確保の最大値
+        self.max_blocks = 0     # 1フレームの残留ブロック数の最大値
+
+    def add(self, blocks: int, net_bytes: int, peak_bytes: int) -> None:
+        self.frames += 1
+        self.blocks += blocks
+        self.bytes += net_bytes
+        if peak_bytes > self.peak_bytes:
+            self.peak_bytes = peak_bytes
+        if blocks > self.max_blocks:
+            self.max_blocks = blocks
+
+    def blocks_per_frame(self) -> float:
+        return self.blocks / self.frames if self.frames else 0.0
+
+    def bytes_per_frame(self) -> float:
+        return self.bytes / self.frames if self.frames else 0.0
+
+
+class AllocationMonitor:
+    """区間ごとのメモリ確保を計測するクラス"""
+
+    def __init__(self, trace_bytes: bool = True):
+        """
+        Args:
+            trace_bytes: tracemalloc でバイト数も計測する（Falseの場合はブロック数のみで軽量）
+        """
+        self.trace_bytes = trace_bytes
+        self._started_tracemalloc = False
+        if trace_bytes and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+        # シーン名 -> 区間名 -> 集計
+        self.stats: Dict[str, Dict[str, PhaseStats]] = {}
+
+        # 計測そのものが確保する分（開始時の値を保持する int など）を差し引く
+        self._overhead_blocks = 0
+        self._overhead_bytes = 0
+        # tracemalloc 開始直後は計測値が小さく int がキャッシュされてしまうため、
+        # 実際の計測と同じ条件になるよう一時的に確保した状態で測る
+        ballast = bytearray(4096)
+        self._overhead_blocks, self._overhead_bytes, _ = self._measure(_noop, ())
+        del ballast
+
+    def _get_stats(self, scene: str, phase: str) -> PhaseStats:
+        phases = self.stats.get(scene)
+        if phases is None:
+            phases = {name: PhaseStats() for name in PHASES}
+            self.stats[scene] = phases
+        return phases[phase]
+
+    def _measure(self, func: Callable, args: tuple) -> Tuple[int, int, int]:
+        """func(*args) の (残留ブロック数, 残留バイト数, 一時確保のピーク)"""
+        if self.trace_bytes:
+            tracemalloc.reset_peak()
+            start_bytes = tracemalloc.get_traced_memory()[0]
+        start_blocks = sys.getallocatedblocks()
+
+        func(*args)
+
+        blocks = sys.getallocatedblocks() - start_blocks - self._overhead_blocks
+        if not self.trace_bytes:
+            return blocks, 0, 0
+        current, peak = tracemalloc.get_traced_memory()
+        return blocks, current - start_bytes - self._overhead_bytes, peak - start_bytes
+
+    def measure(self, scene: str, phase: str, func: Callable, *args) -> None:
+        """
+        func(*args) の実行中に確保されたメモリを計測
+
+        Args:
+            scene: 集計先のシーン名
+            phase: "update" または "draw"
+        """
+        self._get_stats(scene, phase).add(*self._measure(func, args))
+
+    def reset(self, scene: Optional[str] = None) -> None:
+        """集計をリセット（Noneの場合は全シーン）"""
+        if scene is None:
+            self.stats.clear()
+        else:
+            self.stats.pop(scene, None)
+
+    def format_report(self) -> List[str]:
+        """シーン・区間ごとの集計を表示用の行にする"""
+        lines = [f"{'scene':<10}{'phase':<8}{'frames':>8}{'blocks/f':>10}{'max':>6}{'bytes/f':>10}{'peak':>10}"]
+        for scene, phases in self.stats.items():
+            for phase in PHASES:
+                stats = phases[phase]
+                lines.append(
+                    f"{scene:<10}{phase:<8}{stats.frames:>8}"
+                    f"{stats.blocks_per_frame():>10.3f}{stats.max_blocks:>6}"
+                    f"{stats.bytes_per_frame():>10.1f}{stats.peak_bytes:>10}"
+                )
+        return lines
+
+    def check_budget(
+        self,
+        blocks_per_frame: float = BUDGET_BLOCKS_PER_FRAME,
+        peak_bytes: int = BUDGET_PEAK_BYTES,
+        scene_name: Optional[str] = None,
+    ) -> List[str]:
+        """
+        予算を超えた区間を調べる
+
+        Args:
+            scene_name: 指定した場合はそのシーンだけを調べる
+
+        Returns:
+            予算超過の内容（空なら予算内）
+        """
+        failures = []
+        for scene, phases in self.stats.items():
+            if scene_name is not None and scene != scene_name:
+                continue
+            for phase in PHASES:
+                stats = phases[phase]
+                if stats.blocks_per_frame() > blocks_per_frame:
+                    failures.append(
+                        f"{scene}.{phase}: 残留 {stats.blocks_per_frame():.3f} ブロック/フレーム"
+                        f"（予算 {blocks_per_frame}）"
+                    )
+                if self.trace_bytes and stats.peak_bytes > peak_bytes:
+                    failures.append(
+                        f"{scene}.{phase}: 一時確保 {stats.peak_bytes} バイト（予算 {peak_bytes}）"
+                    )
+        return failures
+
+    def shutdown(self) -> None:
+        """tracemalloc を自分で開始した場合は停止"""
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+
+def _prepare_scene(game, name: str) -> None:
+    """予算チェック用にシーンを定常状態（セッション中）にする"""
+    game.change_scene(name)
+    scene = game.current_scene
+    if name == "tracking":
+        scene.session_duration = 1e9
+        scene.start_session()
+    elif name == "flicking":
+        scene.target_count = 1 << 30
+        scene.start_session()
+
+
+def _step_scene(game, name: str, frame: int, dt: float) -> None:
+    """
+    シーンを1フレーム更新
+
+    ヘッドレスでは入力がないため、ヒット時と同じエフェクトとターゲット出現を
+    定期的に発生させる（実際のクリック処理と同じく update 側の確保として数える）。
+    """
+    scene = game.current_scene
+    scene.update(dt)
+    if name == "tracking" and frame % 30 == 0:
+        scene.particles.emit_burst(scene.target.x, scene.target.y, count=15, speed=150)
+    elif name == "flicking" and frame % 30 == 0:
+        scene.particles.emit_burst(scene.target.x, scene.target.y, count=20, speed=200)
+        scene.spawn_next_target()
+
+
+def _finish_scene(game, name: str) -> None:
+    """セッションを記録せずに終了"""
+    scene = game.current_scene
+    if hasattr(scene, "cancel_session"):
+        scene.cancel_session()
+
+
+def collect_scene_allocations(
+    render_backend: Optional[str] = None,
+    scenes: Tuple[str, ...] = CHECK_SCENES,
+    frames: int = CHECK_FRAMES,
+    warmup: int = CHECK_WARMUP_FRAMES,
+    dt: float = 1 / 144,
+) -> AllocationMonitor:
+    """
+    各シーンをヘッドレスで動かし、定常状態のメモリ確保を集計
+
+    ウォームアップ中の確保（キャッシュ構築など）は集計しない。
+    セッション結果・テレメトリは保存しない。
+
+    Args:
+        render_backend: 描画バックエンド（Noneの場合はプロファイルの設定）
+        scenes: 動かすシーン
+        frames: シーンごとの計測フレーム数
+        warmup: 計測前に動かすフレーム数
+
+    Returns:
+        集計済みのモニター（check_budget / format_report で結果を調べる）
+    """
+    import pygame
+    from .game import Game
+
+    game = Game(render_backend)
+    monitor = AllocationMonitor()
+    try:
+        for name in scenes:
+            _prepare_scene(game, name)
+            scene = game.current_scene
+            for frame in range(warmup + frames):
+                if frame == warmup:
+                    monitor.reset(name)
+                pygame.event.pump()
+                monitor.measure(name, PHASE_UPDATE, _step_scene, game, name, frame, dt)
+                monitor.measure(name, PHASE_DRAW, scene.render, game.renderer)
+                game.renderer.present()
+                game.gc_policy.update(getattr(scene, "session_active", False))
+            _finish_scene(game, name)
+    finally:
+        monitor.shutdown()
+        game.gc_policy.shutdown()
+        game.input_handler.shutdown()
+        pygame.quit()
+    return monitor
+
+
+def run_allocation_check(render_backend: Optional[str] = None) -> bool:
+    """
+    各シーンの定常状態のメモリ確保が予算内か調べて結果を表示（--alloc-check）
+
+    Args:
+        render_backend: 描画バックエンド（Noneの場合はプロファイルの設定）
+
+    Returns:
+        全シーンが予算内なら True
+    """
+    monitor = collect_scene_allocations(render_backend)
+    for line in monitor.format_report():
+        print(line)
+    failures = monitor.check_budget()
+    for failure in failures:
+        print(f"予算超過: {failure}")
+    print("アロケーション予算: " + ("NG" if failures else "OK"))
+    return not failures
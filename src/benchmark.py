@@ -0,0 +1,214 @@
+"""
+描画ベンチマークモジュール
+
+- 同じシーン・同じ描画内容を各バックエンドで一定フレーム描画し、
+  1フレームあたりの描画時間を計測する。セッション結果は保存しない。
+- 初回起動時にはウィンドウを開かずにオフスクリーンで画質プリセットを計測し、
+  ディスプレイのリフレッシュレートを維持できるプリセットを選ぶ。
+  各プリセットの内部解像度（render_scale）のサーフェスに実際の縮小描画の経路で描画する
+  （表示時の拡大は pygame.SCALED がGPUで行うため計測に含めない）。
+"""
+
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import pygame
+
+from .render import BACKENDS, SurfaceRenderer, ScaledSurfaceRenderer, render_size
+from .settings import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, TARGET_FPS, COLOR_BACKGROUND, COLOR_TEXT,
+    GRAPHICS_PRESETS, GRAPHICS_PRESET_ORDER,
+)
+
+
+# 描画に使ってよいフレーム時間の割合（入力処理・表示転送・OSの分を残す）
+FRAME_BUDGET_RATIO = 0.5
+
+# プリセット計測のフレーム数
+PRESET_BENCHMARK_FRAMES = 120
+
+
+# 計測するシーン
+BENCHMARK_SCENES = ("launcher", "tracking", "flicking")
+
+
+def _prepare_scene(game, name: str) -> None:
+    """計測用にシーンをセッション中の状態にする（記録・入力占有はしない）"""
+    game.change_scene(name)
+    scene = game.current_scene
+    if name in ("tracking", "flicking"):
+        scene.session_active = True
+        scene.show_result = False
+        scene.session_start_ns = game.clock.now_ns()
+        scene.target.spawn_random()
+        if name == "tracking":
+            scene.target.set_random_velocity()
+
+
+def _step_scene(game, name: str, frame: int, dt: float) -> None:
+    """描画内容を進める（ターゲット移動とパーティクル）"""
+    scene = game.current_scene
+    if name == "tracking":
+        scene.target.update(dt)
+        scene.total_time += dt
+        scene.particles.emit_trail(scene.target.x, scene.target.y)
+    elif name == "flicking" and frame % 10 == 0:
+        scene.target.spawn_random()
+        scene.particles.emit_burst(scene.target.x, scene.target.y)
+    if hasattr(scene, "particles"):
+        scene.particles.update(dt)
+
+
+def benchmark_backend(backend: str, frames: int = 300, dt: float = 1 / 144) -> Dict[str, float]:
+    """
+    1つのバックエンドで各シーンを描画して計測
+
+    Args:
+        backend: "surface" または "texture"
+        frames: シーンごとの計測フレーム数
+        dt: 1フレームあたりの擬似経過時間（秒）
+
+    Returns:
+        シーン名 -> 1フレームあたりの描画時間（ミリ秒）
+    """
+    from .game import Game
+
+    game = Game(backend)
+    results: Dict[str, float] = {}
+    try:
+        for name in BENCHMARK_SCENES:
+            _prepare_scene(game, name)
+            # キャッシュ構築分を除くためのウォームアップ
+            for frame in range(10):
+                _step_scene(game, name, frame, dt)
+                game.draw()
+
+            elapsed = 0.0
+            for frame in range(frames):
+                _step_scene(game, name, frame, dt)
+                pygame.event.pump()
+                start = time.perf_counter()
+                game.draw()
+                elapsed += time.perf_counter() - start
+            results[name] = elapsed / frames * 1000.0
+
+            scene = game.current_scene
+            if hasattr(scene, "session_active"):
+                scene.session_active = False
+                scene.particles.clear()
+    finally:
+        game.input_handler.shutdown()
+        pygame.quit()
+    return results
+
+
+def detect_refresh_rate() -> int:
+    """ディスプレイのリフレッシュレートを取得（取得できない場合は TARGET_FPS）"""
+    try:
+        rates = pygame.display.get_desktop_refresh_rates()
+    except (AttributeError, pygame.error):
+        rates = []
+    rates = [rate for rate in rates if rate > 0]
+    return max(rates) if rates else TARGET_FPS
+
+
+def measure_preset(preset: Dict[str, Any], frames: int = PRESET_BENCHMARK_FRAMES, dt: float = 1 / 144) -> float:
+    """
+    オフスクリーンでセッション中相当の描画を行い、1フレームあたりの時間を計測
+
+    Args:
+        preset: 画質プリセットの設定
+
+    Returns:
+        1フレームあたりの描画時間（ミリ秒）
+    """
+    from .target import Target
+    from .cursor import Cursor
+    from .effects import ParticleSystem
+
+    render_scale = preset.get("render_scale", 1.0)
+    surface = pygame.Surface(render_size(render_scale))
+    options = {"text_cache_size": preset["text_cache_size"], "antialias": preset["antialias"]}
+    if render_scale < 1.0:
+        renderer = ScaledSurfaceRenderer(surface, render_scale, **options)
+    else:
+        renderer = SurfaceRenderer(surface, **options)
+    font = pygame.font.Font(None, 24)
+    # 画面全体の静的レイヤー（毎フレームの転送量は内部解像度で決まる）
+    background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    background.fill(COLOR_BACKGROUND)
+    pygame.draw.rect(background, COLOR_TEXT, background.get_rect(), 2)
+    target = Target(radius=50)
+    target.set_random_velocity()
+    cursor = Cursor()
+    particles = ParticleSystem(preset["particle_density"])
+
+    start = time.perf_counter()
+    for frame in range(frames):
+        target.update(dt)
+        particles.emit_trail(target.x, target.y)
+        if frame % 10 == 0:
+            particles.emit_burst(target.x, target.y)
+        particles.update(dt)
+
+        renderer.blit(background, (0, 0), cache_key="background")
+        target.render(renderer)
+        # 毎フレーム変わる数値表示（テキストキャッシュの効き具合を含める）
+        renderer.text(font, f"{(frames - frame) * dt:.1f}s", COLOR_TEXT, (SCREEN_WIDTH - 100, 10))
+        renderer.text(font, f"T0: {frame % 1000 / 10:.1f}%", COLOR_TEXT, (SCREEN_WIDTH - 100, 50))
+        particles.render(renderer)
+        cursor.render(renderer)
+    return (time.perf_counter() - start) / frames * 1000.0
+
+
+def choose_graphics_preset(refresh_rate: int) -> Tuple[str, Dict[str, float]]:
+    """
+    リフレッシュレートを維持できる最も高いプリセットを選ぶ
+
+    Returns:
+        (プリセット名, プリセット名 -> 計測値（ミリ秒）)
+    """
+    budget_ms = 1000.0 / refresh_rate * FRAME_BUDGET_RATIO
+    chosen = GRAPHICS_PRESET_ORDER[0]
+    results: Dict[str, float] = {}
+    for name in GRAPHICS_PRESET_ORDER:
+        results[name] = measure_preset(GRAPHICS_PRESETS[name])
+        if results[name] > budget_ms:
+            break
+        chosen = name
+    return chosen, results
+
+
+def auto_configure_graphics() -> Dict[str, Any]:
+    """
+    初回起動時の自動設定（プロファイルの "graphics" セクションを作成）
+
+    pygame.init() 後、ディスプレイモード設定前に呼ぶ。
+    """
+    refresh_rate = detect_refresh_rate()
+    preset, results = choose_graphics_preset(refresh_rate)
+    print(f"画質プリセットを自動設定しました: {preset} ({refresh_rate}Hz)")
+    return {
+        "preset": preset,
+        "refresh_rate": refresh_rate,
+        "benchmark_ms": {name: round(value, 3) for name, value in results.items()},
+    }
+
+
+def run_render_benchmark(backends: Optional[List[str]] = None, frames: int = 300) -> Dict[str, Dict[str, float]]:
+    """全バックエンドを計測して結果を表示"""
+    if backends is None:
+        backends = list(BACKENDS)
+
+    all_results: Dict[str, Dict[str, float]] = {}
+    for backend in backends:
+        try:
+            all_results[backend] = benchmark_backend(backend, frames)
+        except pygame.error as e:
+            print(f"{backend}: 計測できませんでした ({e})")
+
+    print(f"{'scene':<10}" + "".join(f"{backend:>12}" for backend in all_results))
+    for name in BENCHMARK_SCENES:
+        row = "".join(f"{all_results[backend][name]:>10.3f}ms" for backend in all_results)
+        print(f"{name:<10}{row}")
+    return all_results
@@ -0,0 +1,619 @@
+"""
+ボット（自動エイム）モジュール
+
+InputHandler に仮想デバイスとして接続するボットが Tracking / Flicking を
+ヘッドレスかつ最高速度でプレイする。時刻はフレームごとに一定間隔で進める
+シミュレーション時刻を使うため、同じボット・シード・フレームレートなら結果は毎回同じになる。
+
+- 負荷生成: 複数のボットをプロセスプールで並列に動かし、ゲームループ全体
+  （入力・更新・描画・保存）の処理速度を計測する
+- 回帰チェック: フレームレートを変えてもスコアの平均がずれないこと、
+  前回保存した基準値と同じスコアになることを確認する
+
+ボットの操作は BotAimer.track() / flick() で決まり、継承して差し替えられる。
+ワーカーはセッション結果・テレメトリを一時ディレクトリに保存し、終了時に削除する。
+"""
+
+import contextlib
+import io
+import json
+import math
+import os
+import random
+import shutil
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from .clock import NS_PER_SECOND
+from .settings import SCREEN_WIDTH, SCREEN_HEIGHT, DEFAULT_GRAPHICS_PRESET
+
+
+class BotParams(NamedTuple):
+    """ボットの操作特性"""
+    reaction_delay: float    # 知覚の遅れ（秒）
+    tracking_gain: float     # 照準のずれを詰める速さ（1/秒）
+    noise: float             # 照準のぶれ（ピクセル、標準偏差）
+    overshoot: float         # フリックの行き過ぎ・追従の先読みの割合
+
+
+BOT_PRESETS: Dict[str, BotParams] = {
+    "novice": BotParams(reaction_delay=0.30, tracking_gain=4.0, noise=30.0, overshoot=0.25),
+    "average": BotParams(reaction_delay=0.22, tracking_gain=7.0, noise=16.0, overshoot=0.12),
+    "expert": BotParams(reaction_delay=0.16, tracking_gain=12.0, noise=8.0, overshoot=0.05),
+}
+
+BOT_MODES = ("tracking", "flicking")
+
+DEFAULT_FPS = 144
+
+# 照準のぶれが入れ替わる時間（秒、Ornstein-Uhlenbeck過程の時定数）
+AIM_NOISE_TIME_CONSTANT = 0.3
+
+# フリックの所要時間（Fittsの法則: A + B * log2(距離 / 直径 + 1)、秒）
+FITTS_A = 0.08
+FITTS_B = 0.12
+
+# 照準が合ったとみなす距離（ターゲット半径に対する割合）
+SETTLE_RATIO = 0.25
+
+# 照準が合わなくてもクリックするまでの修正時間（秒）
+CORRECTION_TIMEOUT = 1.0
+
+# セッションが終わらない場合に打ち切るまでのシミュレーション時間（Flicking は1ターゲットあたり）
+TRACKING_TIMEOUT_MARGIN = 5.0
+FLICKING_TIMEOUT_PER_TARGET = 5.0
+
+# 評価するスコアと、フレームレート間で許容する平均の差
+SCORE_KEYS = {
+    "tracking": ("t0_rate",),
+    "flicking": ("accuracy", "mean_reaction_ms"),
+}
+DRIFT_TOLERANCE = {"t0_rate": 2.0, "accuracy": 5.0, "mean_reaction_ms": 10.0}
+
+# フレームレート間の比較に必要なセッション数。これより少ないと分散の推定がぶれて
+# 変更のないツリーでも許容差を超えることがあるため、自動で増やす
+DRIFT_MIN_SESSIONS = 40
+
+# 反応時間に含まれるフレーム単位の遅れ（出現の表示・知覚・フリック終了・クリックの判定）。
+# フレームレート間の比較ではフレーム時間の差のこの倍数を許容差に加える
+REACTION_LATENCY_FRAMES = 4
+
+# 基準値との比較で許容する差（同じ条件なら一致するはず）
+BASELINE_TOLERANCE = 1e-3
+
+# フリックの段階
+_IDLE, _BALLISTIC, _CORRECT = 0, 1, 2
+
+
+def _minimum_jerk(progress: float) -> float:
+    """躍度最小軌道の進み具合（0.0 - 1.0）"""
+    return progress * progress * progress * (10.0 - 15.0 * progress + 6.0 * progress * progress)
+
+
+class BotAimer:
+    """
+    自動でエイムするボット（InputHandler の仮想デバイス）
+
+    毎フレーム、ゲームの更新前に think() を呼ぶと移動量とボタンの状態を決める。
+    InputHandler は update() で read_motion()、シーンは is_pressed() で読み出す。
+    ターゲットの位置は reaction_delay 秒前のものしか見えない。
+    """
+
+    def __init__(self, params: BotParams, seed: int = 0):
+        """
+        Args:
+            params: 操作特性
+            seed: ぶれの乱数シード
+        """
+        self.params = params
+        self.reset(seed)
+
+    def reset(self, seed: int = 0, mode: str = "tracking") -> None:
+        """セッション開始前の状態に戻す"""
+        self.mode = mode
+        self.rng = random.Random(seed)
+        self.time = 0.0
+        self._seen: deque = deque()
+        self._motion = [0.0, 0.0]
+        self._pressed = False
+        # 照準のぶれ（ピクセル）
+        self._offset_x = 0.0
+        self._offset_y = 0.0
+        # フリックの状態
+        self._phase = _IDLE
+        self._phase_time = 0.0
+        self._flick_index = 0
+        self._flick_start = (0.0, 0.0)
+        self._flick_end = (0.0, 0.0)
+        self._flick_duration = 0.0
+
+    # 仮想デバイス
+
+    def read_motion(self) -> Tuple[float, float]:
+        """前回の読み出し以降の移動量（ピクセル）"""
+        dx, dy = self._motion
+        self._motion[0] = self._motion[1] = 0.0
+        return (dx, dy)
+
+    def is_pressed(self) -> bool:
+        """ボタンを押しているか"""
+        return self._pressed
+
+    # 操作
+
+    def think(self, scene, cursor, dt: float) -> None:
+        """
+        1フレーム分の操作を決める
+
+        Args:
+            scene: プレイ中のシーン（target を持つ）
+            cursor: ゲームのカーソル
+            dt: フレーム時間（秒）
+        """
+        self.time += dt
+        self._update_noise(dt)
+        if self.mode == "flicking":
+            self.flick(scene, cursor, dt)
+        else:
+            self.track(scene, cursor, dt)
+
+    def move(self, dx: float, dy: float) -> None:
+        """カーソルを動かす（次の read_motion() で渡す）"""
+        self._motion[0] += dx
+        self._motion[1] += dy
+
+    def _update_noise(self, dt: float) -> None:
+        """照準のぶれを更新（フレームレートによらず同じ分布になる厳密な離散化）"""
+        decay = math.exp(-dt / AIM_NOISE_TIME_CONSTANT)
+        scale = self.params.noise * math.sqrt(1.0 - decay * decay)
+        self._offset_x = self._offset_x * decay + scale * self.rng.gauss(0.0, 1.0)
+        self._offset_y = self._offset_y * decay + scale * self.rng.gauss(0.0, 1.0)
+
+    def _observe(self, x: float, y: float, vx: float, vy: float, index: int) -> Optional[tuple]:
+        """
+        ターゲットの状態を記録し、reaction_delay 秒前の状態を返す
+
+        Returns:
+            (x, y, vx, vy, index)（まだ見えていない場合はNone）
+        """
+        seen = self._seen
+        seen.append((self.time, x, y, vx, vy, index))
+        visible_until = self.time - self.params.reaction_delay
+        while len(seen) >= 2 and seen[1][0] <= visible_until:
+            seen.popleft()
+        if seen[0][0] > visible_until:
+            return None
+        return seen[0][1:]
+
+    def track(self, scene, cursor, dt: float) -> None:
+        """
+        Tracking の操作
+
+        見えているターゲットの位置を遅れの分だけ速度で先読みし、照準のずれを
+        tracking_gain の速さで詰めながらターゲットの速度に (1 + overshoot) 倍で追従する。
+        """
+        target = scene.target
+        seen = self._observe(target.x, target.y, target.velocity_x, target.velocity_y, 0)
+        if seen is None:
+            return
+        x, y, vx, vy, _ = seen
+        delay = self.params.reaction_delay
+        aim_x = x + vx * delay + self._offset_x
+        aim_y = y + vy * delay + self._offset_y
+        follow = 1.0 - math.exp(-self.params.tracking_gain * dt)
+        lead = 1.0 + self.params.overshoot
+        self.move(
+            (aim_x - cursor.x) * follow + vx * lead * dt,
+            (aim_y - cursor.y) * follow + vy * lead * dt,
+        )
+
+    def flick(self, scene, cursor, dt: float) -> None:
+        """
+        Flicking の操作
+
+        新しいターゲットが見えたら、行き過ぎを含む目標点へ躍度最小軌道でフリックし、
+        その後ずれを詰めて照準が合ったと判断したらクリックする。
+        ぶれはボット自身には見えないため、ぶれが半径より大きいとミスになる。
+        """
+        self._pressed = False
+        target = scene.target
+        seen = self._observe(target.x, target.y, 0.0, 0.0, scene.current_target)
+        if seen is None:
+            return
+        x, y, _, _, index = seen
+        aim_x = x + self._offset_x
+        aim_y = y + self._offset_y
+
+        if index != self._flick_index:
+            # 新しいターゲット: フリック開始
+            self._flick_index = index
+            self._phase = _BALLISTIC
+            self._phase_time = 0.0
+            self._flick_start = (cursor.x, cursor.y)
+            scale = 1.0 + self.params.overshoot
+            self._flick_end = (
+                cursor.x + (aim_x - cursor.x) * scale,
+                cursor.y + (aim_y - cursor.y) * scale,
+            )
+            distance = math.hypot(x - cursor.x, y - cursor.y)
+            self._flick_duration = FITTS_A + FITTS_B * math.log2(distance / (2.0 * target.radius) + 1.0)
+
+        if self._phase == _IDLE:
+            return
+        self._phase_time += dt
+
+        if self._phase == _BALLISTIC:
+            progress = min(1.0, self._phase_time / self._flick_duration)
+            s = _minimum_jerk(progress)
+            start_x, start_y = self._flick_start
+            end_x, end_y = self._flick_end
+            self.move(start_x + (end_x - start_x) * s - cursor.x, start_y + (end_y - start_y) * s - cursor.y)
+            if progress >= 1.0:
+                self._phase = _CORRECT
+                self._phase_time = 0.0
+            return
+
+        # 修正: ずれを詰めて、合ったらクリック
+        follow = 1.0 - math.exp(-self.params.tracking_gain * dt)
+        self.move((aim_x - cursor.x) * follow, (aim_y - cursor.y) * follow)
+        settled = math.hypot(aim_x - cursor.x, aim_y - cursor.y) <= target.radius * SETTLE_RATIO
+        if settled or self._phase_time >= CORRECTION_TIMEOUT:
+            self._pressed = True
+            self._phase = _IDLE
+
+
+class SimulatedTime:
+    """ヘッドレス実行用の時刻（ナノ秒、advance() でだけ進む）"""
+
+    def __init__(self):
+        self.ns = 0
+
+    def __call__(self) -> int:
+        return self.ns
+
+    def advance(self, ns: int) -> None:
+        self.ns += ns
+
+
+def create_headless_game(render_backend: Optional[str] = None):
+    """
+    シミュレーション時刻で動く Game を作成
+
+    Returns:
+        (Game, SimulatedTime)
+    """
+    from .clock import FrameClock
+    from .game import Game
+
+    sim_time = SimulatedTime()
+    game = Game(render_backend, clock=FrameClock(time_source=sim_time, sleep=lambda seconds: None))
+    return game, sim_time
+
+
+def run_bot_session(
+    game,
+    sim_time: SimulatedTime,
+    aimer: BotAimer,
+    mode: str,
+    seed: int = 0,
+    fps: int = DEFAULT_FPS,
+    render: bool = True,
+) -> Dict[str, Any]:
+    """
+    ボットに1セッションをプレイさせる
+
+    ターゲットの乱数・ボットのぶれ・カーソル位置をシードから初期化するため、
+    同じ引数なら直前に何をプレイしたかによらず同じ結果になる。
+
+    Args:
+        game: create_headless_game() で作成した Game
+        sim_time: game のクロックの時刻
+        aimer: プレイするボット（セッション中は仮想デバイスとして接続する）
+        mode: "tracking" / "flicking"
+        seed: 乱数シード
+        fps: シミュレーションのフレームレート
+        render: 描画も行うか（False の場合は更新だけ）
+
+    Returns:
+        スコアと処理時間
+    """
+    random.seed(seed)
+    aimer.reset(seed, mode)
+    game.change_scene(mode)
+    scene = game.current_scene
+    game.cursor.set_position(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2)
+
+    frame_ns = NS_PER_SECOND // fps
+    if mode == "tracking":
+        max_frames = int((scene.session_duration + TRACKING_TIMEOUT_MARGIN) * fps)
+    else:
+        max_frames = int(scene.target_count * FLICKING_TIMEOUT_PER_TARGET * fps)
+
+    input_handler = game.input_handler
+    input_handler.attach_virtual_device(aimer)
+    frames = 0
+    timed_out = False
+    start = time.perf_counter()
+    try:
+        scene.start_session()
+        while scene.session_active:
+            if frames >= max_frames:
+                timed_out = True
+                scene.end_session()
+                break
+            sim_time.advance(frame_ns)
+            game.dt = game.clock.tick(0)
+            game.handle_events()
+            aimer.think(scene, game.cursor, game.dt)
+            game.update()
+            if render:
+                game.draw()
+            else:
+                game.clock.mark_presented()
+            frames += 1
+    finally:
+        input_handler.detach_virtual_device()
+    wall = time.perf_counter() - start
+
+    result: Dict[str, Any] = {
+        "mode": mode, "seed": seed, "fps": fps,
+        "frames": frames, "wall": wall, "timed_out": timed_out,
+    }
+    if mode == "tracking":
+        result["t0_rate"] = scene.result_t0_rate
+    else:
+        reactions = scene.reaction_times
+        result["accuracy"] = scene.hits / scene.target_count * 100 if scene.target_count else 0.0
+        result["mean_reaction_ms"] = sum(reactions) / len(reactions) if reactions else 0.0
+    game.change_scene("launcher")
+    return result
+
+
+def _isolate_storage(root: str) -> None:
+    """
+    保存先を root 以下に切り替える（ワーカープロセス内でのみ使う）
+
+    利用者の履歴・プロファイルを変更せず、並列に動くワーカー同士でも書き込みが衝突しない。
+    """
+    from . import difficulty, profile, session_logger, shot_log, telemetry
+
+    session_logger.DATA_DIR = os.path.join(root, "sessions")
+    shot_log.SHOT_DIR = os.path.join(root, "shots")
+    telemetry.TELEMETRY_DIR = os.path.join(root, "telemetry")
+    profile.DEFAULT_PROFILE_PATH = os.path.join(root, "profile.json")
+    # 較正済みの難易度は使わず、常に固定値のターゲットでプレイする
+    difficulty.DIFFICULTY_PATH = os.path.join(root, "difficulty.json")
+
+    # 初回起動時の画質ベンチマークを行わないよう画質設定を入れておく
+    data = profile.get_default_profile()
+    data["graphics"] = {"preset": DEFAULT_GRAPHICS_PRESET}
+    profile.save_profile(data)
+
+
+def _run_job(job: Tuple[str, BotParams, str, Sequence[int], int, bool, Optional[str]]) -> List[Dict[str, Any]]:
+    """ワーカープロセスで1つのボット・モード・フレームレートの複数セッションを実行"""
+    name, params, mode, seeds, fps, render, render_backend = job
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+    root = tempfile.mkdtemp(prefix="pyaim_bots_")
+    results = []
+    try:
+        _isolate_storage(root)
+        # セッションごとの保存メッセージなどは表示しない
+        with contextlib.redirect_stdout(io.StringIO()):
+            game, sim_time = create_headless_game(render_backend)
+            try:
+                aimer = BotAimer(params)
+                for seed in seeds:
+                    result = run_bot_session(game, sim_time, aimer, mode, seed, fps, render)
+                    result["bot"] = name
+                    results.append(result)
+            finally:
+                game.quit()
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+    return results
+
+
+def run_bots(
+    bots: Dict[str, BotParams],
+    modes: Sequence[str] = BOT_MODES,
+    sessions: int = 4,
+    fps_list: Sequence[int] = (DEFAULT_FPS,),
+    workers: Optional[int] = None,
+    render: bool = True,
+    render_backend: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """
+    ボットをプロセスプールで並列に動かす
+
+    ボット・モード・フレームレートの組ごとに、シード 0 .. sessions-1 のセッションを
+    ワーカー数に合わせて分割して実行する。
+
+    Args:
+        bots: ボット名 → 操作特性
+        modes: プレイするモード
+        sessions: 組ごとのセッション数
+        fps_list: シミュレーションのフレームレート
+        workers: ワーカープロセス数（Noneの場合はCPU数）
+        render: 描画も行うか
+        render_backend: 描画バックエンド（Noneの場合は既定）
+
+    Returns:
+        セッションごとの結果（ボット・モード・フレームレート・シード順）
+    """
+    workers = workers or os.cpu_count() or 1
+    combos = [(name, mode, fps) for name in bots for mode in modes for fps in fps_list]
+    chunks = max(1, min(sessions, math.ceil(workers / max(1, len(combos)))))
+    jobs = []
+    for name, mode, fps in combos:
+        for chunk in range(chunks):
+            seeds = list(range(chunk, sessions, chunks))
+            if seeds:
+                jobs.append((name, bots[name], mode, seeds, fps, render, render_backend))
+
+    results: List[Dict[str, Any]] = []
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+        for job_results in pool.map(_run_job, jobs):
+            results.extend(job_results)
+    order = {key: i for i, key in enumerate(combos)}
+    results.sort(key=lambda r: (order[(r["bot"], r["mode"], r["fps"])], r["seed"]))
+    return results
+
+
+def _mean_and_variance(values: List[float]) -> Tuple[float, float]:
+    """平均と不偏分散"""
+    n = len(values)
+    mean = sum(values) / n
+    if n < 2:
+        return mean, 0.0
+    return mean, sum((v - mean) ** 2 for v in values) / (n - 1)
+
+
+def _group(results: List[Dict[str, Any]]) -> Dict[Tuple[str, str, int], List[Dict[str, Any]]]:
+    """(ボット, モード, フレームレート) ごとにまとめる"""
+    groups: Dict[Tuple[str, str, int], List[Dict[str, Any]]] = {}
+    for result in results:
+        groups.setdefault((result["bot"], result["mode"], result["fps"]), []).append(result)
+    return groups
+
+
+def check_timing_drift(results: List[Dict[str, Any]]) -> List[str]:
+    """
+    フレームレートによるスコアのずれを調べる
+
+    同じボット・モードについて、各フレームレートの平均を最初のフレームレートの平均と比べる。
+    ターゲットの動きはフレームレートで変わるため、許容差は DRIFT_TOLERANCE と
+    平均の差の標準誤差の3倍の大きい方とする。反応時間はフレーム単位で遅れるため、
+    さらにフレーム時間の差 × REACTION_LATENCY_FRAMES を加える。
+
+    Returns:
+        許容差を超えたずれの内容（空ならずれなし）
+    """
+    reference: Dict[Tuple[str, str], Tuple[int, List[Dict[str, Any]]]] = {}
+    failures = []
+    for (name, mode, fps), group in _group(results).items():
+        if (name, mode) not in reference:
+            reference[(name, mode)] = (fps, group)
+            continue
+        base_fps, base = reference[(name, mode)]
+        for key in SCORE_KEYS[mode]:
+            base_mean, base_var = _mean_and_variance([r[key] for r in base])
+            mean, var = _mean_and_variance([r[key] for r in group])
+            stderr = math.sqrt(base_var / len(base) + var / len(group))
+            allowed = max(DRIFT_TOLERANCE[key], 3.0 * stderr)
+            if key == "mean_reaction_ms":
+                allowed += REACTION_LATENCY_FRAMES * abs(1000.0 / base_fps - 1000.0 / fps)
+            if abs(mean - base_mean) > allowed:
+                failures.append(
+                    f"{name}/{mode} {key}: {base_fps}fps {base_mean:.2f} → {fps}fps {mean:.2f}"
+                    f"（許容差 {allowed:.2f}）"
+                )
+    return failures
+
+
+def _baseline_key(result: Dict[str, Any]) -> str:
+    return f"{result['bot']}/{result['mode']}/{result['fps']}/{result['seed']}"
+
+
+def compare_baseline(results: List[Dict[str, Any]], path: str) -> List[str]:
+    """
+    基準値と比べる（基準値のファイルがなければ今回の結果を保存する）
+
+    同じボット・モード・フレームレート・シードのスコアは一致するはずなので、
+    BASELINE_TOLERANCE を超える差はすべて報告する。基準値にないセッションは比べない。
+
+    Returns:
+        一致しなかったスコアの内容（空なら一致）
+    """
+    scores = {
+        _baseline_key(r): {key: r[key] for key in SCORE_KEYS[r["mode"]]} for r in results
+    }
+    if not os.path.exists(path):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(scores, f, indent=2, sort_keys=True)
+        print(f"基準値を保存しました: {path}")
+        return []
+
+    with open(path, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    failures = []
+    for key, values in scores.items():
+        expected = baseline.get(key)
+        if expected is None:
+            continue
+        for name, value in values.items():
+            if name in expected and abs(value - expected[name]) > BASELINE_TOLERANCE:
+                failures.append(f"{key} {name}: 基準値 {expected[name]:.3f} → {value:.3f}")
+    return failures
+
+
+def format_report(results: List[Dict[str, Any]], elapsed: float) -> List[str]:
+    """結果の集計表"""
+    lines = [f"{'bot':<10}{'mode':<10}{'fps':>5}{'n':>4}  {'score':<34}{'frames/s':>10}"]
+    total_frames = 0
+    for (name, mode, fps), group in _group(results).items():
+        frames = sum(r["frames"] for r in group)
+        wall = sum(r["wall"] for r in group)
+        total_frames += frames
+        if mode == "tracking":
+            score = f"T0 {_mean_and_variance([r['t0_rate'] for r in group])[0]:.1f}%"
+        else:
+            accuracy = _mean_and_variance([r["accuracy"] for r in group])[0]
+            reaction = _mean_and_variance([r["mean_reaction_ms"] for r in group])[0]
+            score = f"命中 {accuracy:.1f}%  反応 {reaction:.0f}ms"
+        throughput = frames / wall if wall > 0 else 0.0
+        lines.append(f"{name:<10}{mode:<10}{fps:>5}{len(group):>4}  {score:<34}{throughput:>10.0f}")
+        timeouts = sum(1 for r in group if r["timed_out"])
+        if timeouts:
+            lines.append(f"  打ち切り: {timeouts}セッション")
+    if elapsed > 0:
+        lines.append(
+            f"合計 {len(results)}セッション {total_frames}フレーム / {elapsed:.1f}秒"
+            f"（全ワーカーで {total_frames / elapsed:.0f} フレーム/秒）"
+        )
+    return lines
+
+
+def run_bot_benchmark(
+    bot_names: Optional[Sequence[str]] = None,
+    sessions: int = 4,
+    fps_list: Sequence[int] = (DEFAULT_FPS,),
+    workers: Optional[int] = None,
+    render: bool = True,
+    render_backend: Optional[str] = None,
+    baseline_path: Optional[str] = None,
+) -> bool:
+    """
+    ボットで負荷生成と回帰チェックを行い、結果を表示
+
+    Returns:
+        スコアのずれ・基準値との不一致がなければ True
+    """
+    bots = {name: BOT_PRESETS[name] for name in (bot_names or BOT_PRESETS)}
+    if len(fps_list) > 1 and sessions < DRIFT_MIN_SESSIONS:
+        print(
+            f"フレームレート間の比較のため、セッション数を {sessions} から "
+            f"{DRIFT_MIN_SESSIONS} に増やします"
+        )
+        sessions = DRIFT_MIN_SESSIONS
+    start = time.perf_counter()
+    results = run_bots(bots, BOT_MODES, sessions, fps_list, workers, render, render_backend)
+    elapsed = time.perf_counter() - start
+
+    for line in format_report(results, elapsed):
+        print(line)
+    failures = check_timing_drift(results)
+    if baseline_path:
+        failures += compare_baseline(results, baseline_path)
+    for failure in failures:
+        print(f"スコアのずれ: {failure}")
+    print("スコアの回帰チェック: " + ("NG" if failures else "OK"))
+    return not failures
@@ -0,0 +1,578 @@
+"""
+難易度の較正モジュール（オフライン）
+
+ターゲットの速さ・半径とボット（bots.py の BotAimer と同じ操作モデル）の組を
+格子状に掃引し、各組で多数のセッションをシミュレーションして
+T0率・命中率・反応時間の分布を推定する。基準のボットの予想スコアが
+段階ごとの目標に最も近い組を難易度の段階として data/difficulty.json に書き出す。
+
+シミュレーションはゲームループを使わず、多数のセッションを配列の1要素ずつとして
+フレームごとにまとめて進める（Target.update・TrackingScene・FlickingScene と同じ手順）。
+セッションはまとまりごとにプロセスプールで並列に計算する。
+"""
+
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .bots import (
+    BOT_PRESETS, BotParams, DEFAULT_FPS,
+    AIM_NOISE_TIME_CONSTANT, FITTS_A, FITTS_B, SETTLE_RATIO, CORRECTION_TIMEOUT,
+)
+from .clock import NS_PER_SECOND
+from .difficulty import DIFFICULTY_PATH, TIERS, save_difficulty_tiers
+from .settings import SCREEN_WIDTH, SCREEN_HEIGHT
+
+
+# 掃引する範囲
+TRACKING_SPEEDS = (100.0, 150.0, 200.0, 250.0, 300.0, 350.0, 400.0)
+TRACKING_RADII = (30.0, 40.0, 50.0, 60.0, 70.0)
+FLICKING_RADII = (20.0, 25.0, 30.0, 35.0, 40.0, 45.0, 50.0, 60.0, 70.0)
+
+# シーンの既定値（TrackingScene.session_duration, FlickingScene.target_count）
+TRACKING_DURATION = 30.0
+FLICKING_TARGETS = 10
+
+# Target の出現位置の余白（spawn_random の既定値）と、反射する画面端の余白（半径に加える）
+SPAWN_MARGIN = 100.0
+REFLECT_MARGIN = 50.0
+
+# 従来の固定値（段階が同程度の予想スコアなら、これに近い組を選ぶ）
+DEFAULT_TRACKING = (200.0, 50.0)
+DEFAULT_FLICKING_RADIUS = 40.0
+# 従来の固定値からの離れ具合の重み（速さ・半径の相対差1あたりのスコアの点数）
+TIER_REGULARIZATION = 1.0
+
+# 段階を決める基準のボットと、段階ごとの予想スコアの目標
+# （normal は従来の固定値での基準のボットのスコアに近い）
+REFERENCE_AIMER = "average"
+TRACKING_TIER_T0 = {"easy": 95.0, "normal": 90.0, "hard": 75.0, "expert": 60.0}
+FLICKING_TIER_ACCURACY = {"easy": 99.5, "normal": 97.0, "hard": 90.0, "expert": 75.0}
+
+# 1つのまとまりで同時に進めるセッション数
+BATCH_SESSIONS = 4096
+
+# 分布の要約に使うパーセンタイル
+PERCENTILES = (10, 50, 90)
+
+GRID_FILENAME = "difficulty_grid.npz"
+
+TRACKING_GRID_DTYPE = np.dtype([
+    ("aimer", "U16"),
+    ("speed", "<f4"),
+    ("radius", "<f4"),
+    ("sessions", "<u4"),
+    ("t0_mean", "<f4"),
+    ("t0_std", "<f4"),
+    ("t0_p10", "<f4"),
+    ("t0_p50", "<f4"),
+    ("t0_p90", "<f4"),
+])
+
+FLICKING_GRID_DTYPE = np.dtype([
+    ("aimer", "U16"),
+    ("radius", "<f4"),
+    ("sessions", "<u4"),
+    ("accuracy_mean", "<f4"),
+    ("accuracy_std", "<f4"),
+    ("accuracy_p10", "<f4"),
+    ("accuracy_p50", "<f4"),
+    ("accuracy_p90", "<f4"),
+    ("reaction_mean", "<f4"),
+    ("reaction_p10", "<f4"),
+    ("reaction_p50", "<f4"),
+    ("reaction_p90", "<f4"),
+])
+
+# フリックの段階（bots.py と同じ）
+_IDLE, _BALLISTIC, _CORRECT = 0, 1, 2
+
+
+def _frame_time(fps: int) -> float:
+    """シミュレーションのフレーム時間（秒、SimulatedTime と同じ整数ナノ秒の刻み）"""
+    return (NS_PER_SECOND // fps) / NS_PER_SECOND
+
+
+def _delay_frames(delay: np.ndarray, dt: float) -> np.ndarray:
+    """知覚の遅れのフレーム数（BotAimer が reaction_delay 秒前以前の最新の状態を見るのと同じ）"""
+    return np.ceil(delay / dt - 1e-9).astype(np.int64)
+
+
+def _aim_noise(rng: np.random.Generator, offset: np.ndarray, decay: float, scale: np.ndarray) -> None:
+    """照準のぶれを1フレーム進める（BotAimer._update_noise と同じ離散化、offset は (2, N)）"""
+    offset *= decay
+    offset += scale * rng.standard_normal(offset.shape)
+
+
+def simulate_tracking(
+    speed: np.ndarray,
+    radius: np.ndarray,
+    params: np.ndarray,
+    seed: int,
+    fps: int = DEFAULT_FPS,
+    duration: float = TRACKING_DURATION,
+) -> np.ndarray:
+    """
+    Tracking のセッションをまとめてシミュレーション
+
+    Args:
+        speed: セッションごとのターゲットの基本速度（Target.base_speed）
+        radius: セッションごとのターゲット半径
+        params: セッションごとのボットの操作特性（(N, 4)、BotParams の並び）
+        seed: 乱数シード
+        fps: シミュレーションのフレームレート
+        duration: セッション時間（秒）
+
+    Returns:
+        セッションごとのT0率（%）
+    """
+    rng = np.random.default_rng(seed)
+    n = len(speed)
+    dt = _frame_time(fps)
+    frame_ns = NS_PER_SECOND // fps
+    frames = -(-int(duration * NS_PER_SECOND) // frame_ns)
+    width, height = float(SCREEN_WIDTH), float(SCREEN_HEIGHT)
+    index = np.arange(n)
+
+    delay, gain, noise, overshoot = (params[:, i] for i in range(4))
+    lag = _delay_frames(delay, dt)
+    follow = 1.0 - np.exp(-gain * dt)
+    lead = 1.0 + overshoot
+    decay = math.exp(-dt / AIM_NOISE_TIME_CONSTANT)
+    noise_scale = noise * math.sqrt(1.0 - decay * decay)
+    margin = radius + REFLECT_MARGIN
+
+    # ターゲット（spawn_random → reset_motion → set_random_velocity）
+    x = rng.uniform(SPAWN_MARGIN, width - SPAWN_MARGIN, n)
+    y = rng.uniform(SPAWN_MARGIN, height - SPAWN_MARGIN, n)
+    turn_timer = np.zeros(n)
+    turn_interval = rng.uniform(1.5, 3.0, n)
+    speed_timer = np.zeros(n)
+    speed_interval = rng.uniform(0.5, 1.5, n)
+    angle = rng.uniform(0.0, 2.0 * math.pi, n)
+    vx = np.cos(angle) * speed
+    vy = np.sin(angle) * speed
+
+    # カーソルとボット
+    cx = np.full(n, width / 2)
+    cy = np.full(n, height / 2)
+    offset = np.zeros((2, n))
+    history_len = int(lag.max()) + 1
+    history = np.zeros((4, history_len, n))
+    on_time = np.zeros(n)
+
+    for frame in range(1, frames + 1):
+        # ボット: 遅れて見えるターゲットを先読みして追従
+        _aim_noise(rng, offset, decay, noise_scale)
+        slot = frame % history_len
+        history[0, slot] = x
+        history[1, slot] = y
+        history[2, slot] = vx
+        history[3, slot] = vy
+        seen = frame - lag
+        visible = seen >= 1
+        seen_slot = seen % history_len
+        sx, sy, svx, svy = (history[i, seen_slot, index] for i in range(4))
+        dx = (sx + svx * delay + offset[0] - cx) * follow + svx * lead * dt
+        dy = (sy + svy * delay + offset[1] - cy) * follow + svy * lead * dt
+        cx = np.clip(np.where(visible, cx + dx, cx), 0.0, width)
+        cy = np.clip(np.where(visible, cy + dy, cy), 0.0, height)
+
+        # ターゲット: 方向転換
+        turn_timer += dt
+        turning = np.flatnonzero(turn_timer >= turn_interval)
+        if len(turning):
+            turn_timer[turning] = 0.0
+            turn_interval[turning] = rng.uniform(1.5, 3.5, len(turning))
+            change = rng.uniform(math.pi / 4, 3 * math.pi / 4, len(turning))
+            change = np.where(rng.random(len(turning)) < 0.5, -change, change)
+            new_angle = np.arctan2(vy[turning], vx[turning]) + change
+            current = np.hypot(vx[turning], vy[turning])
+            vx[turning] = np.cos(new_angle) * current
+            vy[turning] = np.sin(new_angle) * current
+
+        # ターゲット: 速度変化（基本速度の70%〜130%）
+        speed_timer += dt
+        varying = np.flatnonzero(speed_timer >= speed_interval)
+        if len(varying):
+            speed_timer[varying] = 0.0
+            speed_interval[varying] = rng.uniform(0.5, 1.5, len(varying))
+            target_speed = speed[varying] * rng.uniform(0.7, 1.3, len(varying))
+            current = np.hypot(vx[varying], vy[varying])
+            scale = np.divide(target_speed, current, out=np.ones_like(current), where=current > 0)
+            vx[varying] *= scale
+            vy[varying] *= scale
+
+        # ターゲット: 移動と画面端での反射
+        x += vx * dt
+        y += vy * dt
+        for pos, vel, limit in ((x, vx, width), (y, vy, height)):
+            outside = np.flatnonzero((pos < margin) | (pos > limit - margin))
+            if len(outside):
+                vel[outside] *= -1
+                pos[outside] = np.clip(pos[outside], margin[outside], limit - margin[outside])
+                turn_timer[outside] = 0.0
+                turn_interval[outside] = rng.uniform(1.0, 2.5, len(outside))
+
+        # T0計測
+        on_time += np.where(np.hypot(x - cx, y - cy) <= radius, dt, 0.0)
+
+    return on_time / (frames * dt) * 100.0
+
+
+def simulate_flicking(
+    radius: np.ndarray,
+    params: np.ndarray,
+    seed: int,
+    fps: int = DEFAULT_FPS,
+    targets: int = FLICKING_TARGETS,
+    max_seconds_per_target: float = 5.0,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Flicking のセッションをまとめてシミュレーション
+
+    Args:
+        radius: セッションごとのターゲット半径
+        params: セッションごとのボットの操作特性（(N, 4)、BotParams の並び）
+        seed: 乱数シード
+        fps: シミュレーションのフレームレート
+        targets: 1セッションのターゲット数
+        max_seconds_per_target: 打ち切るまでのシミュレーション時間（1ターゲットあたり）
+
+    Returns:
+        (セッションごとの命中率（%）, ヒットの平均反応時間（ミリ秒、ヒットなしは0）)
+    """
+    rng = np.random.default_rng(seed)
+    n = len(radius)
+    dt = _frame_time(fps)
+    width, height = float(SCREEN_WIDTH), float(SCREEN_HEIGHT)
+    index = np.arange(n)
+
+    delay, gain, noise, overshoot = (params[:, i] for i in range(4))
+    lag = _delay_frames(delay, dt)
+    follow = 1.0 - np.exp(-gain * dt)
+    decay = math.exp(-dt / AIM_NOISE_TIME_CONSTANT)
+    noise_scale = noise * math.sqrt(1.0 - decay * decay)
+    settle = radius * SETTLE_RATIO
+
+    # ターゲット（最初のターゲットは1フレーム目に表示される）
+    tx = rng.uniform(SPAWN_MARGIN, width - SPAWN_MARGIN, n)
+    ty = rng.uniform(SPAWN_MARGIN, height - SPAWN_MARGIN, n)
+    current = np.ones(n, dtype=np.int64)
+    spawn_frame = np.ones(n, dtype=np.int64)
+    hits = np.zeros(n, dtype=np.int64)
+    reaction_sum = np.zeros(n)
+    active = np.ones(n, dtype=bool)
+
+    # カーソルとボット
+    cx = np.full(n, width / 2)
+    cy = np.full(n, height / 2)
+    offset = np.zeros((2, n))
+    history_len = int(lag.max()) + 1
+    history = np.zeros((3, history_len, n))
+    phase = np.full(n, _IDLE)
+    phase_time = np.zeros(n)
+    flick_index = np.zeros(n, dtype=np.int64)
+    start_x = np.zeros(n)
+    start_y = np.zeros(n)
+    end_x = np.zeros(n)
+    end_y = np.zeros(n)
+    flick_duration = np.ones(n)
+
+    max_frames = int(targets * max_seconds_per_target / dt)
+    for frame in range(1, max_frames + 1):
+        if not active.any():
+            break
+        _aim_noise(rng, offset, decay, noise_scale)
+        slot = frame % history_len
+        history[0, slot] = tx
+        history[1, slot] = ty
+        history[2, slot] = current
+        seen = frame - lag
+        visible = active & (seen >= 1)
+        seen_slot = seen % history_len
+        sx, sy = history[0, seen_slot, index], history[1, seen_slot, index]
+        seen_index = history[2, seen_slot, index].astype(np.int64)
+        aim_x = sx + offset[0]
+        aim_y = sy + offset[1]
+
+        # 新しいターゲットが見えたらフリック開始
+        new = visible & (seen_index != flick_index)
+        if new.any():
+            flick_index[new] = seen_index[new]
+            phase[new] = _BALLISTIC
+            phase_time[new] = 0.0
+            start_x[new] = cx[new]
+            start_y[new] = cy[new]
+            scale = 1.0 + overshoot[new]
+            end_x[new] = cx[new] + (aim_x[new] - cx[new]) * scale
+            end_y[new] = cy[new] + (aim_y[new] - cy[new]) * scale
+            distance = np.hypot(sx[new] - cx[new], sy[new] - cy[new])
+            flick_duration[new] = FITTS_A + FITTS_B * np.log2(distance / (2.0 * radius[new]) + 1.0)
+
+        moving = visible & (phase != _IDLE)
+        phase_time[moving] += dt
+        ballistic = moving & (phase == _BALLISTIC)
+        correcting = moving & (phase == _CORRECT)
+
+        # 修正: ずれを詰めて、合ったらクリック（判定は移動前の位置）
+        settled = np.hypot(aim_x - cx, aim_y - cy) <= settle
+        click = correcting & (settled | (phase_time >= CORRECTION_TIMEOUT))
+        new_x = np.where(correcting, cx + (aim_x - cx) * follow, cx)
+        new_y = np.where(correcting, cy + (aim_y - cy) * follow, cy)
+        phase[click] = _IDLE
+
+        # 躍度最小軌道のフリック
+        progress = np.minimum(1.0, phase_time / flick_duration)
+        s = progress ** 3 * (10.0 - 15.0 * progress + 6.0 * progress ** 2)
+        new_x = np.where(ballistic, start_x + (end_x - start_x) * s, new_x)
+        new_y = np.where(ballistic, start_y + (end_y - start_y) * s, new_y)
+        landed = ballistic & (progress >= 1.0)
+        phase[landed] = _CORRECT
+        phase_time[landed] = 0.0
+
+        cx = np.clip(new_x, 0.0, width)
+        cy = np.clip(new_y, 0.0, height)
+
+        # シーン: クリック判定と次のターゲット
+        clicked = np.flatnonzero(click)
+        if len(clicked):
+            hit = np.hypot(tx[clicked] - cx[clicked], ty[clicked] - cy[clicked]) <= radius[clicked]
+            hits[clicked] += hit
+            reaction_sum[clicked] += np.where(hit, (frame - spawn_frame[clicked]) * dt * 1000.0, 0.0)
+            current[clicked] += 1
+            finished = current[clicked] > targets
+            active[clicked[finished]] = False
+            respawn = clicked[~finished]
+            tx[respawn] = rng.uniform(SPAWN_MARGIN, width - SPAWN_MARGIN, len(respawn))
+            ty[respawn] = rng.uniform(SPAWN_MARGIN, height - SPAWN_MARGIN, len(respawn))
+            spawn_frame[respawn] = frame
+
+    accuracy = hits / targets * 100.0
+    reaction = np.divide(reaction_sum, hits, out=np.zeros(n), where=hits > 0)
+    return accuracy, reaction
+
+
+def _run_batch(job: Tuple[str, np.ndarray, np.ndarray, np.ndarray, int, int]) -> Tuple[np.ndarray, ...]:
+    """ワーカープロセスで1つのまとまりをシミュレーション"""
+    mode, speed, radius, params, seed, fps = job
+    if mode == "tracking":
+        return (simulate_tracking(speed, radius, params, seed, fps),)
+    return simulate_flicking(radius, params, seed, fps)
+
+
+def _summary(values: np.ndarray) -> Dict[str, float]:
+    """分布の要約（平均とパーセンタイル）"""
+    summary = {"mean": round(float(values.mean()), 2)}
+    for p, value in zip(PERCENTILES, np.percentile(values, PERCENTILES)):
+        summary[f"p{p}"] = round(float(value), 2)
+    return summary
+
+
+class CalibrationSweep:
+    """
+    難易度の掃引
+
+    格子の各組 × sessions のセッションを1列に並べ、BATCH_SESSIONS ずつに分けて
+    プロセスプールでシミュレーションする。
+    """
+
+    def __init__(
+        self,
+        aimers: Optional[Dict[str, BotParams]] = None,
+        sessions: int = 200,
+        fps: int = DEFAULT_FPS,
+        workers: Optional[int] = None,
+        seed: int = 0,
+    ):
+        """
+        Args:
+            aimers: ボット名 → 操作特性（Noneの場合は BOT_PRESETS）
+            sessions: 格子の組ごとのセッション数
+            fps: シミュレーションのフレームレート
+            workers: ワーカープロセス数（Noneの場合はCPU数）
+            seed: 乱数シード（まとまりごとのシードはここから派生させる）
+        """
+        self.aimers = dict(aimers or BOT_PRESETS)
+        self.sessions = sessions
+        self.fps = fps
+        self.workers = workers or os.cpu_count() or 1
+        self.seed = seed
+        self.tracking_grid: Optional[np.ndarray] = None
+        self.flicking_grid: Optional[np.ndarray] = None
+        self._flicking_samples: Optional[tuple] = None
+        self.simulated = 0
+
+    def _simulate(self, mode: str, cells: List[Tuple[float, float, str]]) -> List[np.ndarray]:
+        """組ごとに sessions 回シミュレーションし、結果を (組の数, sessions) で返す"""
+        repeat = self.sessions
+        speed = np.repeat([cell[0] for cell in cells], repeat).astype(np.float64)
+        radius = np.repeat([cell[1] for cell in cells], repeat).astype(np.float64)
+        params = np.repeat(np.array([self.aimers[cell[2]] for cell in cells], dtype=np.float64), repeat, axis=0)
+
+        total = len(speed)
+        starts = range(0, total, BATCH_SESSIONS)
+        seeds = np.random.SeedSequence([self.seed, len(mode)]).generate_state(len(starts))
+        jobs = [
+            (mode, speed[i:i + BATCH_SESSIONS], radius[i:i + BATCH_SESSIONS],
+             params[i:i + BATCH_SESSIONS], int(batch_seed), self.fps)
+            for i, batch_seed in zip(starts, seeds)
+        ]
+        with ProcessPoolExecutor(max_workers=min(self.workers, len(jobs))) as pool:
+            parts = list(pool.map(_run_batch, jobs))
+        self.simulated += total
+        return [np.concatenate(column).reshape(len(cells), repeat) for column in zip(*parts)]
+
+    def run_tracking(
+        self,
+        speeds: Sequence[float] = TRACKING_SPEEDS,
+        radii: Sequence[float] = TRACKING_RADII,
+    ) -> np.ndarray:
+        """Tracking の掃引（TRACKING_GRID_DTYPE の表を返す）"""
+        cells = [(s, r, name) for name in self.aimers for s in speeds for r in radii]
+        (t0,) = self._simulate("tracking", cells)
+        grid = np.zeros(len(cells), dtype=TRACKING_GRID_DTYPE)
+        for i, (s, r, name) in enumerate(cells):
+            p10, p50, p90 = np.percentile(t0[i], PERCENTILES)
+            grid[i] = (name, s, r, self.sessions, t0[i].mean(), t0[i].std(), p10, p50, p90)
+        self.tracking_grid = grid
+        return grid
+
+    def run_flicking(self, radii: Sequence[float] = FLICKING_RADII) -> np.ndarray:
+        """Flicking の掃引（FLICKING_GRID_DTYPE の表を返す）"""
+        cells = [(0.0, r, name) for name in self.aimers for r in radii]
+        accuracy, reaction = self._simulate("flicking", cells)
+        grid = np.zeros(len(cells), dtype=FLICKING_GRID_DTYPE)
+        for i, (_, r, name) in enumerate(cells):
+            a10, a50, a90 = np.percentile(accuracy[i], PERCENTILES)
+            r10, r50, r90 = np.percentile(reaction[i], PERCENTILES)
+            grid[i] = (
+                name, r, self.sessions,
+                accuracy[i].mean(), accuracy[i].std(), a10, a50, a90,
+                reaction[i].mean(), r10, r50, r90,
+            )
+        self.flicking_grid = grid
+        self._flicking_samples = (cells, accuracy, reaction)
+        return grid
+
+    def fit_tiers(self, reference: str = REFERENCE_AIMER) -> Dict[str, Any]:
+        """
+        段階ごとに、基準のボットの平均スコアが目標に最も近い組を選ぶ
+
+        スコアの差が同程度なら従来の固定値に近い組を優先する。
+
+        Returns:
+            difficulty.json の内容
+        """
+        tiers: Dict[str, Any] = {"tracking": {}, "flicking": {}}
+        grid = self.tracking_grid
+        if grid is not None:
+            ref = grid[grid["aimer"] == reference]
+            default_speed, default_radius = DEFAULT_TRACKING
+            distance = (
+                np.abs(ref["speed"] - default_speed) / default_speed
+                + np.abs(ref["radius"] - default_radius) / default_radius
+            )
+            for name in TIERS:
+                cost = np.abs(ref["t0_mean"] - TRACKING_TIER_T0[name]) + TIER_REGULARIZATION * distance
+                best = ref[int(np.argmin(cost))]
+                cell = grid[(grid["speed"] == best["speed"]) & (grid["radius"] == best["radius"])]
+                tiers["tracking"][name] = {
+                    "speed": float(best["speed"]),
+                    "radius": float(best["radius"]),
+                    "expected": {
+                        str(row["aimer"]): {
+                            "t0_rate": {
+                                "mean": round(float(row["t0_mean"]), 2),
+                                **{f"p{p}": round(float(row[f"t0_p{p}"]), 2) for p in PERCENTILES},
+                            }
+                        }
+                        for row in cell
+                    },
+                }
+
+        grid = self.flicking_grid
+        if grid is not None:
+            ref = grid[grid["aimer"] == reference]
+            distance = np.abs(ref["radius"] - DEFAULT_FLICKING_RADIUS) / DEFAULT_FLICKING_RADIUS
+            cells, accuracy, reaction = self._flicking_samples
+            for name in TIERS:
+                cost = np.abs(ref["accuracy_mean"] - FLICKING_TIER_ACCURACY[name]) + TIER_REGULARIZATION * distance
+                radius = float(ref["radius"][int(np.argmin(cost))])
+                expected = {}
+                for i, (_, r, aimer) in enumerate(cells):
+                    if r == radius:
+                        hit = reaction[i][accuracy[i] > 0]
+                        expected[aimer] = {
+                            "accuracy": _summary(accuracy[i]),
+                            "reaction_ms": _summary(hit) if len(hit) else {},
+                        }
+                tiers["flicking"][name] = {"radius": radius, "expected": expected}
+
+        return {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "reference_aimer": reference,
+            "sessions_per_cell": self.sessions,
+            "fps": self.fps,
+            **tiers,
+        }
+
+    def save_grid(self, path: Optional[str] = None) -> str:
+        """掃引の結果の表を保存（difficulty.json と同じフォルダ）"""
+        if path is None:
+            path = os.path.join(os.path.dirname(DIFFICULTY_PATH), GRID_FILENAME)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        arrays = {}
+        if self.tracking_grid is not None:
+            arrays["tracking"] = self.tracking_grid
+        if self.flicking_grid is not None:
+            arrays["flicking"] = self.flicking_grid
+        np.savez(path, **arrays)
+        return path
+
+
+def run_calibration(
+    sessions: int = 200,
+    workers: Optional[int] = None,
+    fps: int = DEFAULT_FPS,
+    seed: int = 0,
+) -> bool:
+    """
+    掃引して難易度の段階を保存し、結果を表示
+
+    Returns:
+        保存できたら True
+    """
+    sweep = CalibrationSweep(sessions=sessions, fps=fps, workers=workers, seed=seed)
+    start = time.perf_counter()
+    sweep.run_tracking()
+    sweep.run_flicking()
+    elapsed = time.perf_counter() - start
+    data = sweep.fit_tiers()
+
+    print(f"{sweep.simulated}セッションを{elapsed:.1f}秒でシミュレーションしました"
+          f"（{sweep.simulated / elapsed:.0f} セッション/秒）")
+    print(f"基準のボット: {REFERENCE_AIMER}")
+    for name in TIERS:
+        tracking = data["tracking"][name]
+        flicking = data["flicking"][name]
+        t0 = tracking["expected"][REFERENCE_AIMER]["t0_rate"]
+        accuracy = flicking["expected"][REFERENCE_AIMER]["accuracy"]
+        print(
+            f"{name:<8} Tracking 速さ{tracking['speed']:>5.0f} 半径{tracking['radius']:>3.0f}"
+            f" T0 {t0['mean']:5.1f}% ({t0['p10']:.0f}-{t0['p90']:.0f})"
+            f"   Flicking 半径{flicking['radius']:>3.0f}"
+            f" 命中 {accuracy['mean']:5.1f}% ({accuracy['p10']:.0f}-{accuracy['p90']:.0f})"
+        )
+
+    grid_path = sweep.save_grid()
+    print(f"掃引の結果: {grid_path}")
+    if not save_difficulty_tiers(data):
+        return False
+    print(f"難易度の段階: {DIFFICULTY_PATH}")
+    return True
@@ -0,0 +1,327 @@
+"""
+テレメトリのカタログ（全セッションの索引）モジュール
+
+セッションごとのテレメトリファイル（data/telemetry/<mode>/*.npy）について、
+モード・記録時刻・長さ・フレーム数・ファイル内のデータ開始位置を
+1つの索引ファイル（data/telemetry/catalog.npy）にまとめる。
+
+検索は索引だけで行い、結果のフレーム列は各ファイルのデータ部分を
+直接メモリマップしたビューとして返す（コピーしない・必要になるまで開かない）。
+索引は読み込み時にファイルの一覧・サイズ・更新時刻と照合し、
+追加・変更されたファイルのヘッダーだけを読んで更新する。
+セッション終了時は保存したファイル1つ分だけを索引に追加する（一覧は照合しない）。
+
+セッションIDはセッション履歴CSVの timestamp と同じ時刻なので、
+CSVの行（難易度など）とテレメトリを対応付けられる。
+"""
+
+import os
+import tempfile
+from datetime import datetime
+from typing import Dict, Iterator, Optional, Tuple
+
+import numpy as np
+from numpy.lib import format as npy_format
+
+from . import telemetry
+from .telemetry import FILENAME_FORMAT, FRAME_DTYPE
+
+
+CATALOG_FILENAME = "catalog.npy"
+
+# 索引の対象モード（保存値はこの並びの番号）
+MODES = ("tracking", "flicking")
+
+# 1セッション分の索引
+CATALOG_DTYPE = np.dtype([
+    ("session", "<i8"),       # セッションID（CSVの timestamp と同じ時刻、UNIX時間のマイクロ秒）
+    ("mode", "u1"),           # MODES の番号
+    ("duration", "<f4"),      # 記録の長さ（秒、最終フレームの時刻）
+    ("samples", "<u4"),       # フレーム数
+    ("file", "U48"),          # TELEMETRY_DIR からの相対パス
+    ("data_offset", "<u8"),   # ファイル内のフレームデータの開始位置（バイト）
+    ("file_size", "<u8"),     # 索引作成時のファイルサイズ（変更の検出用）
+    ("mtime_ns", "<i8"),      # 索引作成時の更新時刻（変更の検出用）
+])
+
+
+def get_catalog_path() -> str:
+    """索引ファイルのパス"""
+    os.makedirs(telemetry.TELEMETRY_DIR, exist_ok=True)
+    return os.path.join(telemetry.TELEMETRY_DIR, CATALOG_FILENAME)
+
+
+def _session_id(filename: str) -> int:
+    """ファイル名の記録時刻をセッションIDに変換（形式が違う場合は0）"""
+    stem = os.path.splitext(filename)[0]
+    try:
+        recorded = datetime.strptime(stem, FILENAME_FORMAT)
+    except ValueError:
+        return 0
+    return int(np.datetime64(recorded, "us").astype(np.int64))
+
+
+def _read_entry(mode: str, filename: str, stat: os.stat_result) -> Optional[tuple]:
+    """
+    テレメトリファイルのヘッダーと最終フレームから索引を作成
+
+    Returns:
+        CATALOG_DTYPE の1件分（フレーム形式が違う・壊れている場合はNone）
+    """
+    path = os.path.join(telemetry.TELEMETRY_DIR, mode, filename)
+    try:
+        with open(path, "rb") as f:
+            version = npy_format.read_magic(f)
+            if version == (1, 0):
+                shape, fortran_order, dtype = npy_format.read_array_header_1_0(f)
+            else:
+                shape, fortran_order, dtype = npy_format.read_array_header_2_0(f)
+            data_offset = f.tell()
+    except Exception as e:
+        print(f"テレメトリの索引作成エラー: {path}: {e}")
+        return None
+    if dtype != FRAME_DTYPE or fortran_order or len(shape) != 1:
+        return None
+
+    samples = shape[0]
+    if data_offset + samples * FRAME_DTYPE.itemsize > stat.st_size:
+        return None
+    duration = 0.0
+    if samples:
+        last = np.memmap(path, dtype=FRAME_DTYPE, mode="r", offset=data_offset, shape=(samples,))
+        duration = float(last["t"][-1])
+        del last
+
+    return (
+        _session_id(filename), MODES.index(mode), duration, samples,
+        f"{mode}/{filename}", data_offset, stat.st_size, stat.st_mtime_ns,
+    )
+
+
+def _load_saved_entries() -> np.ndarray:
+    """保存済みの索引（ない・形式が違う場合は空）"""
+    path = get_catalog_path()
+    if os.path.exists(path):
+        try:
+            entries = np.load(path)
+            if entries.dtype == CATALOG_DTYPE:
+                return entries
+        except Exception as e:
+            print(f"カタログ読み込みエラー: {e}")
+    return np.zeros(0, dtype=CATALOG_DTYPE)
+
+
+def _save_entries(entries: np.ndarray) -> None:
+    """索引を一時ファイル経由で置き換え保存"""
+    path = get_catalog_path()
+    fd, temp_path = tempfile.mkstemp(prefix=".catalog_", suffix=".npy", dir=os.path.dirname(path))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.save(f, entries)
+        os.replace(temp_path, path)
+    except Exception as e:
+        print(f"カタログ保存エラー: {e}")
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def _sort_entries(entries: np.ndarray) -> np.ndarray:
+    """索引を記録時刻順に並べる"""
+    return entries[np.lexsort((entries["file"], entries["session"]))]
+
+
+def add_catalog_entry(mode: str, filename: str) -> None:
+    """
+    保存したばかりのテレメトリファイル1つを索引に追加
+
+    セッション終了時にゲームのスレッドから呼ぶため、他のファイルの一覧・照合は行わない
+    （索引にないファイルは次の refresh_catalog() で追加される）。
+    """
+    path = os.path.join(telemetry.TELEMETRY_DIR, mode, filename)
+    try:
+        stat = os.stat(path)
+    except OSError as e:
+        print(f"テレメトリの索引作成エラー: {path}: {e}")
+        return
+    row = _read_entry(mode, filename, stat)
+    if row is None:
+        return
+
+    saved = _load_saved_entries()
+    saved = saved[saved["file"] != f"{mode}/{filename}"]
+    _save_entries(_sort_entries(np.concatenate((saved, np.array([row], dtype=CATALOG_DTYPE)))))
+
+
+def refresh_catalog() -> np.ndarray:
+    """
+    ファイルの一覧と照合して索引を更新
+
+    サイズ・更新時刻が索引と同じファイルは読まない。
+
+    Returns:
+        記録時刻順の索引
+    """
+    saved = _load_saved_entries()
+    known: Dict[str, np.void] = {str(entry["file"]): entry for entry in saved}
+
+    rows = []
+    changed = False
+    for mode in MODES:
+        mode_dir = os.path.join(telemetry.TELEMETRY_DIR, mode)
+        if not os.path.isdir(mode_dir):
+            continue
+        for item in os.scandir(mode_dir):
+            if not item.name.endswith(".npy") or not item.is_file():
+                continue
+            stat = item.stat()
+            name = f"{mode}/{item.name}"
+            entry = known.pop(name, None)
+            if entry is not None and entry["file_size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+                rows.append(entry.item())
+                continue
+            changed = True
+            row = _read_entry(mode, item.name, stat)
+            if row is not None:
+                rows.append(row)
+
+    # 削除されたファイル
+    if known:
+        changed = True
+
+    entries = _sort_entries(np.array(rows, dtype=CATALOG_DTYPE))
+    if changed:
+        _save_entries(entries)
+    return entries
+
+
+class FrameSet:
+    """
+    カタログの検索結果
+
+    複数セッションのフレーム列を、セッションごとのメモリマップのビューとして扱う。
+    ファイルは各セッションのフレームを参照したときに開く。
+    """
+
+    def __init__(self, entries: np.ndarray):
+        """
+        Args:
+            entries: CATALOG_DTYPE の索引（記録時刻順）
+        """
+        self.entries = entries
+        # セッション i のフレームは全体の offsets[i]:offsets[i + 1]
+        self.offsets = np.concatenate(([0], np.cumsum(entries["samples"], dtype=np.int64)))
+
+    def __len__(self) -> int:
+        """セッション数"""
+        return len(self.entries)
+
+    @property
+    def samples(self) -> int:
+        """全セッションの合計フレーム数"""
+        return int(self.offsets[-1])
+
+    @property
+    def duration(self) -> float:
+        """全セッションの合計時間（秒）"""
+        return float(self.entries["duration"].sum(dtype=np.float64))
+
+    def path(self, index: int) -> str:
+        """index 番目のセッションのファイルパス"""
+        return os.path.join(telemetry.TELEMETRY_DIR, *str(self.entries["file"][index]).split("/"))
+
+    def frames(self, index: int) -> np.ndarray:
+        """index 番目のセッションのフレーム列（メモリマップ）"""
+        entry = self.entries[index]
+        samples = int(entry["samples"])
+        if samples == 0:
+            return np.zeros(0, dtype=FRAME_DTYPE)
+        return np.memmap(
+            self.path(index), dtype=FRAME_DTYPE, mode="r",
+            offset=int(entry["data_offset"]), shape=(samples,),
+        )
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        """各セッションのフレーム列を順に開く（前のセッションのマップは参照が切れると解放される）"""
+        for index in range(len(self.entries)):
+            yield self.frames(index)
+
+    def items(self) -> Iterator[Tuple[np.void, np.ndarray]]:
+        """(索引, フレーム列) を順に返す"""
+        for index in range(len(self.entries)):
+            yield self.entries[index], self.frames(index)
+
+    def locate(self, sample: int) -> Tuple[int, int]:
+        """
+        全体での通し番号をセッション内の位置に変換
+
+        Returns:
+            (セッションの番号, セッション内のフレーム番号)
+        """
+        if not 0 <= sample < self.samples:
+            raise IndexError(f"フレーム番号が範囲外です: {sample}")
+        index = int(np.searchsorted(self.offsets, sample, side="right")) - 1
+        return index, sample - int(self.offsets[index])
+
+    def iter_range(self, start: int, stop: int) -> Iterator[np.ndarray]:
+        """全体での通し番号 [start, stop) のフレームをセッションごとのビューとして返す"""
+        start = max(0, start)
+        stop = min(stop, self.samples)
+        if start >= stop:
+            return
+        first = int(np.searchsorted(self.offsets, start, side="right")) - 1
+        for index in range(first, len(self.entries)):
+            begin = int(self.offsets[index])
+            if begin >= stop:
+                break
+            frames = self.frames(index)
+            yield frames[max(0, start - begin):stop - begin]
+
+
+class TelemetryCatalog:
+    """全セッションのテレメトリ索引"""
+
+    def __init__(self, entries: Optional[np.ndarray] = None):
+        """
+        Args:
+            entries: 索引（Noneの場合はファイルと照合して読み込む）
+        """
+        self.entries = refresh_catalog() if entries is None else entries
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def query(
+        self,
+        mode: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        sessions: Optional[np.ndarray] = None,
+    ) -> FrameSet:
+        """
+        条件に合うセッションを検索
+
+        Args:
+            mode: "tracking" / "flicking"（Noneの場合は全モード）
+            since: この時刻以降に記録したセッション
+            until: この時刻より前に記録したセッション
+            sessions: このセッションIDのセッションだけ（CSVの timestamp をマイクロ秒にした値）
+        """
+        mask = np.ones(len(self.entries), dtype=bool)
+        if mode is not None:
+            mask &= self.entries["mode"] == MODES.index(mode)
+        if since is not None:
+            mask &= self.entries["session"] >= np.datetime64(since, "us").astype(np.int64)
+        if until is not None:
+            mask &= self.entries["session"] < np.datetime64(until, "us").astype(np.int64)
+        if sessions is not None:
+            mask &= np.isin(self.entries["session"], sessions)
+        return FrameSet(self.entries[mask])
+
+    def recorded_at(self, index: int) -> datetime:
+        """index 番目のセッションの記録時刻"""
+        return np.datetime64(int(self.entries["session"][index]), "us").astype(datetime)
+
+
+def load_catalog() -> TelemetryCatalog:
+    """ファイルと照合した最新の索引を読み込み"""
+    return TelemetryCatalog()
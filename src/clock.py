@@ -0,0 +1,133 @@
+"""
+高分解能クロックモジュール
+
+time.perf_counter_ns による単調増加クロックで、フレームの表示時刻と
+入力イベントの到着時刻を記録する。時刻はすべて整数ナノ秒で扱い、
+壁時計（time.time）の調整の影響を受けない。
+
+- フレーム待ちの間もイベントキューを細かく取り出し、到着時刻を
+  イベントの timestamp_ns 属性として記録する
+- 待ち時間のないフレームに備え、ゲームループは更新の後と present の前後でも
+  poll_events() を呼ぶ（記録の精度はこれらの取り出し間隔で決まるため、
+  更新・描画が重いほど粗くなる）
+- present の直後に mark_presented() を呼ぶと、そのフレームの表示時刻が記録される
+  （ターゲットの出現時刻は「出現したフレームが表示された時刻」を使う）
+
+テストや再生ではコンストラクタに時刻関数を渡して差し替えられる。
+"""
+
+import time
+from typing import Callable, List, Optional
+
+import pygame
+
+
+NS_PER_SECOND = 1_000_000_000
+NS_PER_MS = 1_000_000
+
+# フレーム待ち中にイベントを取り出す間隔（ナノ秒）
+EVENT_POLL_INTERVAL_NS = 1_000_000
+
+# 表示時刻を保持するフレーム数
+PRESENT_HISTORY = 8
+
+
+class FrameClock:
+    """フレームの表示時刻とイベント到着時刻を記録するクロック"""
+
+    def __init__(
+        self,
+        time_source: Callable[[], int] = time.perf_counter_ns,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Args:
+            time_source: 現在時刻（ナノ秒、単調増加）を返す関数
+            sleep: 指定秒数待つ関数
+        """
+        self._time_source = time_source
+        self._sleep = sleep
+
+        self._frame_start_ns = time_source()
+        # 表示済みフレーム数と、直近フレームの表示時刻（リングバッファ）
+        self.frame_index = 0
+        self._present_ns = [self._frame_start_ns] * PRESENT_HISTORY
+
+        # フレーム待ち中に取り出したイベント
+        self._events: List[pygame.event.Event] = []
+
+    def now_ns(self) -> int:
+        """現在時刻（ナノ秒）"""
+        return self._time_source()
+
+    def seconds_since(self, start_ns: int) -> float:
+        """start_ns からの経過時間（秒）"""
+        return (self._time_source() - start_ns) / NS_PER_SECOND
+
+    def poll_events(self) -> None:
+        """イベントキューを取り出し、到着時刻を付けて保持"""
+        events = pygame.event.get()
+        if not events:
+            return
+        now = self._time_source()
+        for event in events:
+            event.timestamp_ns = now
+        self._events.extend(events)
+
+    def get_events(self) -> List[pygame.event.Event]:
+        """保持しているイベントと、キューに残っているイベントを取り出す"""
+        self.poll_events()
+        events = self._events
+        self._events = []
+        return events
+
+    def tick(self, fps: int = 0) -> float:
+        """
+        フレームレートを制限して待つ（待っている間もイベントを取り出す）
+
+        Args:
+            fps: 上限フレームレート（0の場合は待たない）
+
+        Returns:
+            前回の tick からの経過時間（秒）
+        """
+        if fps > 0:
+            deadline = self._frame_start_ns + NS_PER_SECOND // fps
+            while True:
+                self.poll_events()
+                remaining = deadline - self._time_source()
+                if remaining <= 0:
+                    break
+                self._sleep(min(remaining, EVENT_POLL_INTERVAL_NS) / NS_PER_SECOND)
+
+        now = self._time_source()
+        dt = (now - self._frame_start_ns) / NS_PER_SECOND
+        self._frame_start_ns = now
+        return dt
+
+    def mark_presented(self) -> int:
+        """
+        フレームを表示した直後に呼ぶ（表示時刻を記録してフレーム番号を進める）
+
+        Returns:
+            表示時刻（ナノ秒）
+        """
+        now = self._time_source()
+        self._present_ns[self.frame_index % PRESENT_HISTORY] = now
+        self.frame_index += 1
+        return now
+
+    def presented_at(self, frame: int) -> Optional[int]:
+        """
+        frame 番目のフレーム（frame_index の値で指定）が表示された時刻
+
+        Returns:
+            表示時刻（ナノ秒、まだ表示されていない・履歴から外れた場合はNone）
+        """
+        if frame >= self.frame_index or frame < self.frame_index - PRESENT_HISTORY:
+            return None
+        return self._present_ns[frame % PRESENT_HISTORY]
+
+    def event_time_ns(self, event: pygame.event.Event) -> int:
+        """イベントの到着時刻（記録がないイベントは現在時刻）"""
+        return getattr(event, "timestamp_ns", None) or self._time_source()
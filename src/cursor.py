@@ -3,7 +3,7 @@
 """
 
 import pygame
-from typing import Tuple
+from typing import Optional, Tuple
 from .settings import (
     SCREEN_WIDTH,
     SCREEN_HEIGHT,
@@ -11,6 +11,7 @@ from .settings import (
     CURSOR_COLOR,
     CURSOR_CENTER_DOT_SIZE,
     CURSOR_CENTER_DOT_COLOR,
+    CURSOR_HARDWARE,
 )
 
 
@@ -34,11 +35,18 @@ class Cursor:
         # レティクルの線の太さ
         self.line_width = 2
         self.gap = 6  # 中心からのギャップ
+        
+        # ハードウェアカーソル（OSのコンポジタがポインタの動きに合わせて描画）
+        self.hardware = CURSOR_HARDWARE
+        self._system_cursor_active = False
+        self._cursor_surface: Optional[pygame.Surface] = None
 
     def update(self, dx: float, dy: float) -> None:
         """
         カーソル位置を更新
         
+        位置は浮動小数点で保持するため、1ピクセル未満の移動量も蓄積される。
+        
         Args:
             dx: X方向の移動量
             dy: Y方向の移動量
@@ -67,10 +75,18 @@ class Cursor:
         """
         カーソルを描画（クロスヘア形式）
         
+        ハードウェアカーソル表示中はOSが描画するため何もしない。
+        
         Args:
             surface: 描画対象のサーフェス
         """
+        if self._system_cursor_active:
+            return
         cx, cy = self.get_center()
+        self._draw_crosshair(surface, cx, cy)
+
+    def _draw_crosshair(self, surface: pygame.Surface, cx: int, cy: int) -> None:
+        """指定位置にクロスヘアを描画"""
         half_size = self.size // 2
         
         # 上の線
@@ -117,6 +133,58 @@ class Cursor:
             self.center_dot_size
         )
 
+    def render(self, renderer) -> None:
+        """レンダラー経由で描画（事前描画したクロスヘアをスプライトとして使う）"""
+        if self._system_cursor_active:
+            return
+        renderer.sprite(("cursor", id(self)), self._render_cursor_surface, self.get_center())
+
+    def _render_cursor_surface(self) -> pygame.Surface:
+        """ハードウェアカーソル用にクロスヘアを事前描画"""
+        extent = max(self.size // 2 + self.line_width, self.center_dot_size + 1)
+        surface = pygame.Surface((extent * 2 + 1, extent * 2 + 1), pygame.SRCALPHA)
+        self._draw_crosshair(surface, extent, extent)
+        return surface
+
+    def set_hardware(self, enabled: bool) -> None:
+        """ハードウェアカーソルモードを設定"""
+        self.hardware = bool(enabled)
+        if not self.hardware:
+            self.set_system_cursor(False)
+
+    def set_system_cursor(self, active: bool) -> None:
+        """
+        OSカーソルとソフトウェア描画を切り替え
+        
+        状態が変わったときだけSDLを呼び出すため、毎フレーム呼び出してよい。
+        
+        Args:
+            active: True でOSカーソルとして表示、False でソフトウェア描画
+        """
+        active = active and self.hardware
+        if active == self._system_cursor_active:
+            return
+        
+        if active:
+            if self._cursor_surface is None:
+                self._cursor_surface = self._render_cursor_surface()
+            half = self._cursor_surface.get_width() // 2
+            try:
+                pygame.mouse.set_cursor((half, half), self._cursor_surface)
+            except pygame.error as e:
+                # カラーカーソル非対応の環境ではソフトウェア描画を続ける
+                print(f"ハードウェアカーソル設定エラー: {e}")
+                self.hardware = False
+                return
+            pygame.mouse.set_visible(True)
+        else:
+            pygame.mouse.set_visible(False)
+        self._system_cursor_active = active
+
+    def is_system_cursor_active(self) -> bool:
+        """OSカーソルとして表示中かどうか"""
+        return self._system_cursor_active
+
     def check_collision(self, target_x: float, target_y: float, target_radius: float) -> bool:
         """
         ターゲットとの当たり判定
@@ -0,0 +1,155 @@
+"""
+ライブテレメトリのダッシュボード（別プロセスで動く参照実装）
+
+ゲームを --live-bus 付きで起動し、別のターミナルで
+`python main.py --dashboard` を実行すると、共有メモリのスナップショットを読み出して
+セカンドモニター向けの小さなウィンドウに表示する。
+ゲームが起動していない間・再起動した場合は自動で接続し直す。
+"""
+
+from typing import Optional
+
+import numpy as np
+import pygame
+
+from .live_bus import (
+    DEFAULT_BUS_NAME, SCENE_CODES,
+    BUS_ON_TARGET, BUS_SESSION_ACTIVE, BUS_TARGET_VISIBLE,
+    LiveTelemetryReader,
+)
+from .settings import (
+    SCREEN_WIDTH, SCREEN_HEIGHT,
+    COLOR_BACKGROUND, COLOR_TEXT, COLOR_ACCENT, COLOR_SUCCESS,
+)
+
+
+WINDOW_SIZE = (560, 300)
+DASHBOARD_FPS = 60
+
+# 画面全体の縮小表示
+MINIMAP_RECT = pygame.Rect(300, 70, 240, 135)
+
+# 接続の再試行間隔と、更新が止まったと判断するまでの時間（秒）
+RECONNECT_INTERVAL = 1.0
+STALE_TIMEOUT = 2.0
+
+SCENE_NAMES = {code: name for name, code in SCENE_CODES.items()}
+
+
+def _connect(name: str) -> Optional[LiveTelemetryReader]:
+    """共有メモリに接続（ゲームが起動していない場合はNone）"""
+    try:
+        return LiveTelemetryReader(name)
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def run_dashboard(name: str = DEFAULT_BUS_NAME) -> None:
+    """ダッシュボードを表示（ウィンドウを閉じるまで戻らない）"""
+    pygame.init()
+    pygame.display.set_caption("PyAim Live")
+    screen = pygame.display.set_mode(WINDOW_SIZE)
+    font = pygame.font.SysFont("notosanscjkjp,takao,ipagothic,msgothic,meiryo,hiraginosansgb", 18)
+    font_large = pygame.font.SysFont("notosanscjkjp,takao,ipagothic,msgothic,meiryo,hiraginosansgb", 32)
+    clock = pygame.time.Clock()
+
+    reader: Optional[LiveTelemetryReader] = None
+    retry_timer = 0.0
+    stale_timer = 0.0
+    snapshot = None
+    fps = 0.0
+
+    running = True
+    while running:
+        dt = clock.tick(DASHBOARD_FPS) / 1000.0
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
+                running = False
+
+        # 接続・再接続
+        if reader is None:
+            retry_timer -= dt
+            if retry_timer <= 0.0:
+                retry_timer = RECONNECT_INTERVAL
+                reader = _connect(name)
+                stale_timer = 0.0
+        if reader is not None:
+            new = reader.read_new()
+            if len(new):
+                stale_timer = 0.0
+                snapshot = new[-1]
+                if len(new) >= 2:
+                    span_ns = int(new["time_ns"][-1]) - int(new["time_ns"][0])
+                    if span_ns > 0:
+                        fps = (len(new) - 1) * 1e9 / span_ns
+            else:
+                stale_timer += dt
+                if stale_timer >= STALE_TIMEOUT:
+                    # ゲームが終了した（再起動した場合は新しい共有メモリに接続し直す）
+                    reader.close()
+                    reader = None
+                    snapshot = None
+
+        _draw(screen, font, font_large, snapshot, fps)
+        pygame.display.flip()
+
+    if reader is not None:
+        reader.close()
+    pygame.quit()
+
+
+def _draw(
+    screen: pygame.Surface,
+    font: pygame.font.Font,
+    font_large: pygame.font.Font,
+    snapshot: Optional[np.void],
+    fps: float,
+) -> None:
+    """ダッシュボードを描画"""
+    screen.fill(COLOR_BACKGROUND)
+    if snapshot is None:
+        message = font.render("ゲームの起動を待っています（--live-bus）", True, (150, 150, 150))
+        screen.blit(message, message.get_rect(center=(WINDOW_SIZE[0] // 2, WINDOW_SIZE[1] // 2)))
+        return
+
+    flags = int(snapshot["flags"])
+    scene = SCENE_NAMES.get(int(snapshot["scene"]), "?")
+    header = font.render(f"{scene}  {fps:.0f} fps  frame {int(snapshot['frame'])}", True, COLOR_ACCENT)
+    screen.blit(header, (20, 20))
+
+    x, y = 20, 70
+    if flags & BUS_SESSION_ACTIVE and scene == "tracking":
+        color = COLOR_SUCCESS if flags & BUS_ON_TARGET else COLOR_TEXT
+        screen.blit(font_large.render(f"T0 {snapshot['t0_rate']:.1f}%", True, color), (x, y))
+        lines = [
+            f"直近1秒: {snapshot['t0_1s']:.1f}%",
+            f"直近5秒: {snapshot['t0_5s']:.1f}%",
+            f"残り: {snapshot['remaining']:.1f}s",
+        ]
+    elif flags & BUS_SESSION_ACTIVE and scene == "flicking":
+        shots = int(snapshot["shots"])
+        accuracy = int(snapshot["hits"]) / shots * 100 if shots else 0.0
+        screen.blit(font_large.render(f"命中 {accuracy:.0f}%", True, COLOR_TEXT), (x, y))
+        lines = [
+            f"ヒット: {int(snapshot['hits'])} / {shots}",
+            f"直前の反応: {snapshot['last_reaction_ms']:.0f}ms",
+            f"平均の反応: {snapshot['mean_reaction_ms']:.0f}ms",
+        ]
+    else:
+        lines = ["セッション外"]
+    for i, line in enumerate(lines):
+        screen.blit(font.render(line, True, COLOR_TEXT), (x, y + 50 + i * 28))
+
+    # 画面全体の縮小表示（ターゲットとカーソル）
+    rect = MINIMAP_RECT
+    pygame.draw.rect(screen, (40, 40, 55), rect)
+    pygame.draw.rect(screen, (80, 80, 100), rect, 1)
+    scale = rect.width / SCREEN_WIDTH
+    if flags & BUS_TARGET_VISIBLE:
+        center = (rect.x + int(snapshot["target_x"] * scale), rect.y + int(snapshot["target_y"] * scale))
+        pygame.draw.circle(screen, (255, 100, 100), center, max(2, int(snapshot["target_r"] * scale)))
+    cursor_x = min(max(float(snapshot["cursor_x"]), 0.0), SCREEN_WIDTH)
+    cursor_y = min(max(float(snapshot["cursor_y"]), 0.0), SCREEN_HEIGHT)
+    pygame.draw.circle(
+        screen, COLOR_TEXT, (rect.x + int(cursor_x * scale), rect.y + int(cursor_y * scale)), 3
+    )
@@ -0,0 +1,92 @@
+"""
+難易度（ターゲットの速さ・大きさ）の段階モジュール
+
+オフラインの較正（calibration.py）が書き出した data/difficulty.json を読み込み、
+シーンの開始時にターゲットへ適用する。較正していない場合は段階がなく、
+シーンは従来の固定値（Tracking: 速さ200・半径50、Flicking: 半径40）を使う。
+
+ファイルの形式:
+
+    {
+      "version": 1,
+      "tracking": {"easy": {"speed": 150.0, "radius": 60.0, "expected": {...}}, ...},
+      "flicking": {"easy": {"radius": 55.0, "expected": {...}}, ...}
+    }
+
+expected は較正に使ったボットごとの予想スコアの分布（表示・確認用）。
+"""
+
+import json
+import os
+import tempfile
+from typing import Any, Dict, List, Optional
+
+from .session_logger import DATA_DIR, NO_TIER
+
+
+DIFFICULTY_PATH = os.path.join(os.path.dirname(DATA_DIR), "difficulty.json")
+DIFFICULTY_VERSION = 1
+
+# 段階（易しい順）
+TIERS = ("easy", "normal", "hard", "expert")
+DEFAULT_TIER = "normal"
+
+
+def load_difficulty_tiers() -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """
+    較正済みの段階を読み込み
+
+    Returns:
+        モード → 段階名 → 設定（ファイルがない・形式が違う場合は空）
+    """
+    try:
+        if os.path.exists(DIFFICULTY_PATH):
+            with open(DIFFICULTY_PATH, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == DIFFICULTY_VERSION:
+                return {mode: data.get(mode, {}) for mode in ("tracking", "flicking")}
+    except Exception as e:
+        print(f"難易度の読み込みエラー: {e}")
+    return {}
+
+
+def save_difficulty_tiers(data: Dict[str, Any]) -> bool:
+    """段階を一時ファイル経由で置き換え保存"""
+    directory = os.path.dirname(DIFFICULTY_PATH)
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(prefix=".difficulty_", suffix=".json", dir=directory)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(dict(data, version=DIFFICULTY_VERSION), f, indent=2, ensure_ascii=False)
+        os.replace(temp_path, DIFFICULTY_PATH)
+        return True
+    except Exception as e:
+        print(f"難易度の保存エラー: {e}")
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        return False
+
+
+def available_tiers(tiers: Dict[str, Dict[str, Any]], mode: str) -> List[str]:
+    """モードで選べる段階名（易しい順）"""
+    calibrated = tiers.get(mode, {})
+    return [name for name in TIERS if name in calibrated]
+
+
+def get_tier(tiers: Dict[str, Dict[str, Any]], mode: str, name: str) -> Optional[Dict[str, Any]]:
+    """段階の設定（較正していない場合はNone）"""
+    return tiers.get(mode, {}).get(name)
+
+
+def step_tier(tiers: Dict[str, Dict[str, Any]], mode: str, name: str, step: int) -> str:
+    """段階を step だけ易しい/難しい方へ移す（端では止まる）"""
+    names = available_tiers(tiers, mode)
+    if not names:
+        return name
+    index = names.index(name) if name in names else 0
+    return names[max(0, min(len(names) - 1, index + step))]
+
+
+def recorded_tier(tiers: Dict[str, Dict[str, Any]], mode: str, name: str) -> str:
+    """セッション履歴に記録する段階名（較正していない場合は NO_TIER）"""
+    return name if get_tier(tiers, mode, name) is not None else NO_TIER
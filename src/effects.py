@@ -8,9 +8,19 @@ import math
 from typing import List, Tuple
 
 
+# 起動時にプールへ用意しておくパーティクル数（同時に存在する数の上限の目安）。
+# 発生のたびに最大数を更新して新しいオブジェクトを確保しないようにする
+PARTICLE_POOL_SIZE = 256
+
+
 class Particle:
     """単一パーティクル"""
 
+    __slots__ = (
+        "x", "y", "velocity_x", "velocity_y", "color",
+        "lifetime", "max_lifetime", "size", "alpha",
+    )
+
     def __init__(
         self,
         x: float,
@@ -21,6 +31,19 @@ class Particle:
         lifetime: float,
         size: float = 4
     ):
+        self.reset(x, y, velocity_x, velocity_y, color, lifetime, size)
+
+    def reset(
+        self,
+        x: float,
+        y: float,
+        velocity_x: float,
+        velocity_y: float,
+        color: Tuple[int, int, int],
+        lifetime: float,
+        size: float = 4
+    ) -> None:
+        """パーティクルを再初期化（プールから再利用する場合）"""
         self.x = x
         self.y = y
         self.velocity_x = velocity_x
@@ -70,12 +93,60 @@ class Particle:
         )
         surface.blit(temp_surface, (int(self.x - self.size), int(self.y - self.size)))
 
+    def _render_sprite(self) -> pygame.Surface:
+        """不透明なパーティクルをスプライトとして描画（アルファは描画時に適用）"""
+        sprite = pygame.Surface((int(self.size * 2), int(self.size * 2)), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, self.color, (int(self.size), int(self.size)), int(self.size))
+        return sprite
+
+    def render(self, renderer) -> None:
+        """レンダラー経由で描画（色・サイズごとにスプライトをキャッシュ）"""
+        if self.alpha <= 0:
+            return
+        key = ("particle", self.color, int(self.size * 2), int(self.size))
+        renderer.sprite(key, self._render_sprite, (int(self.x), int(self.y)), self.alpha)
+
 
 class ParticleSystem:
-    """パーティクルシステム管理"""
+    """
+    パーティクルシステム管理
 
-    def __init__(self):
+    消滅したパーティクルはプールに戻して再利用し、
+    セッション中の毎フレームでオブジェクトやリストを新たに確保しない。
+    """
+
+    def __init__(self, density: float = 1.0):
+        """
+        Args:
+            density: 発生数の倍率（画質プリセットで設定）
+        """
         self.particles: List[Particle] = []
+        self._pool: List[Particle] = [
+            Particle(0.0, 0.0, 0.0, 0.0, (0, 0, 0), 0.0) for _ in range(PARTICLE_POOL_SIZE)
+        ]
+        self.density = density
+
+    def _spawn(
+        self,
+        x: float,
+        y: float,
+        velocity_x: float,
+        velocity_y: float,
+        color: Tuple[int, int, int],
+        lifetime: float,
+        size: float
+    ) -> None:
+        """パーティクルを追加（プールに空きがあれば再利用）"""
+        if self._pool:
+            particle = self._pool.pop()
+            particle.reset(x, y, velocity_x, velocity_y, color, lifetime, size)
+        else:
+            particle = Particle(x, y, velocity_x, velocity_y, color, lifetime, size)
+        self.particles.append(particle)
+
+    def _scaled_count(self, count: int) -> int:
+        """密度を掛けた発生数（1個以上）"""
+        return max(1, round(count * self.density))
 
     def emit_burst(
         self,
@@ -94,19 +165,18 @@ class ParticleSystem:
             color: 色
             speed: 速度
         """
-        for _ in range(count):
+        for _ in range(self._scaled_count(count)):
             angle = random.uniform(0, 2 * math.pi)
             velocity = random.uniform(speed * 0.5, speed)
             
-            particle = Particle(
+            self._spawn(
                 x, y,
                 math.cos(angle) * velocity,
                 math.sin(angle) * velocity,
                 color,
-                lifetime=random.uniform(0.3, 0.6),
-                size=random.uniform(2, 5)
+                random.uniform(0.3, 0.6),
+                random.uniform(2, 5)
             )
-            self.particles.append(particle)
 
     def emit_trail(
         self,
@@ -123,29 +193,42 @@ class ParticleSystem:
             color: 色
             count: パーティクル数
         """
-        for _ in range(count):
-            particle = Particle(
+        for _ in range(self._scaled_count(count)):
+            self._spawn(
                 x + random.uniform(-2, 2),
                 y + random.uniform(-2, 2),
                 random.uniform(-20, 20),
                 random.uniform(-20, 20),
                 color,
-                lifetime=0.2,
-                size=2
+                0.2,
+                2
             )
-            self.particles.append(particle)
 
     def update(self, dt: float) -> None:
-        """全パーティクルを更新"""
-        self.particles = [p for p in self.particles if p.update(dt)]
+        """全パーティクルを更新（生存分を前詰めし、消滅分はプールへ）"""
+        particles = self.particles
+        alive = 0
+        for particle in particles:
+            if particle.update(dt):
+                particles[alive] = particle
+                alive += 1
+            else:
+                self._pool.append(particle)
+        del particles[alive:]
 
     def draw(self, surface: pygame.Surface) -> None:
         """全パーティクルを描画"""
         for particle in self.particles:
             particle.draw(surface)
 
+    def render(self, renderer) -> None:
+        """全パーティクルをレンダラー経由で描画"""
+        for particle in self.particles:
+            particle.render(renderer)
+
     def clear(self) -> None:
         """全パーティクルをクリア"""
+        self._pool.extend(self.particles)
         self.particles.clear()
 
 
@@ -0,0 +1,287 @@
+"""
+セッション履歴の列指向エクスポートモジュール
+
+CSVを行単位でストリーム処理し、列ごとの .npy（メモリマップ可能）
+または圧縮 .npz に書き出す。全行を辞書のリストとして保持しないため、
+数ヶ月分・チーム全体の履歴でもメモリ使用量は一定に保たれる。
+記録済みのフレームテレメトリも "frame_" 接頭辞付きの列として書き出す。
+"""
+
+import csv
+import os
+import shutil
+import tempfile
+import zipfile
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+from numpy.lib import format as npy_format
+
+from .session_logger import get_csv_path
+from .catalog import load_catalog
+from .telemetry import FRAME_DTYPE
+
+
+# 一度に変換する行数
+CHUNK_ROWS = 65536
+
+# 出力形式
+FORMAT_NPY = "npy"
+FORMAT_NPZ = "npz"
+
+
+def _parse_float(value: str) -> float:
+    """空欄を0として浮動小数点数に変換"""
+    return float(value) if value else 0.0
+
+
+def _parse_int(value: str) -> int:
+    """空欄を0として整数に変換"""
+    return int(value) if value else 0
+
+
+def _parse_timestamp(value: str) -> np.datetime64:
+    """ISO形式の時刻を変換（空欄・不正な値は ValueError で行ごと読み飛ばす）"""
+    timestamp = np.datetime64(value, "us")
+    if np.isnat(timestamp):
+        raise ValueError("timestamp が空欄です")
+    return timestamp
+
+
+# モード別の列定義: (列名, dtype, 変換関数)
+# 旧形式のCSVにない列（difficulty）は空欄として読む
+COLUMNS: Dict[str, List[Tuple[str, str, Callable[[str], object]]]] = {
+    "tracking": [
+        ("timestamp", "datetime64[us]", _parse_timestamp),
+        ("t0_rate", "float64", _parse_float),
+        ("duration", "float64", _parse_float),
+        ("difficulty", "U16", str),
+    ],
+    "flicking": [
+        ("timestamp", "datetime64[us]", _parse_timestamp),
+        ("accuracy", "float64", _parse_float),
+        ("avg_reaction_ms", "float64", _parse_float),
+        ("min_reaction_ms", "float64", _parse_float),
+        ("hits", "int32", _parse_int),
+        ("total", "int32", _parse_int),
+        ("difficulty", "U16", str),
+    ],
+}
+
+
+def _count_rows(csv_path: str) -> int:
+    """ヘッダーを除いた行数を数える（改行のバイト数を数えるだけで解析しない）"""
+    lines = 0
+    last = b"\n"
+    with open(csv_path, "rb") as f:
+        while True:
+            block = f.read(1 << 20)
+            if not block:
+                break
+            lines += block.count(b"\n")
+            last = block[-1:]
+    # 末尾に改行がない場合の最終行
+    if last != b"\n":
+        lines += 1
+    return max(0, lines - 1)
+
+
+def _iter_chunks(csv_path: str, mode: str) -> Iterator[List[np.ndarray]]:
+    """CSVをチャンク単位で読み、列ごとのndarrayを返す"""
+    columns = COLUMNS[mode]
+
+    with open(csv_path, "r", encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return
+        indices = [header.index(name) if name in header else None for name, _, _ in columns]
+
+        buffers: List[list] = [[] for _ in columns]
+        for row in reader:
+            if len(row) < len(header):
+                continue
+            try:
+                values = [
+                    convert(row[index] if index is not None else "")
+                    for index, (_, _, convert) in zip(indices, columns)
+                ]
+            except ValueError:
+                continue
+
+            for buffer, value in zip(buffers, values):
+                buffer.append(value)
+
+            if len(buffers[0]) >= CHUNK_ROWS:
+                yield [np.array(buf, dtype=dtype) for buf, (_, dtype, _) in zip(buffers, columns)]
+                buffers = [[] for _ in columns]
+
+        if buffers[0]:
+            yield [np.array(buf, dtype=dtype) for buf, (_, dtype, _) in zip(buffers, columns)]
+
+
+def load_columns(mode: str, names: Optional[List[str]] = None) -> Dict[str, np.ndarray]:
+    """
+    セッション履歴を列ごとのndarrayとして読み込み
+
+    Args:
+        mode: "tracking" または "flicking"
+        names: 読み込む列名（Noneの場合は全列）
+    """
+    columns = COLUMNS[mode]
+    if names is None:
+        names = [name for name, _, _ in columns]
+    indices = [[name for name, _, _ in columns].index(name) for name in names]
+
+    chunks: List[List[np.ndarray]] = [[] for _ in names]
+    csv_path = get_csv_path(mode)
+    if os.path.exists(csv_path):
+        for chunk in _iter_chunks(csv_path, mode):
+            for parts, index in zip(chunks, indices):
+                parts.append(chunk[index])
+
+    return {
+        name: np.concatenate(parts) if parts else np.empty(0, dtype=columns[index][1])
+        for name, parts, index in zip(names, chunks, indices)
+    }
+
+
+def _export_mode_npy(mode: str, dest_dir: str) -> List[str]:
+    """
+    1モード分を列ごとの .npy に書き出す
+
+    行数を先に数えてメモリマップで確保し、チャンクごとに書き込む。
+    """
+    csv_path = get_csv_path(mode)
+    if not os.path.exists(csv_path):
+        return []
+
+    os.makedirs(dest_dir, exist_ok=True)
+    n_rows = _count_rows(csv_path)
+    columns = COLUMNS[mode]
+
+    paths = [os.path.join(dest_dir, f"{name}.npy") for name, _, _ in columns]
+    arrays = [
+        npy_format.open_memmap(path, mode="w+", dtype=np.dtype(dtype), shape=(n_rows,))
+        for path, (_, dtype, _) in zip(paths, columns)
+    ]
+
+    written = 0
+    for chunk in _iter_chunks(csv_path, mode):
+        size = min(len(chunk[0]), n_rows - written)
+        for array, values in zip(arrays, chunk):
+            array[written:written + size] = values[:size]
+        written += size
+
+    for array in arrays:
+        array.flush()
+    del arrays
+
+    # 不正な行を読み飛ばした場合のみ末尾を切り詰める
+    if written < n_rows:
+        for path in paths:
+            trimmed = np.load(path, mmap_mode="r")[:written].copy()
+            np.save(path, trimmed)
+
+    return paths
+
+
+def _export_telemetry_npy(mode: str, dest_dir: str) -> List[str]:
+    """
+    1モード分のフレームテレメトリを列ごとの .npy に書き出す
+
+    行数はカタログから求め、セッションを1つずつメモリマップで読んで連結先に直接コピーする。
+    frame_session 列は frame_files の何番目のセッションかを表す。
+    """
+    sessions = load_catalog().query(mode)
+    if len(sessions) == 0:
+        return []
+
+    os.makedirs(dest_dir, exist_ok=True)
+    total = sessions.samples
+
+    columns = [("session", np.dtype("int32"))] + [
+        (name, FRAME_DTYPE[name]) for name in FRAME_DTYPE.names
+    ]
+    paths = [os.path.join(dest_dir, f"frame_{name}.npy") for name, _ in columns]
+    arrays = [
+        npy_format.open_memmap(path, mode="w+", dtype=dtype, shape=(total,))
+        for path, (_, dtype) in zip(paths, columns)
+    ]
+
+    for index, frames in enumerate(sessions):
+        start, stop = int(sessions.offsets[index]), int(sessions.offsets[index + 1])
+        arrays[0][start:stop] = index
+        for array, (name, _) in zip(arrays[1:], columns[1:]):
+            array[start:stop] = frames[name]
+        del frames
+
+    for array in arrays:
+        array.flush()
+    del arrays
+
+    files_path = os.path.join(dest_dir, "frame_files.npy")
+    np.save(files_path, np.array([os.path.basename(path) for path in sessions.entries["file"]]))
+    return paths + [files_path]
+
+
+def _pack_npz(npy_paths: List[str], npz_path: str) -> None:
+    """列ごとの .npy をチャンク単位で圧縮 .npz にまとめる"""
+    with zipfile.ZipFile(npz_path, "w", compression=zipfile.ZIP_DEFLATED, allowZip64=True) as zf:
+        for path in npy_paths:
+            array = np.load(path, mmap_mode="r")
+            name = os.path.basename(path)
+            with zf.open(name, "w", force_zip64=True) as entry:
+                npy_format.write_array_header_1_0(
+                    entry, npy_format.header_data_from_array_1_0(array)
+                )
+                for start in range(0, len(array), CHUNK_ROWS):
+                    entry.write(np.ascontiguousarray(array[start:start + CHUNK_ROWS]).tobytes())
+            del array
+
+
+def export_sessions(
+    output_dir: str,
+    fmt: str = FORMAT_NPZ,
+    modes: Optional[List[str]] = None,
+) -> List[str]:
+    """
+    セッション履歴を列指向形式でエクスポート
+
+    Args:
+        output_dir: 出力先ディレクトリ
+        fmt: "npz"（モードごとに圧縮1ファイル）または "npy"（列ごとのファイル）
+        modes: 対象モード（Noneの場合は全モード）
+
+    Returns:
+        書き出したファイルパスのリスト
+    """
+    if fmt not in (FORMAT_NPY, FORMAT_NPZ):
+        raise ValueError(f"未対応のエクスポート形式: {fmt}")
+
+    if modes is None:
+        modes = list(COLUMNS.keys())
+
+    os.makedirs(output_dir, exist_ok=True)
+    written: List[str] = []
+
+    for mode in modes:
+        if fmt == FORMAT_NPY:
+            mode_dir = os.path.join(output_dir, mode)
+            written.extend(_export_mode_npy(mode, mode_dir))
+            written.extend(_export_telemetry_npy(mode, mode_dir))
+            continue
+
+        # npz は一時的な .npy を経由してストリーム圧縮する
+        temp_dir = tempfile.mkdtemp(prefix=f"pyaim_{mode}_", dir=output_dir)
+        try:
+            npy_paths = _export_mode_npy(mode, temp_dir)
+            npy_paths += _export_telemetry_npy(mode, temp_dir)
+            if npy_paths:
+                npz_path = os.path.join(output_dir, f"{mode}.npz")
+                _pack_npz(npy_paths, npz_path)
+                written.append(npz_path)
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    return written
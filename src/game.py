@@ -2,6 +2,7 @@
 メインゲームループ管理モジュール（シーン管理対応）
 """
 
+import os
 import pygame
 from typing import Optional, Dict
 from .settings import (
@@ -10,33 +11,86 @@ from .settings import (
     WINDOW_TITLE,
     TARGET_FPS,
     COLOR_BACKGROUND,
+    RENDER_BACKEND,
+    DeviceType,
 )
+from .render import create_renderer
+from .clock import FrameClock
+from . import profiling
+from .alloc_diagnostics import AllocationMonitor, PHASE_UPDATE, PHASE_DRAW
+from .gc_policy import GCPolicy
+from .live_bus import LiveTelemetryBus, SCENE_CODES
+from .shot_log import DEVICE_CODES
+from .difficulty import DEFAULT_TIER
 from .input_handler import InputHandler
 from .cursor import Cursor
-from .profile import load_profile, apply_profile_to_input_handler
+from .profile import (
+    load_profile,
+    save_profile,
+    apply_profile_to_input_handler,
+    apply_profile_to_cursor,
+    get_graphics_settings,
+)
 
 
 class Game:
     """メインゲームクラス"""
 
-    def __init__(self):
+    def __init__(
+        self,
+        render_backend: Optional[str] = None,
+        clock: Optional[FrameClock] = None,
+        live_bus: Optional[LiveTelemetryBus] = None,
+    ):
+        """
+        Args:
+            render_backend: 描画バックエンド（"surface" または "texture"、
+                Noneの場合はプロファイルの設定）
+            clock: フレーム・入力の時刻を記録するクロック（Noneの場合は perf_counter_ns）
+            live_bus: 毎フレームの状態を公開する共有メモリ（Noneの場合は公開しない）
+        """
+        # プロファイル読み込み（SDLヒントはpygame初期化前に設定する必要がある）
+        profile = load_profile()
+        if profile.get("gamepad", {}).get("poll_rate_hz", 0) > 0:
+            # Windowsでジョイスティック状態を専用スレッドで更新させる
+            os.environ.setdefault("SDL_JOYSTICK_THREAD", "1")
+        
         pygame.init()
         pygame.display.set_caption(WINDOW_TITLE)
         
-        # ディスプレイ設定
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        self.clock = pygame.time.Clock()
+        # 画質設定（初回起動時はウィンドウを開く前に自動ベンチマーク）
+        if "graphics" not in profile:
+            from .benchmark import auto_configure_graphics
+            profile["graphics"] = auto_configure_graphics()
+            save_profile(profile)
+        self.graphics_profile = profile["graphics"]
+        self.graphics = get_graphics_settings(profile)
+        # 難易度の段階（較正済みの段階がある場合に Tracking / Flicking で使う）
+        self.difficulty = profile.get("difficulty", DEFAULT_TIER)
+        if render_backend is None:
+            render_backend = self.graphics_profile.get("backend", RENDER_BACKEND)
+        
+        # リフレッシュレートが上限より高い環境ではそれに合わせる
+        self.target_fps = max(TARGET_FPS, self.graphics_profile.get("refresh_rate", 0))
+        
+        # ディスプレイ設定（texture バックエンドは独自のウィンドウを作成する）
+        self.renderer = create_renderer(
+            render_backend, (SCREEN_WIDTH, SCREEN_HEIGHT), graphics=self.graphics
+        )
+        self.screen = self.renderer.surface
+        self.clock = clock if clock is not None else FrameClock()
         
         # マウスカーソルを非表示に
         pygame.mouse.set_visible(False)
         
         # コンポーネント初期化
         self.input_handler = InputHandler()
+        self.input_handler.set_mouse_scale(self.renderer.input_scale)
         self.cursor = Cursor()
         
-        # プロファイル読み込み
-        profile = load_profile()
+        # プロファイル適用
         apply_profile_to_input_handler(profile, self.input_handler)
+        apply_profile_to_cursor(profile, self.cursor)
         
         # フォント（クロスプラットフォーム対応）
         import platform
@@ -65,7 +119,18 @@ class Game:
         # シーン管理
         self.scenes: Dict[str, any] = {}
         self.current_scene = None
+        self.current_scene_name: Optional[str] = None
         self._init_scenes()
+        
+        # 起動時に確保した長寿命オブジェクトをGC対象から外す
+        self.gc_policy = GCPolicy()
+        self.gc_policy.freeze()
+        
+        # アロケーション診断（F10で開始/終了）
+        self.alloc_monitor: Optional[AllocationMonitor] = None
+        
+        # ライブテレメトリ（外部のダッシュボード・オーバーレイ向け）
+        self.live_bus = live_bus
 
     def _init_scenes(self) -> None:
         """シーンを初期化"""
@@ -73,49 +138,132 @@ class Game:
         from .scenes.tracking import TrackingScene
         from .scenes.flicking import FlickingScene
         from .scenes.stats import StatsScene
+        from .scenes.replay import ReplayScene
         
         self.scenes = {
             "launcher": LauncherScene(self),
             "tracking": TrackingScene(self),
             "flicking": FlickingScene(self),
             "stats": StatsScene(self),
+            "replay": ReplayScene(self),
         }
         self.current_scene = self.scenes["launcher"]
+        self.current_scene_name = "launcher"
+        profiling.on_scene_enter("launcher")
         self.current_scene.on_enter()
+        
+        # パーティクル密度を画質設定に合わせる
+        for scene in self.scenes.values():
+            particles = getattr(scene, "particles", None)
+            if particles is not None:
+                particles.density = self.graphics["particle_density"]
 
     def change_scene(self, scene_name: str) -> None:
         """シーンを切り替え"""
         if scene_name in self.scenes:
             if self.current_scene:
                 self.current_scene.on_exit()
+            self.gc_policy.on_scene_change()
             self.current_scene = self.scenes[scene_name]
+            self.current_scene_name = scene_name
+            # シーンの読み込み処理も計測に含める
+            profiling.on_scene_enter(scene_name)
+            self.input_handler.flush_pending_input()
             self.current_scene.on_enter()
             self.current_scene.next_scene = None
 
     def handle_events(self) -> None:
         """イベント処理"""
-        for event in pygame.event.get():
+        for event in self.clock.get_events():
             if event.type == pygame.QUIT:
                 self.running = False
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F9:
+                # F9: シーンを離れるまで計測 / Shift+F9: 一定フレーム数を計測
+                frames = profiling.DEFAULT_FRAMES if event.mod & pygame.KMOD_SHIFT else None
+                profiling.toggle_capture(self.current_scene_name, frames)
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F10:
+                self.toggle_alloc_diagnostics()
             else:
+                self.input_handler.map_mouse_event(event)
+                self.input_handler.handle_event(event)
                 if self.current_scene:
                     self.current_scene.handle_event(event)
 
     def update(self) -> None:
         """ゲーム状態の更新"""
         if self.current_scene:
-            self.current_scene.update(self.dt)
+            if self.alloc_monitor is not None:
+                self.alloc_monitor.measure(
+                    self.current_scene_name, PHASE_UPDATE, self.current_scene.update, self.dt
+                )
+            else:
+                self.current_scene.update(self.dt)
+            # 更新中に届いた入力の到着時刻を記録（処理は次フレームの handle_events）
+            self.clock.poll_events()
+            self.gc_policy.update(getattr(self.current_scene, "session_active", False))
             
             # シーン遷移チェック
             if self.current_scene.next_scene:
                 self.change_scene(self.current_scene.next_scene)
 
+    def _update_cursor_mode(self) -> None:
+        """
+        ハードウェアカーソルの使用可否を更新
+        
+        OSカーソルはポインタ位置にしか表示できないため、
+        ゲームパッド操作中と相対モード中はソフトウェア描画に戻す。
+        """
+        use_system = (
+            self.input_handler.get_active_device() == DeviceType.MOUSE
+            and not self.input_handler.is_raw_capture_active()
+        )
+        self.cursor.set_system_cursor(use_system)
+
     def draw(self) -> None:
         """描画処理"""
+        self._update_cursor_mode()
         if self.current_scene:
-            self.current_scene.draw(self.screen)
+            if self.alloc_monitor is not None:
+                self.alloc_monitor.measure(
+                    self.current_scene_name, PHASE_DRAW, self.current_scene.render, self.renderer
+                )
+            else:
+                self.current_scene.render(self.renderer)
         
-        pygame.display.flip()
+        # 描画中・垂直同期待ちの間に届いた入力も、present の前後で到着時刻を記録する
+        self.clock.poll_events()
+        with profiling.span("present"):
+            self.renderer.present()
+        self.clock.mark_presented()
+        self.clock.poll_events()
+        
+        if self.live_bus is not None:
+            self._publish_snapshot()
+
+    def _publish_snapshot(self) -> None:
+        """表示したフレームの状態をライブテレメトリに公開"""
+        snapshot = self.live_bus.begin()
+        snapshot["frame"] = self.clock.frame_index
+        snapshot["time_ns"] = self.clock.now_ns()
+        snapshot["scene"] = SCENE_CODES.get(self.current_scene_name, 0)
+        snapshot["device"] = DEVICE_CODES.get(self.input_handler.get_active_device(), 0)
+        cursor_x, cursor_y = self.cursor.get_position()
+        snapshot["cursor_x"] = cursor_x
+        snapshot["cursor_y"] = cursor_y
+        if self.current_scene:
+            self.current_scene.write_snapshot(snapshot)
+        self.live_bus.publish()
+
+    def toggle_alloc_diagnostics(self) -> None:
+        """アロケーション診断の開始/終了（終了時にシーンごとの集計を表示）"""
+        if self.alloc_monitor is None:
+            self.alloc_monitor = AllocationMonitor()
+            print("アロケーション診断を開始しました（F10で終了）")
+            return
+        for line in self.alloc_monitor.format_report():
+            print(line)
+        self.alloc_monitor.shutdown()
+        self.alloc_monitor = None
 
     def run(self) -> None:
         """メインループ"""
@@ -123,15 +271,26 @@ class Game:
         print("ESCキーで終了します")
         
         while self.running:
-            self.dt = self.clock.tick(TARGET_FPS) / 1000.0
+            self.dt = self.clock.tick(self.target_fps)
             
-            self.handle_events()
-            self.update()
-            self.draw()
+            with profiling.span("events"):
+                self.handle_events()
+            with profiling.span("update"):
+                self.update()
+            with profiling.span("draw"):
+                self.draw()
+            profiling.on_frame_end()
         
         self.quit()
 
     def quit(self) -> None:
         """ゲーム終了処理"""
+        profiling.stop_capture()
+        if self.alloc_monitor is not None:
+            self.toggle_alloc_diagnostics()
+        self.gc_policy.shutdown()
+        self.input_handler.shutdown()
+        if self.live_bus is not None:
+            self.live_bus.close()
         pygame.quit()
         print("アプリケーションを終了しました")
@@ -0,0 +1,138 @@
+"""
+ゲームパッド高頻度ポーリングモジュール
+
+フレームレートとは独立にスティック入力をサンプリングし、
+リングバッファに時刻付きで蓄積する。メインスレッドは毎フレーム
+蓄積分をまとめて取り出し、反応曲線を通して積分する。
+"""
+
+import threading
+import time
+from typing import Optional, Tuple
+
+import numpy as np
+import pygame
+
+
+# 1サンプルの保持時間の上限（サンプリング周期の倍数）。
+# 読み出されない期間（メニュー表示中など）が空いても、その間の時間を積分しない
+MAX_SAMPLE_PERIODS = 2.0
+
+
+class GamepadPoller:
+    """
+    ゲームパッドの軸入力を別スレッドでサンプリングするクラス
+
+    書き込みはポーリングスレッドのみ、読み出しはメインスレッドのみの
+    単一生産者・単一消費者リングバッファ。書き込み位置は要素の書き込み後に
+    更新するため、ロックなしで読み出せる。
+
+    SDLは通常イベントポンプ時に軸の状態を更新する。Windowsでは
+    SDL_JOYSTICK_THREAD ヒントにより専用スレッドで更新されるため、
+    フレーム間のスティックの動きもサンプルに反映される。
+    """
+
+    def __init__(self, joystick: pygame.joystick.JoystickType, rate_hz: float = 1000.0, capacity: int = 4096):
+        """
+        Args:
+            joystick: サンプリング対象のジョイスティック
+            rate_hz: サンプリング周波数
+            capacity: リングバッファ容量（サンプル数）
+        """
+        self.joystick = joystick
+        self.rate_hz = rate_hz
+        self.capacity = capacity
+
+        self._times = np.zeros(capacity, dtype=np.float64)
+        self._xs = np.zeros(capacity, dtype=np.float64)
+        self._ys = np.zeros(capacity, dtype=np.float64)
+
+        # 累積サンプル数（書き込み側のみ更新）と読み出し済み位置
+        self._write_count = 0
+        self._read_count = 0
+        self._last_time = time.perf_counter()
+
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """ポーリングを開始"""
+        if self._running:
+            return
+        self._running = True
+        self._last_time = time.perf_counter()
+        self._read_count = self._write_count
+        self._thread = threading.Thread(target=self._run, name="GamepadPoller", daemon=True)
+        self._thread.start()
+
+    def flush(self) -> None:
+        """未読のサンプルを捨て、次の取り出しの基準時刻を現在にする"""
+        self._read_count = self._write_count
+        self._last_time = time.perf_counter()
+
+    def stop(self) -> None:
+        """ポーリングを停止"""
+        self._running = False
+        if self._thread is not None:
+            self._thread.join(timeout=0.1)
+            self._thread = None
+
+    def is_running(self) -> bool:
+        """ポーリング中かどうか"""
+        return self._running
+
+    def _run(self) -> None:
+        """ポーリングスレッド本体"""
+        interval = 1.0 / self.rate_hz
+        next_time = time.perf_counter()
+        joystick = self.joystick
+
+        while self._running:
+            try:
+                x = joystick.get_axis(0)
+                y = joystick.get_axis(1)
+            except pygame.error:
+                # デバイスが切断された
+                self._running = False
+                break
+
+            index = self._write_count % self.capacity
+            self._times[index] = time.perf_counter()
+            self._xs[index] = x
+            self._ys[index] = y
+            # 要素を書き終えてから公開する
+            self._write_count += 1
+
+            next_time += interval
+            delay = next_time - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                # 大きく遅れた場合は周期をリセット
+                next_time = time.perf_counter()
+
+    def drain(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        前回以降のサンプルを取り出す
+
+        Returns:
+            (各サンプルの保持時間（秒）, x, y) の配列。
+            保持時間は直前のサンプル（初回は前回の取り出し時刻）からの経過時間で、
+            サンプリング周期の MAX_SAMPLE_PERIODS 倍を上限とする。
+        """
+        end = self._write_count
+        start = max(self._read_count, end - self.capacity)
+        self._read_count = end
+
+        if end == start:
+            return (np.empty(0), np.empty(0), np.empty(0))
+
+        indices = np.arange(start, end) % self.capacity
+        times = self._times[indices]
+        xs = self._xs[indices]
+        ys = self._ys[indices]
+
+        durations = np.diff(times, prepend=self._last_time)
+        np.clip(durations, 0.0, MAX_SAMPLE_PERIODS / self.rate_hz, out=durations)
+        self._last_time = times[-1]
+        return (durations, xs, ys)
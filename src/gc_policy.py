@@ -0,0 +1,129 @@
+"""
+ガベージコレクション制御モジュール
+
+計測中のセッションで循環GCが不定期に走るとフレーム時間が跳ね、
+スコアのばらつきになる。セッション中は自動GCを止め（または閾値を上げ）、
+リザルト画面やシーン遷移など時間を計っていないタイミングでまとめて回収する。
+GCの停止時間は profiling の "gc" スパンとして記録される。
+"""
+
+import gc
+import time
+from typing import Dict, Optional, Tuple
+
+from . import profiling
+from .settings import (
+    GC_SESSION_MODE,
+    GC_SESSION_THRESHOLD,
+    GC_SESSION_MAX_PENDING,
+    GCMode,
+)
+
+
+class GCPolicy:
+    """セッション状態に応じてGCを制御するクラス"""
+
+    def __init__(self, mode: str = GC_SESSION_MODE):
+        """
+        Args:
+            mode: セッション中の方針（"disable": 自動GC停止, "raise": 閾値を上げる, "off": 制御しない）
+        """
+        self.mode = mode
+        self.session_active = False
+        self._default_threshold = gc.get_threshold()
+
+        # GC停止時間の統計（世代 -> (回数, 合計秒, 最大秒)）
+        self._pause_start: Optional[float] = None
+        self._pause_stats: Dict[int, Tuple[int, float, float]] = {}
+        self._session_pauses = 0
+
+        gc.callbacks.append(self._on_gc)
+
+    def _on_gc(self, phase: str, info: dict) -> None:
+        """gc.callbacks から呼ばれる（GC開始・終了）"""
+        if phase == "start":
+            self._pause_start = time.perf_counter()
+            profiling.begin("gc")
+            return
+
+        profiling.end("gc")
+        if self._pause_start is None:
+            return
+        duration = time.perf_counter() - self._pause_start
+        self._pause_start = None
+
+        generation = info.get("generation", 0)
+        count, total, longest = self._pause_stats.get(generation, (0, 0.0, 0.0))
+        self._pause_stats[generation] = (count + 1, total + duration, max(longest, duration))
+        if self.session_active:
+            self._session_pauses += 1
+
+    def freeze(self) -> None:
+        """
+        起動時に確保したオブジェクトを回収対象から外す
+
+        シーン・フォント・キャッシュなど生存し続けるオブジェクトを
+        以後のGCで走査しないようにする（Game._init_scenes の後に呼ぶ）。
+        """
+        gc.collect()
+        gc.freeze()
+
+    def update(self, session_active: bool) -> None:
+        """毎フレーム呼ぶ（セッションの開始・終了を検出して方針を切り替え）"""
+        if session_active and not self.session_active:
+            self._begin_session()
+        elif not session_active and self.session_active:
+            self._end_session()
+        elif session_active and self.mode == GCMode.DISABLE:
+            # 自動GC停止中も若い世代が増えすぎた場合だけ最小限回収する
+            if gc.get_count()[0] > GC_SESSION_MAX_PENDING:
+                gc.collect(0)
+
+    def _begin_session(self) -> None:
+        """セッション開始: 直前にまとめて回収してから自動GCを抑える"""
+        if self.mode != GCMode.OFF:
+            gc.collect(1)
+        self.session_active = True
+        self._session_pauses = 0
+        if self.mode == GCMode.DISABLE:
+            gc.disable()
+        elif self.mode == GCMode.RAISE:
+            gc.set_threshold(*GC_SESSION_THRESHOLD)
+
+    def _end_session(self) -> None:
+        """セッション終了（リザルト画面）: 設定を戻してまとめて回収"""
+        self.session_active = False
+        self._log_session_pauses()
+        if self.mode == GCMode.OFF:
+            return
+        gc.set_threshold(*self._default_threshold)
+        gc.enable()
+        gc.collect()
+
+    def on_scene_change(self) -> None:
+        """シーン遷移時の回収（若い世代のみ）"""
+        if self.mode != GCMode.OFF and not self.session_active:
+            gc.collect(1)
+
+    def get_pause_stats(self) -> Dict[int, Tuple[int, float, float]]:
+        """世代ごとの (回数, 合計秒, 最大秒)"""
+        return dict(self._pause_stats)
+
+    def get_session_pause_count(self) -> int:
+        """現在（直近）のセッション中に発生したGCの回数"""
+        return self._session_pauses
+
+    def _log_session_pauses(self) -> None:
+        """セッション中のGC回数と、起動後の世代ごとの停止時間を表示"""
+        totals = ", ".join(
+            f"第{generation}世代 {count}回 最大{longest * 1000.0:.1f}ms"
+            for generation, (count, total, longest) in sorted(self.get_pause_stats().items())
+        )
+        print(f"セッション中のGC: {self.get_session_pause_count()}回（起動後の累計: {totals or 'なし'}）")
+
+    def shutdown(self) -> None:
+        """終了処理（コールバックを外して設定を戻す）"""
+        if self._on_gc in gc.callbacks:
+            gc.callbacks.remove(self._on_gc)
+        gc.set_threshold(*self._default_threshold)
+        gc.enable()
@@ -0,0 +1,161 @@
+"""
+カーソル誤差ヒートマップモジュール
+
+記録済みテレメトリをNumPyで一括ビニングし、
+pygame.surfarray 経由でサーフェスに変換する。
+"""
+
+from typing import Iterable, Iterator, Optional, Tuple
+
+import numpy as np
+import pygame
+
+from .settings import SCREEN_WIDTH, SCREEN_HEIGHT
+from .catalog import FrameSet, load_catalog
+from .telemetry import (
+    load_telemetry,
+    FLAG_ON_TARGET, FLAG_CLICK, FLAG_HIT,
+)
+
+
+# ビン数（横, 縦）
+LOSS_BINS = (128, 72)
+MISS_BINS = (64, 64)
+
+# ミス位置ヒートマップの表示範囲（ターゲット半径の倍数）
+MISS_RANGE = 3.0
+
+
+def _build_colormap() -> np.ndarray:
+    """黒→青→赤→黄→白 のカラーマップ（256x3）を作成"""
+    stops = np.array([0.0, 0.25, 0.55, 0.8, 1.0])
+    colors = np.array([
+        [20, 20, 30],
+        [40, 60, 200],
+        [220, 50, 50],
+        [255, 210, 60],
+        [255, 255, 255],
+    ], dtype=np.float64)
+    x = np.linspace(0.0, 1.0, 256)
+    return np.stack(
+        [np.interp(x, stops, colors[:, channel]) for channel in range(3)], axis=1
+    ).astype(np.uint8)
+
+
+COLORMAP = _build_colormap()
+
+
+def bin_points(
+    xs: np.ndarray,
+    ys: np.ndarray,
+    bins: Tuple[int, int],
+    x_range: Tuple[float, float],
+    y_range: Tuple[float, float],
+) -> np.ndarray:
+    """
+    点群を2次元ヒストグラムに集計
+
+    np.histogram2d より高速な、整数インデックス化 + bincount で集計する。
+
+    Returns:
+        (横ビン数, 縦ビン数) の int64 配列
+    """
+    bx, by = bins
+    ix = np.floor((xs - x_range[0]) * (bx / (x_range[1] - x_range[0]))).astype(np.int64)
+    iy = np.floor((ys - y_range[0]) * (by / (y_range[1] - y_range[0]))).astype(np.int64)
+    valid = (ix >= 0) & (ix < bx) & (iy >= 0) & (iy < by)
+    counts = np.bincount(ix[valid] * by + iy[valid], minlength=bx * by)
+    return counts.reshape(bx, by)
+
+
+def _loss_points(frames: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """ターゲット上から外れたフレームのターゲット位置を抽出"""
+    on_target = (frames["flags"] & FLAG_ON_TARGET) != 0
+    lost = np.flatnonzero(on_target[:-1] & ~on_target[1:]) + 1
+    return frames["target_x"][lost], frames["target_y"][lost]
+
+
+def _miss_points(frames: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """ミスクリックのターゲット中心からの相対位置（半径で正規化）を抽出"""
+    flags = frames["flags"]
+    miss = np.flatnonzero(((flags & FLAG_CLICK) != 0) & ((flags & FLAG_HIT) == 0))
+    radius = frames["target_r"][miss]
+    radius = np.where(radius > 0, radius, 1.0)
+    dx = (frames["cursor_x"][miss] - frames["target_x"][miss]) / radius
+    dy = (frames["cursor_y"][miss] - frames["target_y"][miss]) / radius
+    return dx, dy
+
+
+def _iter_sessions(
+    mode: str, paths: Optional[Iterable[str]], sessions: Optional[FrameSet]
+) -> Iterator[np.ndarray]:
+    """集計対象のセッションのフレーム列（どちらも省略時はカタログの全セッション）"""
+    if paths is not None:
+        for path in paths:
+            yield load_telemetry(path)
+        return
+    yield from sessions if sessions is not None else load_catalog().query(mode)
+
+
+def compute_loss_heatmap(
+    paths: Iterable[str] = None, sessions: Optional[FrameSet] = None
+) -> Tuple[np.ndarray, int]:
+    """
+    Trackingでターゲットを見失った画面位置のヒートマップを計算
+
+    Args:
+        paths: 集計するテレメトリファイル
+        sessions: 集計するカタログの検索結果（どちらも省略時は全セッション）
+
+    Returns:
+        (ヒストグラム, 集計したサンプル数)
+    """
+    hist = np.zeros(LOSS_BINS, dtype=np.int64)
+    samples = 0
+    # セッションごとに集計して加算するため、全履歴を連結しない
+    for frames in _iter_sessions("tracking", paths, sessions):
+        samples += len(frames)
+        xs, ys = _loss_points(frames)
+        hist += bin_points(xs, ys, LOSS_BINS, (0, SCREEN_WIDTH), (0, SCREEN_HEIGHT))
+    return hist, samples
+
+
+def compute_miss_heatmap(
+    paths: Iterable[str] = None, sessions: Optional[FrameSet] = None
+) -> Tuple[np.ndarray, int]:
+    """
+    Flickingでミスクリックした位置（ターゲット中心基準）のヒートマップを計算
+
+    Args:
+        paths: 集計するテレメトリファイル
+        sessions: 集計するカタログの検索結果（どちらも省略時は全セッション）
+
+    Returns:
+        (ヒストグラム, ミス数)
+    """
+    hist = np.zeros(MISS_BINS, dtype=np.int64)
+    misses = 0
+    for frames in _iter_sessions("flicking", paths, sessions):
+        dx, dy = _miss_points(frames)
+        misses += len(dx)
+        hist += bin_points(dx, dy, MISS_BINS, (-MISS_RANGE, MISS_RANGE), (-MISS_RANGE, MISS_RANGE))
+    return hist, misses
+
+
+def render_heatmap(hist: np.ndarray, size: Tuple[int, int]) -> pygame.Surface:
+    """
+    ヒストグラムをカラーマップ付きサーフェスに変換
+
+    Args:
+        hist: (横, 縦) のヒストグラム
+        size: 出力サーフェスのサイズ
+    """
+    # 少数の外れ値で全体が暗くならないよう対数スケールで正規化
+    scaled = np.log1p(hist.astype(np.float64))
+    peak = scaled.max()
+    if peak > 0:
+        scaled /= peak
+    indices = (scaled * 255).astype(np.uint8)
+
+    surface = pygame.surfarray.make_surface(COLORMAP[indices])
+    return pygame.transform.smoothscale(surface, size)
@@ -0,0 +1,439 @@
+"""
+セッション履歴の一括インポートモジュール
+
+旧バージョンのCSV・表計算ソフトの書き出し・他のトレーナーの記録（CSV / JSON Lines）を
+1行ずつストリーム処理してセッション履歴（data/sessions/*.csv）に取り込む。
+
+- 各行を検証し、timestamp と mode が既存の記録や入力内の先の行と同じものは重複として読み飛ばす
+- BATCH_ROWS 行ごとにまとめて追記し、書き込みに失敗したバッチはファイルを元の長さに戻す
+- 保持するのは1バッチ分の行と重複判定用の時刻（1行8バイト）だけなので、
+  入力が大きくてもメモリ使用量はほぼ一定
+- 取り込んだ記録が既存の記録より古い場合は、最後に履歴を時刻順に並べ替える
+- difficulty 列がない入力の行は段階なし（空欄）として取り込む
+
+保存形式は save_tracking_session() / save_flicking_session() と同じ行変換を使う。
+"""
+
+import codecs
+import csv
+import json
+import os
+import tempfile
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from .difficulty import TIERS
+from .export import load_columns
+from .session_logger import (
+    DATA_DIR, NO_TIER, SESSION_COLUMNS,
+    format_flicking_row, format_tracking_row, get_csv_path, upgrade_csv,
+)
+
+
+# 1回の追記（トランザクション）でまとめる行数
+BATCH_ROWS = 10000
+
+# 並べ替え時に一度に時刻を変換する行数
+SORT_CHUNK_ROWS = 65536
+
+# レポートに残すエラー行の例の数
+MAX_ERROR_SAMPLES = 20
+
+# 入力形式
+FORMAT_CSV = "csv"
+FORMAT_JSONL = "jsonl"
+JSONL_EXTENSIONS = (".jsonl", ".ndjson", ".json")
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+# 進捗コールバック: (読み込んだバイト数, 全体のバイト数, レポート)
+ProgressCallback = Callable[[int, int, "ImportReport"], None]
+
+
+class ImportReport:
+    """インポート結果の集計"""
+
+    def __init__(self):
+        self.rows = 0
+        self.imported: Dict[str, int] = {mode: 0 for mode in SESSION_COLUMNS}
+        self.duplicates = 0
+        self.invalid = 0
+        self.errors: List[str] = []
+        self.reordered: List[str] = []
+
+    @property
+    def total_imported(self) -> int:
+        return sum(self.imported.values())
+
+    def add_error(self, line: int, message: str) -> None:
+        """不正な行を記録（例は先頭 MAX_ERROR_SAMPLES 件のみ保持）"""
+        self.invalid += 1
+        if len(self.errors) < MAX_ERROR_SAMPLES:
+            self.errors.append(f"{line}行目: {message}")
+
+    def format(self) -> str:
+        """結果を文字列に整形"""
+        imported = ", ".join(f"{mode} {count}" for mode, count in self.imported.items())
+        lines = [
+            f"読み込み {self.rows}行: 取り込み {self.total_imported}件（{imported}）, "
+            f"重複 {self.duplicates}件, 不正 {self.invalid}件"
+        ]
+        if self.reordered:
+            lines.append(f"時刻順に並べ替え: {', '.join(self.reordered)}")
+        lines.extend(f"  {error}" for error in self.errors)
+        if self.invalid > len(self.errors):
+            lines.append(f"  ...ほか {self.invalid - len(self.errors)}件")
+        return "\n".join(lines)
+
+
+def _parse_number(value: Any) -> Optional[float]:
+    """数値に変換（空欄はNone。表計算ソフトの "65.4%" のような表記も受け付ける）"""
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        raise ValueError(f"数値ではありません: {value}")
+    if isinstance(value, (int, float)):
+        return float(value)
+    text = str(value).strip().rstrip("%").replace(",", "")
+    if not text:
+        return None
+    return float(text)
+
+
+def _require(row: Dict[str, Any], name: str) -> float:
+    """必須の数値列"""
+    value = _parse_number(row.get(name))
+    if value is None:
+        raise ValueError(f"{name} がありません")
+    if value != value:
+        raise ValueError(f"{name} が数値ではありません")
+    return value
+
+
+def _parse_count(row: Dict[str, Any], name: str) -> int:
+    """0以上の整数の必須列"""
+    value = _require(row, name)
+    if value < 0 or value != int(value):
+        raise ValueError(f"{name} が0以上の整数ではありません: {row.get(name)}")
+    return int(value)
+
+
+def _parse_timestamp(value: Any) -> datetime:
+    """
+    セッション時刻に変換
+
+    ISO 8601 形式（"2026/01/18 12:00" のような区切りも可）とUNIX時間（秒）を受け付ける。
+    タイムゾーン付きの時刻はローカル時刻に変換する（保存済みの記録はローカル時刻）。
+    """
+    if value is None or (isinstance(value, str) and not value.strip()):
+        raise ValueError("timestamp がありません")
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return datetime.fromtimestamp(value)
+    text = str(value).strip()
+    try:
+        return datetime.fromtimestamp(float(text))
+    except ValueError:
+        pass
+    try:
+        timestamp = datetime.fromisoformat(text.replace("/", "-"))
+    except ValueError:
+        raise ValueError(f"timestamp の形式が不正です: {text}") from None
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone().replace(tzinfo=None)
+    return timestamp
+
+
+def _parse_difficulty(row: Dict[str, Any]) -> str:
+    """difficulty 列を検証（列がない・空欄の場合は段階なし）"""
+    value = row.get("difficulty")
+    if value is None:
+        return NO_TIER
+    tier = str(value).strip().lower()
+    if tier and tier not in TIERS:
+        raise ValueError(f"未対応の difficulty: {value}")
+    return tier
+
+
+def _format_tracking(row: Dict[str, Any], timestamp: datetime) -> List[Any]:
+    """Trackingの行を検証して保存形式に変換"""
+    t0_rate = _require(row, "t0_rate")
+    duration = _require(row, "duration")
+    if not 0.0 <= t0_rate <= 100.0:
+        raise ValueError(f"t0_rate が範囲外です: {t0_rate}")
+    if duration <= 0.0:
+        raise ValueError(f"duration が0以下です: {duration}")
+    return format_tracking_row(timestamp, t0_rate, duration, _parse_difficulty(row))
+
+
+def _format_flicking(row: Dict[str, Any], timestamp: datetime) -> List[Any]:
+    """Flickingの行を検証して保存形式に変換"""
+    accuracy = _require(row, "accuracy")
+    hits = _parse_count(row, "hits")
+    total = _parse_count(row, "total")
+    avg_reaction = _parse_number(row.get("avg_reaction_ms")) or 0.0
+    min_reaction = _parse_number(row.get("min_reaction_ms")) or 0.0
+    if not 0.0 <= accuracy <= 100.0:
+        raise ValueError(f"accuracy が範囲外です: {accuracy}")
+    if hits > total:
+        raise ValueError(f"hits が total を超えています: {hits} > {total}")
+    if avg_reaction < 0.0 or min_reaction < 0.0:
+        raise ValueError("反応速度が負の値です")
+    return format_flicking_row(
+        timestamp, accuracy, avg_reaction, min_reaction, hits, total, _parse_difficulty(row)
+    )
+
+
+# モード別の行変換
+ROW_FORMATTERS: Dict[str, Callable[[Dict[str, Any], datetime], List[Any]]] = {
+    "tracking": _format_tracking,
+    "flicking": _format_flicking,
+}
+
+
+def detect_format(path: str) -> str:
+    """拡張子から入力形式を判定"""
+    if path.lower().endswith(JSONL_EXTENSIONS):
+        return FORMAT_JSONL
+    return FORMAT_CSV
+
+
+def _iter_lines(f, position: List[int]) -> Iterator[str]:
+    """バイナリファイルを1行ずつデコードし、読み込んだバイト数を position[0] に記録"""
+    for raw in f:
+        if position[0] == 0 and raw.startswith(codecs.BOM_UTF8):
+            raw = raw[len(codecs.BOM_UTF8):]
+            position[0] = len(codecs.BOM_UTF8)
+        position[0] += len(raw)
+        yield raw.decode("utf-8", errors="replace")
+
+
+def _iter_records(
+    f, fmt: str, position: List[int], report: ImportReport
+) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """入力を (行番号, 列名→値) の列として読む"""
+    lines = _iter_lines(f, position)
+    if fmt == FORMAT_CSV:
+        reader = csv.DictReader(lines)
+        for row in reader:
+            yield reader.line_num, row
+        return
+
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            report.add_error(line_number, f"JSONとして読めません: {e}")
+            continue
+        if not isinstance(record, dict):
+            report.add_error(line_number, "JSONオブジェクトではありません")
+            continue
+        yield line_number, record
+
+
+def _load_existing_keys(mode: str) -> np.ndarray:
+    """保存済みの記録の時刻（マイクロ秒、昇順・重複なし）"""
+    timestamps = load_columns(mode, ["timestamp"])["timestamp"]
+    return np.unique(timestamps.astype(np.int64))
+
+
+def _to_key(timestamp: datetime) -> int:
+    """重複判定用の時刻（datetime64[us] と同じ基準のマイクロ秒）"""
+    return (timestamp - _EPOCH) // _MICROSECOND
+
+
+def _rollback(path: str, size: int, existed: bool) -> None:
+    """追記前の状態に戻す"""
+    if existed:
+        os.truncate(path, size)
+    elif os.path.exists(path):
+        os.remove(path)
+
+
+def _commit_batch(mode: str, rows: List[List[Any]]) -> None:
+    """
+    1バッチ分を追記（失敗した場合は追記前の長さに戻して例外を送出）
+    """
+    upgrade_csv(mode)
+    path = get_csv_path(mode)
+    existed = os.path.exists(path)
+    size = os.path.getsize(path) if existed else 0
+    try:
+        with open(path, "a", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            if size == 0:
+                writer.writerow(SESSION_COLUMNS[mode])
+            writer.writerows(rows)
+            f.flush()
+            os.fsync(f.fileno())
+    except BaseException:
+        _rollback(path, size, existed)
+        raise
+
+
+def _sort_store(mode: str) -> None:
+    """
+    履歴を時刻順に並べ替える
+
+    各行の開始位置と時刻（1行16バイト）だけを読み、時刻順に行をコピーした
+    一時ファイルで置き換える。
+    """
+    path = get_csv_path(mode)
+    offsets: List[np.ndarray] = []
+    keys: List[np.ndarray] = []
+
+    with open(path, "rb") as f:
+        header = f.readline()
+        chunk_offsets: List[int] = []
+        chunk_times: List[str] = []
+        offset = f.tell()
+        for line in f:
+            if line.strip():
+                chunk_offsets.append(offset)
+                chunk_times.append(line.split(b",", 1)[0].decode("utf-8"))
+            offset += len(line)
+            if len(chunk_offsets) >= SORT_CHUNK_ROWS:
+                offsets.append(np.array(chunk_offsets, dtype=np.int64))
+                keys.append(np.array(chunk_times, dtype="datetime64[us]").astype(np.int64))
+                chunk_offsets, chunk_times = [], []
+        if chunk_offsets:
+            offsets.append(np.array(chunk_offsets, dtype=np.int64))
+            keys.append(np.array(chunk_times, dtype="datetime64[us]").astype(np.int64))
+
+        if not offsets:
+            return
+        all_offsets = np.concatenate(offsets)
+        order = np.argsort(np.concatenate(keys), kind="stable")
+        del offsets, keys
+
+        fd, temp_path = tempfile.mkstemp(prefix=f".{mode}_", suffix=".csv", dir=DATA_DIR)
+        try:
+            with os.fdopen(fd, "wb") as out:
+                out.write(header)
+                for position in all_offsets[order]:
+                    f.seek(int(position))
+                    line = f.readline()
+                    if not line.endswith(b"\n"):
+                        line += b"\r\n"
+                    out.write(line)
+                out.flush()
+                os.fsync(out.fileno())
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+    os.replace(temp_path, path)
+
+
+def import_sessions(
+    path: str,
+    mode: Optional[str] = None,
+    fmt: Optional[str] = None,
+    batch_rows: int = BATCH_ROWS,
+    progress: Optional[ProgressCallback] = None,
+) -> ImportReport:
+    """
+    セッション履歴を一括インポート
+
+    入力の列名は保存形式（tracking.csv / flicking.csv）と同じ。
+    mode 列がない入力は引数 mode のモードとして扱う。
+
+    Args:
+        path: 入力ファイル（CSV または JSON Lines）
+        mode: mode 列がない行のモード（"tracking" / "flicking"）
+        fmt: 入力形式（Noneの場合は拡張子から判定）
+        batch_rows: 1回の追記でまとめる行数
+        progress: バッチの書き込みごとに呼ぶコールバック
+
+    Returns:
+        インポート結果。書き込みエラーの場合は例外を送出する
+        （それまでに書き込んだバッチは残り、失敗したバッチは取り消される）。
+    """
+    if mode is not None and mode not in ROW_FORMATTERS:
+        raise ValueError(f"未対応のモード: {mode}")
+    fmt = fmt or detect_format(path)
+    if fmt not in (FORMAT_CSV, FORMAT_JSONL):
+        raise ValueError(f"未対応の入力形式: {fmt}")
+
+    report = ImportReport()
+    total_bytes = os.path.getsize(path)
+    position = [0]
+
+    keys: Dict[str, np.ndarray] = {}
+    latest: Dict[str, int] = {}
+    batches: Dict[str, List[Tuple[int, List[Any]]]] = {name: [] for name in ROW_FORMATTERS}
+    needs_sort: Dict[str, bool] = {name: False for name in ROW_FORMATTERS}
+
+    def flush(name: str) -> None:
+        """溜まった行の重複を除いて1バッチとして書き込む"""
+        batch = batches[name]
+        if not batch:
+            return
+        if name not in keys:
+            keys[name] = _load_existing_keys(name)
+            latest[name] = int(keys[name][-1]) if len(keys[name]) else np.iinfo(np.int64).min
+
+        batch_keys = np.fromiter((key for key, _ in batch), dtype=np.int64, count=len(batch))
+        # 入力内の重複は最初の行を残す
+        unique_keys, first = np.unique(batch_keys, return_index=True)
+        existing = keys[name]
+        if len(existing):
+            found = np.minimum(np.searchsorted(existing, unique_keys), len(existing) - 1)
+            is_new = existing[found] != unique_keys
+        else:
+            is_new = np.ones(len(unique_keys), dtype=bool)
+        selected = np.sort(first[is_new])
+
+        rows = [batch[i][1] for i in selected]
+        report.duplicates += len(batch) - len(rows)
+        batch.clear()
+        if not rows:
+            return
+
+        _commit_batch(name, rows)
+        report.imported[name] += len(rows)
+
+        new_keys = unique_keys[is_new]
+        if new_keys[0] < latest[name]:
+            needs_sort[name] = True
+        latest[name] = max(latest[name], int(new_keys[-1]))
+        keys[name] = np.union1d(existing, new_keys)
+
+        if progress is not None:
+            progress(position[0], total_bytes, report)
+
+    with open(path, "rb") as f:
+        for line_number, record in _iter_records(f, fmt, position, report):
+            report.rows += 1
+            try:
+                row_mode = str(record.get("mode") or mode or "").strip().lower()
+                if not row_mode:
+                    raise ValueError("mode がありません（--import-mode で指定できます）")
+                formatter = ROW_FORMATTERS.get(row_mode)
+                if formatter is None:
+                    raise ValueError(f"未対応のモード: {row_mode}")
+                timestamp = _parse_timestamp(record.get("timestamp"))
+                row = formatter(record, timestamp)
+            except (ValueError, TypeError, OverflowError, OSError) as e:
+                report.add_error(line_number, str(e))
+                continue
+
+            batches[row_mode].append((_to_key(timestamp), row))
+            if len(batches[row_mode]) >= batch_rows:
+                flush(row_mode)
+
+    for name in ROW_FORMATTERS:
+        flush(name)
+
+    for name, unsorted in needs_sort.items():
+        if unsorted:
+            _sort_store(name)
+            report.reordered.append(name)
+
+    if progress is not None:
+        progress(total_bytes, total_bytes, report)
+    return report
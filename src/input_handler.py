@@ -4,16 +4,27 @@
 
 import pygame
 import numpy as np
-from typing import Tuple, Optional
+from typing import Any, Dict, Tuple, Optional
+from .gamepad_poller import GamepadPoller
 from .settings import (
     MOUSE_SENSITIVITY,
+    MOUSE_RAW_INPUT,
     GAMEPAD_SENSITIVITY,
     GAMEPAD_DEADZONE,
     GAMEPAD_RESPONSE_CURVE,
+    GAMEPAD_DEADZONE_MODE,
+    GAMEPAD_ANTI_DEADZONE,
+    RESPONSE_LUT_SIZE,
+    GAMEPAD_POLL_RATE,
     DeviceType,
+    DeadzoneMode,
 )
 
 
+# 座標（pos）を持つマウスイベント
+MOUSE_POSITION_EVENTS = (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP)
+
+
 class InputHandler:
     """マウスとゲームパッドの入力を統合管理するクラス"""
 
@@ -21,77 +32,439 @@ class InputHandler:
         self.joystick: Optional[pygame.joystick.JoystickType] = None
         self.active_device = DeviceType.MOUSE
         
+        # 接続中のゲームパッド（instance_id -> Joystick）と選択中のID
+        self.devices: Dict[int, pygame.joystick.JoystickType] = {}
+        self.joystick_id: Optional[int] = None
+        # デバイスGUIDごとのゲームパッド設定
+        self.device_profiles: Dict[str, Dict[str, Any]] = {}
+        # 選択デバイスが変わるたびに増える（UIの再同期用）
+        self.device_version = 0
+        
         # マウス設定
         self.mouse_sensitivity = MOUSE_SENSITIVITY
+        self.raw_mouse = MOUSE_RAW_INPUT
+        # マウスの座標からゲーム内座標への倍率（内部解像度を下げて拡大表示する場合は1より大きい）
+        self.mouse_scale = 1.0
         
         # ゲームパッド設定
         self.gamepad_sensitivity = GAMEPAD_SENSITIVITY
         self.deadzone = GAMEPAD_DEADZONE
         self.response_curve = GAMEPAD_RESPONSE_CURVE
+        self.deadzone_mode = GAMEPAD_DEADZONE_MODE
+        self.anti_deadzone = GAMEPAD_ANTI_DEADZONE
+        
+        # 反応曲線ルックアップテーブル（設定変更時にのみ再構築）
+        self._lut_grid = np.linspace(0.0, 1.0, RESPONSE_LUT_SIZE + 1)
+        self._response_lut = np.zeros(RESPONSE_LUT_SIZE + 1)
+        self._velocity_lut = np.zeros(RESPONSE_LUT_SIZE + 1)
+        self._response_table = []
+        self._rebuild_response_lut()
         
         # 入力状態
         self._last_mouse_pos = (0, 0)
         self._mouse_delta = (0, 0)
         self._gamepad_axis = (0.0, 0.0)
         
+        # 相対モード（生のマウス移動量）
+        self._raw_capture = False
+        self._raw_delta_x = 0.0
+        self._raw_delta_y = 0.0
+        
+        # 高頻度ポーリング（有効時はフレーム間のサンプルを積分する）
+        self.poll_rate = GAMEPAD_POLL_RATE
+        self.poller: Optional[GamepadPoller] = None
+        self._gamepad_displacement = (0.0, 0.0)
+        
+        # 仮想デバイス（接続中はマウス・ゲームパッドより優先する）
+        self.virtual_device = None
+        self._virtual_delta = (0.0, 0.0)
+        
         self._init_joystick()
 
     def _init_joystick(self) -> None:
-        """ゲームパッドを初期化"""
+        """ゲームパッドを初期化（起動時に接続済みのデバイスを登録）"""
         pygame.joystick.init()
-        if pygame.joystick.get_count() > 0:
-            self.joystick = pygame.joystick.Joystick(0)
-            self.joystick.init()
-            print(f"ゲームパッド検出: {self.joystick.get_name()}")
-        else:
+        for device_index in range(pygame.joystick.get_count()):
+            self._register_device(device_index)
+        
+        if not self.devices:
             print("ゲームパッドが接続されていません。マウスモードで動作します。")
 
-    def apply_deadzone(self, value: float) -> float:
+    def _register_device(self, device_index: int) -> None:
+        """デバイスを登録（未選択なら選択する）"""
+        try:
+            joystick = pygame.joystick.Joystick(device_index)
+            joystick.init()
+        except pygame.error as e:
+            print(f"ゲームパッド初期化エラー: {e}")
+            return
+        
+        instance_id = joystick.get_instance_id()
+        if instance_id in self.devices:
+            return
+        
+        self.devices[instance_id] = joystick
+        print(f"ゲームパッド検出: {joystick.get_name()}")
+        if self.joystick is None:
+            self._select_device(instance_id)
+
+    def _remove_device(self, instance_id: int) -> None:
+        """切断されたデバイスを登録解除"""
+        joystick = self.devices.pop(instance_id, None)
+        if joystick is None:
+            return
+        
+        print(f"ゲームパッド切断: {joystick.get_name()}")
+        if instance_id == self.joystick_id:
+            self._stop_poller()
+            self._store_device_profile()
+            self.joystick = None
+            self.joystick_id = None
+            self._gamepad_axis = (0.0, 0.0)
+            self._gamepad_displacement = (0.0, 0.0)
+            if self.active_device == DeviceType.GAMEPAD:
+                self.active_device = DeviceType.MOUSE
+            # 残っているデバイスがあれば最後に接続されたものを選択
+            if self.devices:
+                self._select_device(next(reversed(self.devices)))
+            else:
+                self.device_version += 1
+
+    def _select_device(self, instance_id: int) -> None:
+        """入力に使うゲームパッドを切り替え"""
+        if instance_id == self.joystick_id or instance_id not in self.devices:
+            return
+        
+        self._store_device_profile()
+        self.joystick = self.devices[instance_id]
+        self.joystick_id = instance_id
+        self._gamepad_axis = (0.0, 0.0)
+        self._gamepad_displacement = (0.0, 0.0)
+        
+        # デバイスごとの設定があれば適用
+        settings = self.device_profiles.get(self._device_guid(self.joystick))
+        if settings:
+            self.apply_gamepad_settings(settings)
+        
+        self._start_poller()
+        self.device_version += 1
+
+    def _device_guid(self, joystick: pygame.joystick.JoystickType) -> str:
+        """デバイス設定のキー（GUID、取得できない場合は名前）"""
+        try:
+            return joystick.get_guid()
+        except (AttributeError, pygame.error):
+            return joystick.get_name()
+
+    def _store_device_profile(self) -> None:
+        """現在のゲームパッド設定を選択中デバイスの設定として保存"""
+        if self.joystick is not None:
+            self.device_profiles[self._device_guid(self.joystick)] = self.get_gamepad_settings()
+
+    def get_gamepad_settings(self) -> Dict[str, Any]:
+        """現在のゲームパッド設定を取得"""
+        return {
+            "sensitivity": self.gamepad_sensitivity,
+            "deadzone": self.deadzone,
+            "response_curve": self.response_curve,
+            "deadzone_mode": self.deadzone_mode,
+            "anti_deadzone": self.anti_deadzone,
+        }
+
+    def apply_gamepad_settings(self, settings: Dict[str, Any]) -> None:
+        """ゲームパッド設定を適用"""
+        self.set_gamepad_sensitivity(settings.get("sensitivity", self.gamepad_sensitivity))
+        self.set_deadzone(settings.get("deadzone", self.deadzone))
+        self.set_response_curve(settings.get("response_curve", self.response_curve))
+        self.set_deadzone_mode(settings.get("deadzone_mode", self.deadzone_mode))
+        self.set_anti_deadzone(settings.get("anti_deadzone", self.anti_deadzone))
+
+    def get_device_profiles(self) -> Dict[str, Dict[str, Any]]:
+        """デバイスごとの設定を取得（選択中デバイスの現在値を含む）"""
+        self._store_device_profile()
+        return dict(self.device_profiles)
+
+    def _rebuild_response_lut(self) -> None:
         """
-        デッドゾーンと反応曲線を適用
+        デッドゾーンと反応曲線のルックアップテーブルを再構築
+        
+        入力の大きさ m (0.0 - 1.0) に対する出力:
+            m < d:  0
+            m >= d: a + (1 - a) * ((m - d) / (1 - d)) ^ n
+        （d: デッドゾーン, a: アンチデッドゾーン, n: 反応曲線）
         
-        計算式: v_output = sign(v_input) * ((max(0, |v_input| - d) / (1 - d)) ^ n) * s
+        感度を掛けた速度テーブル（ピクセル/秒）も同時に作成する。
         """
-        if abs(value) < self.deadzone:
+        magnitude = self._lut_grid
+        normalized = np.clip((magnitude - self.deadzone) / (1.0 - self.deadzone), 0.0, 1.0)
+        curved = self.anti_deadzone + (1.0 - self.anti_deadzone) * normalized ** self.response_curve
+        # デッドゾーン内は参照時に0にする（テーブル上は a のまま残し、d をまたぐ区間の補間で a を下回らないようにする）
+        self._response_lut = curved
+        self._velocity_lut = self._response_lut * self.gamepad_sensitivity
+        # スカラー参照用（ndarrayの要素アクセスより高速）
+        self._response_table = self._response_lut.tolist()
+
+    def _lookup(self, magnitude: float) -> float:
+        """ルックアップテーブルを線形補間して参照"""
+        # デッドゾーンを含む格子の区間で補間すると、アンチデッドゾーン分の出力が漏れるため
+        if magnitude < self.deadzone:
             return 0.0
+        position = magnitude * RESPONSE_LUT_SIZE
+        if position >= RESPONSE_LUT_SIZE:
+            return self._response_table[RESPONSE_LUT_SIZE]
+        index = int(position)
+        low = self._response_table[index]
+        return low + (self._response_table[index + 1] - low) * (position - index)
+
+    def apply_deadzone(self, value: float) -> float:
+        """
+        1軸にデッドゾーンと反応曲線を適用（軸ごと）
         
-        sign = 1.0 if value >= 0 else -1.0
-        normalized = (abs(value) - self.deadzone) / (1.0 - self.deadzone)
+        計算式: v_output = sign(v_input) * ((max(0, |v_input| - d) / (1 - d)) ^ n)
+        （アンチデッドゾーン a > 0 の場合は a + (1 - a) * (...) ^ n）
+        """
+        if value >= 0:
+            return self._lookup(value)
+        return -self._lookup(-value)
+
+    def apply_response(self, x: float, y: float) -> Tuple[float, float]:
+        """
+        スティック入力 (x, y) にデッドゾーンと反応曲線を適用
         
-        # 反応曲線を適用
-        curved = normalized ** self.response_curve
+        radial: スティックの倒し量（ベクトルの大きさ）に適用し方向を保つ
+        axial: 各軸に独立して適用
+        """
+        if self.deadzone_mode == DeadzoneMode.AXIAL:
+            return (self.apply_deadzone(x), self.apply_deadzone(y))
         
-        return sign * curved
+        magnitude = (x * x + y * y) ** 0.5
+        if magnitude <= 0.0:
+            return (0.0, 0.0)
+        scale = self._lookup(min(magnitude, 1.0)) / magnitude
+        return (x * scale, y * scale)
+
+    def _interp_lut(self, magnitude: np.ndarray, lut: np.ndarray) -> np.ndarray:
+        """ルックアップテーブルを配列で補間して参照（デッドゾーン内は0）"""
+        return np.where(magnitude < self.deadzone, 0.0, np.interp(magnitude, self._lut_grid, lut))
+
+    def _apply_lut_batch(
+        self, xs: np.ndarray, ys: np.ndarray, lut: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """配列入力にルックアップテーブルを適用"""
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        
+        if self.deadzone_mode == DeadzoneMode.AXIAL:
+            out_x = np.copysign(self._interp_lut(np.abs(xs), lut), xs)
+            out_y = np.copysign(self._interp_lut(np.abs(ys), lut), ys)
+            return (out_x, out_y)
+        
+        magnitude = np.hypot(xs, ys)
+        curved = self._interp_lut(np.minimum(magnitude, 1.0), lut)
+        scale = np.divide(curved, magnitude, out=np.zeros_like(magnitude), where=magnitude > 0)
+        return (xs * scale, ys * scale)
+
+    def apply_response_batch(self, xs: np.ndarray, ys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        複数サンプルにまとめてデッドゾーンと反応曲線を適用
+        
+        Args:
+            xs, ys: スティック入力の配列（-1.0 - 1.0）
+            
+        Returns:
+            (x, y) 正規化済み出力の配列
+        """
+        return self._apply_lut_batch(xs, ys, self._response_lut)
+
+    def get_velocity_batch(self, xs: np.ndarray, ys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        複数サンプルをまとめてカーソル速度（ピクセル/秒）に変換
+        
+        Args:
+            xs, ys: スティック入力の配列（-1.0 - 1.0）
+        """
+        return self._apply_lut_batch(xs, ys, self._velocity_lut)
+
+    def set_mouse_scale(self, scale: float) -> None:
+        """
+        マウスの座標からゲーム内座標への倍率を設定（内部解像度を下げて拡大表示する場合）
+
+        Args:
+            scale: レンダラーの input_scale
+        """
+        self.mouse_scale = scale
+        self._last_mouse_pos = self.get_mouse_position()
+
+    def map_mouse_event(self, event: pygame.event.Event) -> None:
+        """マウスイベントの座標・移動量をゲーム内座標に変換（シーンに渡す前に呼ぶ）"""
+        if self.mouse_scale == 1.0 or event.type not in MOUSE_POSITION_EVENTS:
+            return
+        scale = self.mouse_scale
+        event.pos = (int(event.pos[0] * scale), int(event.pos[1] * scale))
+        if event.type == pygame.MOUSEMOTION:
+            event.rel = (event.rel[0] * scale, event.rel[1] * scale)
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        """入力イベントを処理（メインループから全イベントを渡す）"""
+        if event.type == pygame.MOUSEMOTION and self._raw_capture:
+            # OSのポインタ加速・画面端の制限を受けない相対移動量を蓄積
+            self._raw_delta_x += event.rel[0]
+            self._raw_delta_y += event.rel[1]
+        elif event.type == pygame.JOYDEVICEADDED:
+            self._register_device(event.device_index)
+        elif event.type == pygame.JOYDEVICEREMOVED:
+            self._remove_device(event.instance_id)
+        elif event.type == pygame.JOYAXISMOTION:
+            # 最後に操作されたデバイスを選択（イベント駆動のため台数に依存しない）
+            if event.instance_id != self.joystick_id and abs(event.value) > self.deadzone:
+                self._select_device(event.instance_id)
+        elif event.type == pygame.JOYBUTTONDOWN:
+            if event.instance_id != self.joystick_id:
+                self._select_device(event.instance_id)
+
+    def begin_raw_capture(self) -> None:
+        """相対モードでマウスを占有（生入力が有効な場合のみ）"""
+        if not self.raw_mouse or self._raw_capture:
+            return
+        self._raw_capture = True
+        self._raw_delta_x = 0.0
+        self._raw_delta_y = 0.0
+        self.flush_pending_input()
+        if hasattr(pygame.mouse, "set_relative_mode"):
+            pygame.mouse.set_relative_mode(True)
+        else:
+            # 非表示カーソル + グラブでSDLが相対モードになる
+            pygame.event.set_grab(True)
+
+    def flush_pending_input(self) -> None:
+        """
+        update() を呼ばなかった間に溜まった入力を捨てる
+        
+        ランチャーや統計画面は update() を呼ばないため、ゲームシーンに入る際に
+        その間のスティックのサンプルをまとめて積分しないようにする。
+        """
+        if self.poller:
+            self.poller.flush()
+
+    def end_raw_capture(self) -> None:
+        """相対モードを解除"""
+        if not self._raw_capture:
+            return
+        self._raw_capture = False
+        if hasattr(pygame.mouse, "set_relative_mode"):
+            pygame.mouse.set_relative_mode(False)
+        else:
+            pygame.event.set_grab(False)
+        # 解除時のポインタ位置を基準にし直す
+        self._last_mouse_pos = self.get_mouse_position()
+
+    def is_raw_capture_active(self) -> bool:
+        """相対モードでマウスを占有中かどうか"""
+        return self._raw_capture
+
+    def attach_virtual_device(self, device) -> None:
+        """
+        仮想デバイスを接続（ボット・自動テスト用）
+        
+        接続中はマウスとゲームパッドを読まず、仮想デバイスの入力だけを使う。
+        
+        Args:
+            device: read_motion() -> (dx, dy) と is_pressed() -> bool を持つオブジェクト
+        """
+        self.virtual_device = device
+        self._virtual_delta = (0.0, 0.0)
+        self.active_device = DeviceType.BOT
+
+    def detach_virtual_device(self) -> None:
+        """仮想デバイスを切断してマウスモードに戻す"""
+        self.virtual_device = None
+        self._virtual_delta = (0.0, 0.0)
+        self.active_device = DeviceType.MOUSE
+        self._last_mouse_pos = self.get_mouse_position()
+
+    def is_primary_pressed(self) -> bool:
+        """決定ボタン（マウス左ボタン、仮想デバイス接続中はそのボタン）が押されているか"""
+        if self.virtual_device is not None:
+            return self.virtual_device.is_pressed()
+        return pygame.mouse.get_pressed()[0]
+
+    def is_cursor_detached(self) -> bool:
+        """カーソルがOSのポインタ位置から独立しているか（相対モード・仮想デバイス接続中）"""
+        return self._raw_capture or self.virtual_device is not None
 
     def update(self) -> None:
         """入力状態を更新（毎フレーム呼び出し）"""
+        if self.virtual_device is not None:
+            self._virtual_delta = self.virtual_device.read_motion()
+            self.active_device = DeviceType.BOT
+            return
+        
         # マウスの相対移動を取得
-        current_mouse_pos = pygame.mouse.get_pos()
-        self._mouse_delta = (
-            current_mouse_pos[0] - self._last_mouse_pos[0],
-            current_mouse_pos[1] - self._last_mouse_pos[1],
-        )
-        self._last_mouse_pos = current_mouse_pos
+        if self._raw_capture:
+            self._mouse_delta = (self._raw_delta_x, self._raw_delta_y)
+            self._raw_delta_x = 0.0
+            self._raw_delta_y = 0.0
+        else:
+            current_mouse_pos = self.get_mouse_position()
+            self._mouse_delta = (
+                current_mouse_pos[0] - self._last_mouse_pos[0],
+                current_mouse_pos[1] - self._last_mouse_pos[1],
+            )
+            self._last_mouse_pos = current_mouse_pos
         
         # マウスが動いたらマウスモードに切り替え
         if abs(self._mouse_delta[0]) > 0 or abs(self._mouse_delta[1]) > 0:
             self.active_device = DeviceType.MOUSE
         
         # ゲームパッドの軸入力を取得
-        if self.joystick:
+        if self.poller and self.poller.is_running():
+            self._integrate_poller_samples()
+        elif self.joystick:
             raw_x = self.joystick.get_axis(0)  # 左スティック X軸
             raw_y = self.joystick.get_axis(1)  # 左スティック Y軸
             
-            # デッドゾーン適用
-            self._gamepad_axis = (
-                self.apply_deadzone(raw_x),
-                self.apply_deadzone(raw_y),
-            )
+            # デッドゾーン・反応曲線適用
+            self._gamepad_axis = self.apply_response(raw_x, raw_y)
             
             # パッドが動いたらパッドモードに切り替え
             if abs(self._gamepad_axis[0]) > 0.01 or abs(self._gamepad_axis[1]) > 0.01:
                 self.active_device = DeviceType.GAMEPAD
 
+    def _integrate_poller_samples(self) -> None:
+        """ポーリングスレッドのサンプルを反応曲線に通して積分"""
+        durations, xs, ys = self.poller.drain()
+        if len(durations) == 0:
+            self._gamepad_displacement = (0.0, 0.0)
+            return
+        
+        vx, vy = self.get_velocity_batch(xs, ys)
+        self._gamepad_displacement = (
+            float(np.dot(vx, durations)),
+            float(np.dot(vy, durations)),
+        )
+        self._gamepad_axis = self.apply_response(xs[-1], ys[-1])
+        
+        # 期間中に一度でもパッドが動いたらパッドモードに切り替え
+        if np.max(np.abs(vx) + np.abs(vy)) > 0.01 * self.gamepad_sensitivity:
+            self.active_device = DeviceType.GAMEPAD
+
+    def _start_poller(self) -> None:
+        """ポーリングスレッドを開始（設定とデバイスがある場合のみ）"""
+        self._stop_poller()
+        if self.joystick and self.poll_rate > 0:
+            self.poller = GamepadPoller(self.joystick, self.poll_rate)
+            self.poller.start()
+
+    def _stop_poller(self) -> None:
+        """ポーリングスレッドを停止"""
+        if self.poller:
+            self.poller.stop()
+            self.poller = None
+
+    def shutdown(self) -> None:
+        """終了処理"""
+        self._stop_poller()
+
     def get_cursor_velocity(self, dt: float) -> Tuple[float, float]:
         """
         カーソルの移動量を取得
@@ -102,12 +475,18 @@ class InputHandler:
         Returns:
             (dx, dy) の移動量
         """
-        if self.active_device == DeviceType.MOUSE:
+        if self.active_device == DeviceType.BOT:
+            # 仮想デバイスはピクセル単位の移動量をそのまま使う
+            return self._virtual_delta
+        elif self.active_device == DeviceType.MOUSE:
             # マウスの場合は相対移動に感度を適用
             return (
                 self._mouse_delta[0] * self.mouse_sensitivity,
                 self._mouse_delta[1] * self.mouse_sensitivity,
             )
+        elif self.poller and self.poller.is_running():
+            # ポーリング有効時はサンプルごとの保持時間で積分済み（dtに依存しない）
+            return self._gamepad_displacement
         else:
             # ゲームパッドの場合は速度ベースで移動
             return (
@@ -116,8 +495,11 @@ class InputHandler:
             )
 
     def get_mouse_position(self) -> Tuple[int, int]:
-        """現在のマウス位置を取得"""
-        return pygame.mouse.get_pos()
+        """現在のマウス位置を取得（ゲーム内座標）"""
+        x, y = pygame.mouse.get_pos()
+        if self.mouse_scale == 1.0:
+            return (x, y)
+        return (int(x * self.mouse_scale), int(y * self.mouse_scale))
 
     def get_active_device(self) -> str:
         """現在アクティブなデバイスタイプを取得"""
@@ -127,18 +509,46 @@ class InputHandler:
         """ゲームパッドが接続されているか"""
         return self.joystick is not None
 
+    def get_gamepad_name(self) -> Optional[str]:
+        """選択中のゲームパッド名を取得"""
+        return self.joystick.get_name() if self.joystick is not None else None
+
     def set_deadzone(self, value: float) -> None:
         """デッドゾーンを設定（0.0 - 0.3）"""
         self.deadzone = max(0.0, min(0.3, value))
+        self._rebuild_response_lut()
 
     def set_response_curve(self, value: float) -> None:
         """反応曲線の指数を設定（1.0 - 3.0）"""
         self.response_curve = max(1.0, min(3.0, value))
+        self._rebuild_response_lut()
+
+    def set_deadzone_mode(self, mode: str) -> None:
+        """デッドゾーン形状を設定（radial / axial）"""
+        if mode in (DeadzoneMode.RADIAL, DeadzoneMode.AXIAL):
+            self.deadzone_mode = mode
+
+    def set_anti_deadzone(self, value: float) -> None:
+        """アンチデッドゾーンを設定（0.0 - 0.5）"""
+        self.anti_deadzone = max(0.0, min(0.5, value))
+        self._rebuild_response_lut()
 
     def set_gamepad_sensitivity(self, value: float) -> None:
         """ゲームパッド感度を設定"""
         self.gamepad_sensitivity = max(100.0, min(1500.0, value))
+        self._rebuild_response_lut()
+
+    def set_poll_rate(self, value: float) -> None:
+        """ゲームパッドのポーリング周波数を設定（0 = 無効, 500 - 1000 Hz）"""
+        self.poll_rate = 0 if value <= 0 else max(500.0, min(1000.0, value))
+        self._start_poller()
 
     def set_mouse_sensitivity(self, value: float) -> None:
         """マウス感度を設定"""
         self.mouse_sensitivity = max(0.1, min(5.0, value))
+
+    def set_raw_mouse(self, enabled: bool) -> None:
+        """セッション中の生マウス入力（相対モード）を設定"""
+        self.raw_mouse = bool(enabled)
+        if not self.raw_mouse:
+            self.end_raw_capture()
@@ -0,0 +1,239 @@
+"""
+ライブテレメトリバス（共有メモリ）モジュール
+
+ゲームが毎フレームの状態（シーン・カーソル位置・ターゲット・T0率・反応時間など）を
+固定長のスナップショットとして共有メモリ上のリングバッファに書き込み、
+別プロセスのダッシュボードや配信用オーバーレイがロックなしで読み出す。
+
+共有メモリのレイアウト（リトルエンディアン）:
+
+    ヘッダー（HEADER_DTYPE, 32バイト） + スナップショット（SNAPSHOT_DTYPE） × 容量
+
+n 番目（0始まり）のスナップショットは n % 容量 のスロットに書き込む。
+各スロットの seq はシーケンスロックで、書き込み中は 2n+1、書き込み完了後は 2n+2 になる。
+読み出し側はスロットをコピーした前後で seq が 2n+2 のままであることを確認し、
+書き込み途中や上書き済みのスナップショットを捨てる。
+ヘッダーの write_seq は書き込み完了したスナップショット数。
+"""
+
+import os
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Optional
+
+import numpy as np
+
+
+# 共有メモリの既定の名前
+DEFAULT_BUS_NAME = "pyaim_live"
+
+# リングバッファの容量（スナップショット数）
+DEFAULT_CAPACITY = 256
+
+BUS_MAGIC = b"PYAIMBUS"
+BUS_VERSION = 1
+
+HEADER_DTYPE = np.dtype([
+    ("magic", "S8"),
+    ("version", "<u4"),
+    ("record_size", "<u4"),     # SNAPSHOT_DTYPE.itemsize（形式の確認用）
+    ("capacity", "<u4"),
+    ("_reserved", "<u4"),
+    ("write_seq", "<u8"),       # 書き込み完了したスナップショット数
+])
+
+# 1フレーム分のスナップショット
+SNAPSHOT_DTYPE = np.dtype([
+    ("seq", "<u8"),                  # シーケンスロック（2n+1: 書き込み中, 2n+2: 完了）
+    ("frame", "<u8"),                # フレーム番号
+    ("time_ns", "<i8"),              # 公開時刻（perf_counter_ns。同じマシンのプロセス間で共通）
+    ("cursor_x", "<f4"),
+    ("cursor_y", "<f4"),
+    ("target_x", "<f4"),             # ターゲット（flags の BUS_TARGET_VISIBLE が立っている場合のみ有効）
+    ("target_y", "<f4"),
+    ("target_r", "<f4"),
+    ("session_time", "<f4"),         # セッション開始からの経過時間（秒）
+    ("remaining", "<f4"),            # Tracking: 残り時間（秒）
+    ("t0_rate", "<f4"),              # Tracking: セッション全体のT0率（%）
+    ("t0_1s", "<f4"),                # Tracking: 直近1秒のT0率（%）
+    ("t0_5s", "<f4"),                # Tracking: 直近5秒のT0率（%）
+    ("last_reaction_ms", "<f4"),     # Flicking: 直前のヒットの反応時間
+    ("mean_reaction_ms", "<f4"),     # Flicking: セッションの平均反応時間
+    ("hits", "<u4"),                 # Flicking: ヒット数
+    ("shots", "<u4"),                # Flicking: クリック数
+    ("scene", "u1"),                 # SCENE_CODES
+    ("device", "u1"),                # 入力デバイス（shot_log.DEVICE_CODES と同じ値）
+    ("flags", "u1"),
+    ("_reserved", "V5"),
+])
+
+# scene の値
+SCENE_CODES = {"launcher": 1, "tracking": 2, "flicking": 3, "stats": 4, "replay": 5}
+
+# flags のビット
+BUS_SESSION_ACTIVE = 0x01
+BUS_ON_TARGET = 0x02
+BUS_TARGET_VISIBLE = 0x04
+
+
+def _shared_memory_size(capacity: int) -> int:
+    return HEADER_DTYPE.itemsize + SNAPSHOT_DTYPE.itemsize * capacity
+
+
+class LiveTelemetryBus:
+    """
+    スナップショットを共有メモリに書き込むクラス（ゲーム側、1プロセスのみ）
+
+    毎フレーム begin() で得たスナップショットに値を書き込み、publish() で公開する。
+    """
+
+    def __init__(self, name: str = DEFAULT_BUS_NAME, capacity: int = DEFAULT_CAPACITY):
+        """
+        Args:
+            name: 共有メモリの名前
+            capacity: リングバッファの容量（スナップショット数）
+        """
+        size = _shared_memory_size(capacity)
+        try:
+            self._shm = SharedMemory(name=name, create=True, size=size)
+        except FileExistsError:
+            # 前回異常終了したときの共有メモリを作り直す
+            stale = SharedMemory(name=name)
+            stale.close()
+            stale.unlink()
+            self._shm = SharedMemory(name=name, create=True, size=size)
+        self.name = name
+        self.capacity = capacity
+
+        self._header = np.ndarray((), dtype=HEADER_DTYPE, buffer=self._shm.buf)
+        self._ring = np.ndarray(
+            (capacity,), dtype=SNAPSHOT_DTYPE, buffer=self._shm.buf, offset=HEADER_DTYPE.itemsize
+        )
+        self._ring[:] = np.zeros(capacity, dtype=SNAPSHOT_DTYPE)
+        self._header[()] = (BUS_MAGIC, BUS_VERSION, SNAPSHOT_DTYPE.itemsize, capacity, 0, 0)
+
+        # 書き込み前のスナップショット（毎フレーム0に戻して使う）
+        self._staging = np.zeros(1, dtype=SNAPSHOT_DTYPE)
+        self._empty = np.zeros(1, dtype=SNAPSHOT_DTYPE)[0]
+        self.snapshot = self._staging[0]
+        self._count = 0
+
+    def begin(self) -> np.void:
+        """次のスナップショットを0に戻して返す（フィールドへの代入で値を設定する）"""
+        self._staging[0] = self._empty
+        return self.snapshot
+
+    def publish(self) -> None:
+        """begin() 以降に設定したスナップショットを公開"""
+        n = self._count
+        index = n % self.capacity
+        seqs = self._ring["seq"]
+        # 書き込み中であることを示してから本体を書き、最後に完了を示す
+        seqs[index] = 2 * n + 1
+        self._staging["seq"] = 2 * n + 1
+        self._ring[index] = self.snapshot
+        seqs[index] = 2 * n + 2
+        self._count = n + 1
+        self._header["write_seq"] = self._count
+
+    def close(self) -> None:
+        """共有メモリを解放して削除"""
+        if self._shm is None:
+            return
+        del self._header, self._ring
+        self._shm.close()
+        try:
+            self._shm.unlink()
+        except FileNotFoundError:
+            pass
+        self._shm = None
+
+
+class LiveTelemetryReader:
+    """
+    共有メモリからスナップショットを読み出すクラス（任意の数のプロセスで使える）
+
+    ゲームが起動していない場合は FileNotFoundError、形式が違う場合は ValueError を送出する。
+    """
+
+    def __init__(self, name: str = DEFAULT_BUS_NAME):
+        self._shm = self._attach(name)
+        header = np.ndarray((), dtype=HEADER_DTYPE, buffer=self._shm.buf)
+        if (
+            header["magic"] != BUS_MAGIC
+            or header["version"] != BUS_VERSION
+            or header["record_size"] != SNAPSHOT_DTYPE.itemsize
+        ):
+            del header
+            self._shm.close()
+            raise ValueError("ライブテレメトリの形式が異なります")
+
+        self.name = name
+        self.capacity = int(header["capacity"])
+        self._header = header
+        self._ring = np.ndarray(
+            (self.capacity,), dtype=SNAPSHOT_DTYPE, buffer=self._shm.buf, offset=HEADER_DTYPE.itemsize
+        )
+        # 次に読むスナップショットの番号
+        self._next = 0
+
+    @staticmethod
+    def _attach(name: str) -> SharedMemory:
+        """
+        既存の共有メモリに接続
+
+        読み出し側の終了時に共有メモリが削除されないよう、リソーストラッカーの管理から外す。
+        """
+        try:
+            return SharedMemory(name=name, track=False)
+        except TypeError:
+            # Python 3.12 以前
+            shm = SharedMemory(name=name)
+            if os.name == "posix":
+                resource_tracker.unregister(shm._name, "shared_memory")
+            return shm
+
+    @property
+    def write_seq(self) -> int:
+        """ゲームが公開したスナップショット数"""
+        return int(self._header["write_seq"])
+
+    def latest(self) -> Optional[np.void]:
+        """最新のスナップショットのコピー（まだない・読み出し中に上書きされた場合はNone）"""
+        for _ in range(3):
+            count = self.write_seq
+            if count == 0:
+                return None
+            index = (count - 1) % self.capacity
+            expected = 2 * count
+            snapshot = self._ring[index].copy()
+            if snapshot["seq"] == expected and self._ring["seq"][index] == expected:
+                return snapshot
+        return None
+
+    def read_new(self) -> np.ndarray:
+        """
+        前回以降に公開されたスナップショットを古い順に読み出す
+
+        読み出しが遅れて上書きされた分は読み飛ばす。
+        """
+        count = self.write_seq
+        start = max(self._next, count - self.capacity)
+        self._next = count
+        if count <= start:
+            return np.zeros(0, dtype=SNAPSHOT_DTYPE)
+
+        numbers = np.arange(start, count, dtype=np.uint64)
+        indices = (numbers % self.capacity).astype(np.intp)
+        expected = 2 * numbers + 2
+        snapshots = self._ring[indices]
+        valid = (snapshots["seq"] == expected) & (self._ring["seq"][indices] == expected)
+        return snapshots[valid]
+
+    def close(self) -> None:
+        """接続を閉じる（共有メモリは削除しない）"""
+        if self._shm is None:
+            return
+        del self._header, self._ring
+        self._shm.close()
+        self._shm = None
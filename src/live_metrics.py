@@ -0,0 +1,168 @@
+"""
+Trackingのリアルタイム指標モジュール
+
+セッション中の毎フレームの値を固定長のNumPyリングバッファに入れ、
+時間窓（直近1秒・5秒）の移動合計を保持して次の指標を1フレームO(1)で求める。
+
+- 直近1秒・5秒のT0率
+- ターゲット中心までの平均距離
+- 遅れ / 行き過ぎ: カーソルとターゲットのずれのうち、ターゲットの進行方向の成分。
+  後ろ側なら遅れ、前側なら行き過ぎ（いずれも平均ピクセル）
+
+値はフレーム時間で重み付けするため、フレームレートが変わっても同じ意味になる。
+"""
+
+import math
+from typing import Tuple
+
+import numpy as np
+
+
+# 各指標の時間窓（秒）
+SHORT_WINDOW = 1.0
+LONG_WINDOW = 5.0
+
+# リングバッファの容量を決める想定最大フレームレート
+MAX_FPS = 1000
+
+# 移動合計の誤差を消すため、この回数の追加ごとにバッファから合計を再計算する
+RESYNC_INTERVAL = 4096
+
+# 列
+COL_ON_TARGET = 0
+COL_DISTANCE = 1
+COL_LAG = 2
+COL_OVERSHOOT = 3
+
+
+class RollingWindow:
+    """直近 seconds 秒の値を保持し、列ごとの時間重み付き合計を管理するリングバッファ"""
+
+    def __init__(self, seconds: float, columns: int, capacity: int):
+        """
+        Args:
+            seconds: 時間窓（秒）
+            columns: 値の列数
+            capacity: 保持できる最大フレーム数（超えた場合は古いものから捨てる）
+        """
+        self.seconds = seconds
+        self._dt = np.zeros(capacity)
+        self._values = np.zeros((capacity, columns))  # 値 × dt
+        self._sums = np.zeros(columns)
+        self._dt_sum = 0.0
+        self._start = 0
+        self._count = 0
+        self._pushes = 0
+
+    def reset(self) -> None:
+        """空にする"""
+        self._sums[:] = 0.0
+        self._dt_sum = 0.0
+        self._start = 0
+        self._count = 0
+
+    def push(self, dt: float, values: Tuple[float, ...]) -> None:
+        """1フレーム分の値を追加し、時間窓から外れた分を取り除く"""
+        capacity = len(self._dt)
+        if self._count == capacity:
+            self._evict()
+
+        index = (self._start + self._count) % capacity
+        row = self._values[index]
+        row[:] = values
+        row *= dt
+        self._dt[index] = dt
+        self._sums += row
+        self._dt_sum += dt
+        self._count += 1
+
+        # 窓の長さを保ったまま取り除ける古いフレームを捨てる（各フレーム1回なので償却O(1)）
+        while self._count > 1 and self._dt_sum - self._dt[self._start] >= self.seconds:
+            self._evict()
+
+        self._pushes += 1
+        if self._pushes % RESYNC_INTERVAL == 0:
+            self._resync()
+
+    def _evict(self) -> None:
+        """最も古いフレームを取り除く"""
+        start = self._start
+        self._sums -= self._values[start]
+        self._dt_sum -= self._dt[start]
+        self._start = (start + 1) % len(self._dt)
+        self._count -= 1
+
+    def _resync(self) -> None:
+        """移動合計をバッファから計算し直す（浮動小数点の誤差の蓄積を防ぐ）"""
+        indices = (self._start + np.arange(self._count)) % len(self._dt)
+        self._sums[:] = self._values[indices].sum(axis=0)
+        self._dt_sum = float(self._dt[indices].sum())
+
+    def mean(self, column: int) -> float:
+        """列の時間重み付き平均（空の場合は0）"""
+        if self._dt_sum <= 0.0:
+            return 0.0
+        return float(self._sums[column]) / self._dt_sum
+
+    def duration(self) -> float:
+        """保持している時間（秒）"""
+        return self._dt_sum
+
+
+class LiveTrackingMetrics:
+    """Trackingセッション中のリアルタイム指標"""
+
+    def __init__(self, max_fps: int = MAX_FPS):
+        self.short = RollingWindow(SHORT_WINDOW, 4, int(SHORT_WINDOW * max_fps) + 1)
+        self.long = RollingWindow(LONG_WINDOW, 1, int(LONG_WINDOW * max_fps) + 1)
+
+    def reset(self) -> None:
+        """セッション開始時に呼ぶ"""
+        self.short.reset()
+        self.long.reset()
+
+    def update(
+        self,
+        dt: float,
+        cursor_x: float,
+        cursor_y: float,
+        target_x: float,
+        target_y: float,
+        target_r: float,
+        target_vx: float,
+        target_vy: float,
+    ) -> None:
+        """1フレーム分を追加"""
+        if dt <= 0.0:
+            return
+        dx = cursor_x - target_x
+        dy = cursor_y - target_y
+        distance = math.hypot(dx, dy)
+        on_target = 1.0 if distance <= target_r else 0.0
+
+        # ターゲットの進行方向へのずれ（負: 遅れ, 正: 行き過ぎ）
+        speed = math.hypot(target_vx, target_vy)
+        along = (dx * target_vx + dy * target_vy) / speed if speed > 0.0 else 0.0
+
+        self.short.push(dt, (on_target, distance, max(0.0, -along), max(0.0, along)))
+        self.long.push(dt, (on_target,))
+
+    def t0_short(self) -> float:
+        """直近1秒のT0率（%）"""
+        return self.short.mean(COL_ON_TARGET) * 100.0
+
+    def t0_long(self) -> float:
+        """直近5秒のT0率（%）"""
+        return self.long.mean(COL_ON_TARGET) * 100.0
+
+    def mean_distance(self) -> float:
+        """直近1秒のターゲット中心までの平均距離（ピクセル）"""
+        return self.short.mean(COL_DISTANCE)
+
+    def lag(self) -> float:
+        """直近1秒の平均の遅れ（ピクセル）"""
+        return self.short.mean(COL_LAG)
+
+    def overshoot(self) -> float:
+        """直近1秒の平均の行き過ぎ（ピクセル）"""
+        return self.short.mean(COL_OVERSHOOT)
@@ -7,9 +7,17 @@ import os
 from typing import Dict, Any, Optional
 from .settings import (
     MOUSE_SENSITIVITY,
+    MOUSE_RAW_INPUT,
+    CURSOR_HARDWARE,
     GAMEPAD_SENSITIVITY,
     GAMEPAD_DEADZONE,
     GAMEPAD_RESPONSE_CURVE,
+    GAMEPAD_DEADZONE_MODE,
+    GAMEPAD_ANTI_DEADZONE,
+    GAMEPAD_POLL_RATE,
+    GRAPHICS_PRESETS,
+    GRAPHICS_FULLSCREEN,
+    DEFAULT_GRAPHICS_PRESET,
 )
 
 
@@ -22,11 +30,16 @@ def get_default_profile() -> Dict[str, Any]:
     return {
         "mouse": {
             "sensitivity": MOUSE_SENSITIVITY,
+            "raw_input": MOUSE_RAW_INPUT,
+            "hardware_cursor": CURSOR_HARDWARE,
         },
         "gamepad": {
             "sensitivity": GAMEPAD_SENSITIVITY,
             "deadzone": GAMEPAD_DEADZONE,
             "response_curve": GAMEPAD_RESPONSE_CURVE,
+            "deadzone_mode": GAMEPAD_DEADZONE_MODE,
+            "anti_deadzone": GAMEPAD_ANTI_DEADZONE,
+            "poll_rate_hz": GAMEPAD_POLL_RATE,
         }
     }
 
@@ -84,20 +97,64 @@ def apply_profile_to_input_handler(profile: Dict[str, Any], input_handler) -> No
     gamepad = profile.get("gamepad", {})
     
     input_handler.set_mouse_sensitivity(mouse.get("sensitivity", MOUSE_SENSITIVITY))
+    input_handler.set_raw_mouse(mouse.get("raw_input", MOUSE_RAW_INPUT))
     input_handler.set_gamepad_sensitivity(gamepad.get("sensitivity", GAMEPAD_SENSITIVITY))
     input_handler.set_deadzone(gamepad.get("deadzone", GAMEPAD_DEADZONE))
     input_handler.set_response_curve(gamepad.get("response_curve", GAMEPAD_RESPONSE_CURVE))
+    input_handler.set_deadzone_mode(gamepad.get("deadzone_mode", GAMEPAD_DEADZONE_MODE))
+    input_handler.set_anti_deadzone(gamepad.get("anti_deadzone", GAMEPAD_ANTI_DEADZONE))
+    input_handler.set_poll_rate(gamepad.get("poll_rate_hz", GAMEPAD_POLL_RATE))
+    
+    # デバイスごとの設定（選択中デバイスの設定があれば共通設定より優先）
+    input_handler.device_profiles = dict(profile.get("gamepad_devices", {}))
+    if input_handler.joystick is not None:
+        settings = input_handler.device_profiles.get(
+            input_handler._device_guid(input_handler.joystick)
+        )
+        if settings:
+            input_handler.apply_gamepad_settings(settings)
 
 
-def create_profile_from_input_handler(input_handler) -> Dict[str, Any]:
-    """InputHandlerから現在の設定をプロファイルとして作成"""
-    return {
+def apply_profile_to_cursor(profile: Dict[str, Any], cursor) -> None:
+    """プロファイルをCursorに適用"""
+    cursor.set_hardware(profile.get("mouse", {}).get("hardware_cursor", CURSOR_HARDWARE))
+
+
+def get_graphics_settings(profile: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    プロファイルの "graphics" セクションから画質設定を解決
+
+    プリセットの値を基準に、セクション内に同名のキーがあればそれで上書きする。
+    全画面表示はプリセットに含まれないため、セクションの "fullscreen" だけで決まる。
+    """
+    graphics = profile.get("graphics", {})
+    preset = graphics.get("preset", DEFAULT_GRAPHICS_PRESET)
+    settings = dict(GRAPHICS_PRESETS.get(preset, GRAPHICS_PRESETS[DEFAULT_GRAPHICS_PRESET]))
+    settings["fullscreen"] = GRAPHICS_FULLSCREEN
+    for key in settings:
+        if key in graphics:
+            settings[key] = graphics[key]
+    return settings
+
+
+def create_profile_from_input_handler(input_handler, cursor=None, graphics=None) -> Dict[str, Any]:
+    """InputHandler（とCursor・画質設定）から現在の設定をプロファイルとして作成"""
+    profile = {
         "mouse": {
             "sensitivity": input_handler.mouse_sensitivity,
+            "raw_input": input_handler.raw_mouse,
+            "hardware_cursor": cursor.hardware if cursor is not None else CURSOR_HARDWARE,
         },
         "gamepad": {
             "sensitivity": input_handler.gamepad_sensitivity,
             "deadzone": input_handler.deadzone,
             "response_curve": input_handler.response_curve,
-        }
+            "deadzone_mode": input_handler.deadzone_mode,
+            "anti_deadzone": input_handler.anti_deadzone,
+            "poll_rate_hz": input_handler.poll_rate,
+        },
+        "gamepad_devices": input_handler.get_device_profiles(),
     }
+    if graphics is not None:
+        profile["graphics"] = graphics
+    return profile
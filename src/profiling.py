@@ -0,0 +1,397 @@
+"""
+実行時プロファイリングモジュール
+
+指定フレーム数、またはシーンを離れるまでの区間をプロファイルし、
+シーン名付きのファイルとして data/profiles/ に書き出す。
+
+- sample: 別スレッドからメインスレッドのスタックを定期的に採取する
+  サンプリングプロファイラ（collapsed形式と speedscope 形式を出力）
+- cprofile: cProfile による決定的プロファイル（.prof を出力）
+
+名前付きスパン（span / begin / end）は計測中のみ記録される。
+計測していないときは何もしない関数に差し替わっているため、
+呼び出し側は必ず `profiling.span(...)` のようにモジュール経由で参照すること。
+"""
+
+import cProfile
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from .session_logger import DATA_DIR
+
+
+PROFILE_DIR = os.path.join(os.path.dirname(DATA_DIR), "profiles")
+
+# プロファイラの種類
+MODE_SAMPLE = "sample"
+MODE_CPROFILE = "cprofile"
+
+# サンプリング間隔（秒）
+SAMPLE_INTERVAL = 0.002
+
+# ホットキーで固定フレーム数を計測する場合のフレーム数
+DEFAULT_FRAMES = 600
+
+
+class _NullSpan:
+    """無効時のスパン（何もしないコンテキストマネージャ）"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def _null_span(name: str) -> _NullSpan:
+    return _NULL_SPAN
+
+
+def _null_mark(name: str) -> None:
+    return None
+
+
+# 無効時の実体（計測中は _RecordingSpan / _begin / _end に差し替わる）
+span = _null_span
+begin = _null_mark
+end = _null_mark
+
+
+class _RecordingSpan:
+    """計測中のスパン"""
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        _begin(self.name)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        _end(self.name)
+        return False
+
+
+class ProfileCapture:
+    """1回分の計測（サンプリングまたはcProfile、およびスパン）"""
+
+    def __init__(self, scene: str, mode: str = MODE_SAMPLE, frames: Optional[int] = None):
+        """
+        Args:
+            scene: 計測対象のシーン名（出力ファイル名とスタックの根に使う）
+            mode: "sample" または "cprofile"
+            frames: 計測するフレーム数（Noneの場合はシーンを離れるまで）
+        """
+        if mode not in (MODE_SAMPLE, MODE_CPROFILE):
+            raise ValueError(f"未対応のプロファイラ: {mode}")
+        self.scene = scene
+        self.mode = mode
+        self.frames_left = frames
+        self.frame_count = 0
+
+        self._main_thread_id = threading.get_ident()
+        self._start_time = 0.0
+        self._end_time = 0.0
+
+        # サンプリング
+        self._samples: Counter = Counter()
+        self._sample_count = 0
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+        # cProfile
+        self._profiler: Optional[cProfile.Profile] = None
+
+        # スパン（開始/終了イベント、メインスレッドのみ）
+        self._span_events: List[Tuple[str, str, float]] = []
+
+    def start(self) -> None:
+        """計測を開始"""
+        self._start_time = time.perf_counter()
+        if self.mode == MODE_CPROFILE:
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        else:
+            self._running = True
+            self._thread = threading.Thread(target=self._sample_loop, name="Profiler", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """計測を停止"""
+        self._end_time = time.perf_counter()
+        if self._profiler is not None:
+            self._profiler.disable()
+        self._running = False
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def _sample_loop(self) -> None:
+        """サンプリングスレッド本体"""
+        while self._running:
+            frame = sys._current_frames().get(self._main_thread_id)
+            if frame is not None:
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(
+                        f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+                    )
+                    frame = frame.f_back
+                stack.reverse()
+                self._samples[tuple(stack)] += 1
+                self._sample_count += 1
+            del frame
+            time.sleep(SAMPLE_INTERVAL)
+
+    def record_span(self, kind: str, name: str) -> None:
+        """スパンの開始("O")・終了("C")を記録"""
+        if threading.get_ident() == self._main_thread_id:
+            self._span_events.append((kind, name, time.perf_counter()))
+
+    def get_span_totals(self) -> Dict[str, Tuple[int, float]]:
+        """スパン名ごとの (回数, 合計時間（秒）)"""
+        totals: Dict[str, Tuple[int, float]] = {}
+        open_times: Dict[str, List[float]] = {}
+        for kind, name, at in self._span_events:
+            if kind == "O":
+                open_times.setdefault(name, []).append(at)
+            elif open_times.get(name):
+                count, total = totals.get(name, (0, 0.0))
+                totals[name] = (count + 1, total + at - open_times[name].pop())
+        return totals
+
+    def _collapsed_lines(self) -> List[str]:
+        """collapsed形式（Brendan Gregg形式）の行"""
+        return [
+            ";".join((self.scene,) + stack) + f" {count}"
+            for stack, count in self._samples.most_common()
+        ]
+
+    def _speedscope(self) -> dict:
+        """speedscope形式のファイル内容"""
+        frames: List[dict] = []
+        frame_index: Dict[str, int] = {}
+
+        def index_of(name: str) -> int:
+            if name not in frame_index:
+                frame_index[name] = len(frames)
+                frames.append({"name": name})
+            return frame_index[name]
+
+        duration_ms = (self._end_time - self._start_time) * 1000.0
+        profiles = []
+
+        if self._samples:
+            samples = []
+            weights = []
+            for stack, count in self._samples.items():
+                samples.append([index_of(self.scene)] + [index_of(name) for name in stack])
+                weights.append(count * SAMPLE_INTERVAL * 1000.0)
+            profiles.append({
+                "type": "sampled",
+                "name": f"{self.scene} (sampled)",
+                "unit": "milliseconds",
+                "startValue": 0,
+                "endValue": sum(weights),
+                "samples": samples,
+                "weights": weights,
+            })
+
+        if self._span_events:
+            events = []
+            depth = 0
+            for kind, name, at in self._span_events:
+                # 計測開始前に開いたスパンの終了は捨てる
+                if kind == "C" and depth == 0:
+                    continue
+                depth += 1 if kind == "O" else -1
+                events.append({
+                    "type": kind,
+                    "frame": index_of(name),
+                    "at": (at - self._start_time) * 1000.0,
+                })
+            # 計測終了時に開いたままのスパンを閉じる
+            open_stack = []
+            for event in events:
+                if event["type"] == "O":
+                    open_stack.append(event["frame"])
+                else:
+                    open_stack.pop()
+            for frame in reversed(open_stack):
+                events.append({"type": "C", "frame": frame, "at": duration_ms})
+            profiles.append({
+                "type": "evented",
+                "name": f"{self.scene} (spans)",
+                "unit": "milliseconds",
+                "startValue": 0,
+                "endValue": duration_ms,
+                "events": events,
+            })
+
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": self.scene,
+            "exporter": "pyaim-tracker",
+            "shared": {"frames": frames},
+            "profiles": profiles,
+        }
+
+    def export(self, output_dir: str = PROFILE_DIR) -> List[str]:
+        """
+        計測結果を書き出す
+
+        Returns:
+            書き出したファイルパスのリスト
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        stem = os.path.join(output_dir, f"{self.scene}_{datetime.now().strftime('%Y%m%dT%H%M%S_%f')}")
+        written = []
+
+        if self._profiler is not None:
+            path = stem + ".prof"
+            self._profiler.dump_stats(path)
+            written.append(path)
+
+        if self._samples:
+            path = stem + ".collapsed"
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("\n".join(self._collapsed_lines()) + "\n")
+            written.append(path)
+
+        if self._samples or self._span_events:
+            path = stem + ".speedscope.json"
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(self._speedscope(), f)
+            written.append(path)
+
+        return written
+
+
+# 現在の計測と設定
+_capture: Optional[ProfileCapture] = None
+_mode = MODE_SAMPLE
+_output_dir = PROFILE_DIR
+_auto_scene: Optional[str] = None
+_auto_frames: Optional[int] = None
+
+
+def _begin(name: str) -> None:
+    if _capture is not None:
+        _capture.record_span("O", name)
+
+
+def _end(name: str) -> None:
+    if _capture is not None:
+        _capture.record_span("C", name)
+
+
+def _set_spans_enabled(enabled: bool) -> None:
+    """スパン関数を記録用/何もしない実装に差し替える"""
+    global span, begin, end
+    if enabled:
+        span, begin, end = _RecordingSpan, _begin, _end
+    else:
+        span, begin, end = _null_span, _null_mark, _null_mark
+
+
+def configure(
+    mode: str = MODE_SAMPLE,
+    output_dir: Optional[str] = None,
+    scene: Optional[str] = None,
+    frames: Optional[int] = None,
+) -> None:
+    """
+    プロファイリング設定（コマンドライン引数から呼ぶ）
+
+    Args:
+        mode: "sample" または "cprofile"
+        output_dir: 出力先（Noneの場合は data/profiles）
+        scene: このシーンに入るたびに自動で計測を開始する（"*" は起動直後のシーンを1回だけ）
+        frames: 自動計測のフレーム数（Noneの場合はシーンを離れるまで）
+    """
+    global _mode, _output_dir, _auto_scene, _auto_frames
+    if mode not in (MODE_SAMPLE, MODE_CPROFILE):
+        raise ValueError(f"未対応のプロファイラ: {mode}")
+    _mode = mode
+    _output_dir = output_dir or PROFILE_DIR
+    _auto_scene = scene
+    _auto_frames = frames
+
+
+def is_capturing() -> bool:
+    """計測中かどうか"""
+    return _capture is not None
+
+
+def start_capture(scene: str, frames: Optional[int] = None) -> None:
+    """現在のシーンの計測を開始（計測中の場合は何もしない）"""
+    global _capture
+    if _capture is not None:
+        return
+    _capture = ProfileCapture(scene, _mode, frames)
+    _set_spans_enabled(True)
+    _capture.start()
+    length = f"{frames}フレーム" if frames else "シーン終了まで"
+    print(f"プロファイル開始: {scene} ({_mode}, {length})")
+
+
+def stop_capture() -> List[str]:
+    """計測を終了して書き出す"""
+    global _capture
+    capture = _capture
+    if capture is None:
+        return []
+    _capture = None
+    _set_spans_enabled(False)
+    capture.stop()
+
+    written = capture.export(_output_dir)
+    for name, (count, total) in sorted(capture.get_span_totals().items()):
+        print(f"  {name}: {count}回, 平均 {total / count * 1000.0:.3f}ms")
+    for path in written:
+        print(f"プロファイル書き出し: {path}")
+    return written
+
+
+def toggle_capture(scene: str, frames: Optional[int] = None) -> None:
+    """ホットキー用: 計測中なら終了、そうでなければ開始"""
+    if _capture is not None:
+        stop_capture()
+    else:
+        start_capture(scene, frames)
+
+
+def on_scene_enter(scene: str) -> None:
+    """シーン切り替え時に呼ぶ（シーン終了までの計測を終了し、自動計測を開始）"""
+    if _capture is not None and _capture.scene != scene:
+        stop_capture()
+    global _auto_scene
+    if _auto_scene is not None and _auto_scene in ("*", scene):
+        if _auto_scene == "*":
+            _auto_scene = None
+        start_capture(scene, _auto_frames)
+
+
+def on_frame_end() -> None:
+    """フレーム終了時に呼ぶ（フレーム数指定の計測を終了）"""
+    if _capture is None:
+        return
+    _capture.frame_count += 1
+    if _capture.frames_left is not None:
+        _capture.frames_left -= 1
+        if _capture.frames_left <= 0:
+            stop_capture()
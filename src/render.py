@@ -0,0 +1,629 @@
+"""
+描画バックエンドモジュール
+
+シーンはこのモジュールのレンダラーを通して描画する。
+
+- SurfaceRenderer: 従来どおりディスプレイサーフェスへソフトウェアblit
+- ScaledSurfaceRenderer: 内部解像度を下げたディスプレイサーフェスへソフトウェアblit
+  （画質プリセットの render_scale が 1 未満の場合）
+- TextureRenderer: pygame._sdl2.video の Renderer/Texture による描画。
+  ターゲット・カーソル・パーティクル・テキストはテクスチャとしてキャッシュし、
+  静的レイヤーは内容が変わったときだけ再転送する。
+  accelerated=False でSDLのソフトウェアレンダラーを使うため、ヘッドレスでも動作する。
+
+どちらも同じインターフェースを持つため、同じシーンで両者を比較計測できる。
+シーンは常にゲーム内座標（SCREEN_WIDTH x SCREEN_HEIGHT）で描画し、
+内部解像度への縮小と表示時の拡大はレンダラーが行う。
+"""
+
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Sequence, Tuple
+
+import pygame
+
+from .settings import SCREEN_WIDTH, SCREEN_HEIGHT, WINDOW_TITLE
+
+
+# バックエンド名
+BACKEND_SURFACE = "surface"
+BACKEND_TEXTURE = "texture"
+BACKENDS = (BACKEND_SURFACE, BACKEND_TEXTURE)
+
+# テキストキャッシュの最大数（残り時間などの数値表示を想定）
+TEXT_CACHE_SIZE = 256
+
+# 数値表示で使う文字（セッション開始時にグリフを用意しておく）
+NUMERIC_GLYPHS = "0123456789.-/%: "
+
+
+def render_size(render_scale: float, size: Tuple[int, int] = (SCREEN_WIDTH, SCREEN_HEIGHT)) -> Tuple[int, int]:
+    """ゲーム内座標のサイズに対する内部解像度"""
+    return (max(1, round(size[0] * render_scale)), max(1, round(size[1] * render_scale)))
+
+
+class BaseRenderer(ABC):
+    """
+    レンダラー共通処理（テキストとスプライトのキャッシュ）
+
+    描画の各操作は抽象メソッドで、バックエンドはすべて実装する
+    （実装が欠けたバックエンドは描画の途中ではなく作成時にエラーになる）。
+    """
+
+    def __init__(self, text_cache_size: int = TEXT_CACHE_SIZE, antialias: bool = True):
+        """
+        Args:
+            text_cache_size: キャッシュするテキストの最大数
+            antialias: テキスト・スプライトのアンチエイリアス
+        """
+        self.text_cache_size = text_cache_size
+        self.antialias = antialias
+        self._text_cache: "OrderedDict[Hashable, pygame.Surface]" = OrderedDict()
+        self._sprite_surfaces = {}
+        self._glyphs: Dict[Hashable, pygame.Surface] = {}
+
+    @property
+    @abstractmethod
+    def surface(self) -> pygame.Surface:
+        """描画先と同じサイズ・形式の基準サーフェス（静的レイヤーの生成に使う）"""
+        pass
+
+    @property
+    def input_scale(self) -> float:
+        """マウスの座標（表示の論理座標）からゲーム内座標への倍率"""
+        return 1.0
+
+    def render_text(
+        self,
+        font: pygame.font.Font,
+        text: str,
+        color: Tuple[int, int, int],
+    ) -> pygame.Surface:
+        """テキストをレンダリング（LRUキャッシュ）"""
+        key = (id(font), text, tuple(color))
+        rendered = self._text_cache.get(key)
+        if rendered is not None:
+            self._text_cache.move_to_end(key)
+            return rendered
+
+        rendered = font.render(text, self.antialias, color)
+        self._text_cache[key] = rendered
+        if len(self._text_cache) > self.text_cache_size:
+            self._text_cache.popitem(last=False)
+        return rendered
+
+    def get_sprite_surface(
+        self,
+        key: Hashable,
+        factory: Callable[[], pygame.Surface],
+    ) -> pygame.Surface:
+        """スプライトのサーフェスを取得（初回のみ factory で生成）"""
+        rendered = self._sprite_surfaces.get(key)
+        if rendered is None:
+            rendered = factory()
+            self._sprite_surfaces[key] = rendered
+        return rendered
+
+    def text(
+        self,
+        font: pygame.font.Font,
+        text: str,
+        color: Tuple[int, int, int],
+        pos: Tuple[int, int],
+        anchor: str = "topleft",
+    ) -> pygame.Rect:
+        """
+        テキストを描画
+
+        Args:
+            pos: anchor で指定した基準点の座標（"topleft" / "center" など）
+        """
+        rendered = self.render_text(font, text, color)
+        rect = rendered.get_rect(**{anchor: pos})
+        self.blit(rendered, rect.topleft, cache_key=("text", id(font), text, tuple(color)))
+        return rect
+
+    def glyph_text(
+        self,
+        font: pygame.font.Font,
+        text: str,
+        color: Tuple[int, int, int],
+        pos: Tuple[int, int],
+    ) -> int:
+        """
+        文字ごとにキャッシュしたグリフを並べてテキストを描画（毎フレーム変わる数値表示用）
+
+        値が変わるたびに文字列全体のサーフェスを作らないため、
+        セッション中の定常状態で新たな確保が発生しない（カーニングは考慮しない）。
+
+        Args:
+            pos: 左上の座標
+
+        Returns:
+            描画した幅
+        """
+        x, y = pos
+        for char in text:
+            key = ("glyph", id(font), char, color)
+            glyph = self._get_glyph(key, font, char, color)
+            self.blit(glyph, (x, y), cache_key=key)
+            x += glyph.get_width()
+        return x - pos[0]
+
+    def _get_glyph(
+        self,
+        key: Hashable,
+        font: pygame.font.Font,
+        char: str,
+        color: Tuple[int, int, int],
+    ) -> pygame.Surface:
+        """1文字分のグリフを取得（初回のみレンダリング）"""
+        glyph = self._glyphs.get(key)
+        if glyph is None:
+            glyph = font.render(char, self.antialias, color)
+            self._glyphs[key] = glyph
+        return glyph
+
+    def preload_glyphs(
+        self,
+        font: pygame.font.Font,
+        chars: str,
+        color: Tuple[int, int, int],
+    ) -> None:
+        """
+        glyph_text で使う文字を事前にキャッシュ
+
+        残り時間などの数値は、セッションの途中で初めて現れる桁があると
+        そのフレームでグリフ（とテクスチャ）を確保することになるため、
+        計測していない間（セッション開始時など）に用意しておく。
+        """
+        for char in chars:
+            key = ("glyph", id(font), char, color)
+            self._preload(self._get_glyph(key, font, char, color), key)
+
+    def _preload(self, surface: pygame.Surface, cache_key: Hashable) -> None:
+        """描画せずにキャッシュだけを用意（テクスチャを使うバックエンドで転送する）"""
+        pass
+
+    @abstractmethod
+    def clear(self, color: Tuple[int, int, int]) -> None:
+        """画面を塗りつぶす"""
+        pass
+
+    @abstractmethod
+    def blit(
+        self,
+        surface: pygame.Surface,
+        pos: Tuple[int, int],
+        cache_key: Hashable = None,
+        version: Hashable = None,
+    ) -> None:
+        """
+        サーフェスを描画
+
+        Args:
+            cache_key: 同じ内容を繰り返し描画する場合のキー（テクスチャとして保持）
+            version: 同じキーで内容が変わったことを示す値（変わったら再転送）
+        """
+        pass
+
+    @abstractmethod
+    def sprite(
+        self,
+        key: Hashable,
+        factory: Callable[[], pygame.Surface],
+        center: Tuple[int, int],
+        alpha: int = 255,
+    ) -> None:
+        """
+        キャッシュ済みスプライトを中心座標に描画
+
+        Args:
+            key: スプライトの見た目を一意に表すキー
+            factory: 初回にスプライトのサーフェスを生成する関数
+            alpha: 全体の不透明度
+        """
+        pass
+
+    @abstractmethod
+    def lines(self, color: Tuple[int, int, int], points: Sequence[Tuple[float, float]]) -> None:
+        """
+        折れ線を描画（幅1、毎フレーム変わる軌跡用）
+
+        Args:
+            points: 頂点の座標（2点以上）
+        """
+        pass
+
+    @abstractmethod
+    def fill_rect(self, color: Tuple[int, int, int], rect: pygame.Rect) -> None:
+        """矩形を塗りつぶす（毎フレーム変わる進捗バー用）"""
+        pass
+
+    @abstractmethod
+    def draw_with_surface(self, draw: Callable[[pygame.Surface], None]) -> None:
+        """サーフェス描画関数の結果をそのまま画面に反映（未対応シーン用）"""
+        pass
+
+    @abstractmethod
+    def present(self) -> None:
+        """フレームを表示"""
+        pass
+
+
+class SurfaceRenderer(BaseRenderer):
+    """ディスプレイサーフェスへのソフトウェア描画"""
+
+    def __init__(
+        self,
+        screen: pygame.Surface,
+        text_cache_size: int = TEXT_CACHE_SIZE,
+        antialias: bool = True,
+    ):
+        """
+        Args:
+            screen: 描画先サーフェス（通常はディスプレイサーフェス）
+        """
+        super().__init__(text_cache_size, antialias)
+        self.screen = screen
+
+    @property
+    def surface(self) -> pygame.Surface:
+        return self.screen
+
+    def clear(self, color: Tuple[int, int, int]) -> None:
+        self.screen.fill(color)
+
+    def blit(
+        self,
+        surface: pygame.Surface,
+        pos: Tuple[int, int],
+        cache_key: Hashable = None,
+        version: Hashable = None,
+    ) -> None:
+        self.screen.blit(surface, pos)
+
+    def sprite(
+        self,
+        key: Hashable,
+        factory: Callable[[], pygame.Surface],
+        center: Tuple[int, int],
+        alpha: int = 255,
+    ) -> None:
+        rendered = self.get_sprite_surface(key, factory)
+        rendered.set_alpha(alpha)
+        self.screen.blit(
+            rendered,
+            (center[0] - rendered.get_width() // 2, center[1] - rendered.get_height() // 2),
+        )
+
+    def lines(self, color: Tuple[int, int, int], points: Sequence[Tuple[float, float]]) -> None:
+        if self.antialias:
+            pygame.draw.aalines(self.screen, color, False, points)
+        else:
+            pygame.draw.lines(self.screen, color, False, points)
+
+    def fill_rect(self, color: Tuple[int, int, int], rect: pygame.Rect) -> None:
+        self.screen.fill(color, rect)
+
+    def draw_with_surface(self, draw: Callable[[pygame.Surface], None]) -> None:
+        draw(self.screen)
+
+    def present(self) -> None:
+        pygame.display.flip()
+
+
+class ScaledSurfaceRenderer(SurfaceRenderer):
+    """
+    内部解像度を下げたディスプレイサーフェスへのソフトウェア描画
+
+    座標とサーフェスを render_scale 倍に縮小して内部解像度の screen へ転送する。
+    縮小したサーフェスは cache_key ごとに保持するため、定常状態で書き込むのは
+    内部解像度の画素だけになる。ウィンドウへの拡大は pygame.SCALED（SDL）が行い、
+    マウスの座標も内部解像度で届くため input_scale 倍してゲーム内座標に戻す。
+    """
+
+    def __init__(
+        self,
+        screen: pygame.Surface,
+        render_scale: float,
+        text_cache_size: int = TEXT_CACHE_SIZE,
+        antialias: bool = True,
+    ):
+        """
+        Args:
+            screen: 内部解像度の描画先サーフェス（通常はディスプレイサーフェス）
+            render_scale: ゲーム内座標に対する内部解像度の倍率（0より大きく1以下）
+        """
+        super().__init__(screen, text_cache_size, antialias)
+        self.render_scale = render_scale
+        width, height = screen.get_size()
+        # 未対応シーン・静的レイヤーはゲーム内座標のサイズで描画する
+        self._canvas = pygame.Surface((round(width / render_scale), round(height / render_scale)), 0, screen)
+        self._scaled: "OrderedDict[Hashable, Tuple[Hashable, pygame.Surface]]" = OrderedDict()
+        self._scaled_sprites: Dict[Hashable, pygame.Surface] = {}
+
+    @property
+    def surface(self) -> pygame.Surface:
+        return self._canvas
+
+    @property
+    def input_scale(self) -> float:
+        return 1.0 / self.render_scale
+
+    def _point(self, pos: Tuple[float, float]) -> Tuple[int, int]:
+        """ゲーム内座標を内部解像度の座標に変換"""
+        return (round(pos[0] * self.render_scale), round(pos[1] * self.render_scale))
+
+    def _scale_surface(
+        self, surface: pygame.Surface, dest: Optional[pygame.Surface] = None
+    ) -> pygame.Surface:
+        """サーフェスを内部解像度に縮小（dest を指定した場合はそこへ書き込む）"""
+        size = render_size(self.render_scale, surface.get_size())
+        if self.antialias and surface.get_bitsize() >= 24:
+            if dest is None:
+                return pygame.transform.smoothscale(surface, size)
+            return pygame.transform.smoothscale(surface, size, dest)
+        if dest is None:
+            return pygame.transform.scale(surface, size)
+        return pygame.transform.scale(surface, size, dest)
+
+    def _get_scaled(self, surface: pygame.Surface, cache_key: Hashable, version: Hashable) -> pygame.Surface:
+        """キーに対応する縮小済みサーフェスを取得（内容が変わった場合のみ縮小し直す）"""
+        entry = self._scaled.get(cache_key)
+        if entry is not None:
+            self._scaled.move_to_end(cache_key)
+            cached_version, scaled = entry
+            if cached_version == version:
+                return scaled
+            if scaled.get_size() == render_size(self.render_scale, surface.get_size()):
+                self._scale_surface(surface, scaled)
+                self._scaled[cache_key] = (version, scaled)
+                return scaled
+
+        scaled = self._scale_surface(surface)
+        self._scaled[cache_key] = (version, scaled)
+        if len(self._scaled) > self.text_cache_size * 2:
+            self._scaled.popitem(last=False)
+        return scaled
+
+    def _preload(self, surface: pygame.Surface, cache_key: Hashable) -> None:
+        self._get_scaled(surface, cache_key, None)
+
+    def blit(
+        self,
+        surface: pygame.Surface,
+        pos: Tuple[int, int],
+        cache_key: Hashable = None,
+        version: Hashable = None,
+    ) -> None:
+        if cache_key is None:
+            scaled = self._scale_surface(surface)
+        else:
+            scaled = self._get_scaled(surface, cache_key, version)
+        self.screen.blit(scaled, self._point(pos))
+
+    def sprite(
+        self,
+        key: Hashable,
+        factory: Callable[[], pygame.Surface],
+        center: Tuple[int, int],
+        alpha: int = 255,
+    ) -> None:
+        rendered = self._scaled_sprites.get(key)
+        if rendered is None:
+            rendered = self._scale_surface(self.get_sprite_surface(key, factory))
+            self._scaled_sprites[key] = rendered
+        rendered.set_alpha(alpha)
+        x, y = self._point(center)
+        self.screen.blit(rendered, (x - rendered.get_width() // 2, y - rendered.get_height() // 2))
+
+    def lines(self, color: Tuple[int, int, int], points: Sequence[Tuple[float, float]]) -> None:
+        super().lines(color, [self._point(point) for point in points])
+
+    def fill_rect(self, color: Tuple[int, int, int], rect: pygame.Rect) -> None:
+        left, top = self._point(rect.topleft)
+        right, bottom = self._point(rect.bottomright)
+        self.screen.fill(color, (left, top, right - left, bottom - top))
+
+    def draw_with_surface(self, draw: Callable[[pygame.Surface], None]) -> None:
+        draw(self._canvas)
+        self._scale_surface(self._canvas, self.screen)
+
+
+class TextureRenderer(BaseRenderer):
+    """pygame._sdl2.video の Renderer/Texture による描画"""
+
+    def __init__(
+        self,
+        size: Tuple[int, int] = (SCREEN_WIDTH, SCREEN_HEIGHT),
+        accelerated: bool = True,
+        vsync: bool = False,
+        title: str = WINDOW_TITLE,
+        text_cache_size: int = TEXT_CACHE_SIZE,
+        antialias: bool = True,
+        scaled: bool = False,
+        fullscreen: bool = False,
+        render_scale: float = 1.0,
+    ):
+        """
+        Args:
+            size: ウィンドウ（論理解像度）のサイズ
+            accelerated: False の場合は常にSDLのソフトウェアレンダラーを使う
+            vsync: 垂直同期
+            scaled: ウィンドウサイズの変更を許可し、論理解像度のまま拡大表示する
+            fullscreen: デスクトップ解像度の全画面で表示する
+            render_scale: 論理解像度に対する内部解像度の倍率（1未満の場合は
+                縮小したレンダーターゲットに描画し、表示時に拡大する）
+        """
+        super().__init__(text_cache_size, antialias)
+        from pygame._sdl2 import video
+
+        self._video = video
+        self.window = video.Window(
+            title, size, resizable=scaled or fullscreen, fullscreen_desktop=fullscreen
+        )
+        # accelerated=-1 は使えるレンダラーを優先順に選ぶ（なければソフトウェア）
+        self.renderer = video.Renderer(
+            self.window, accelerated=-1 if accelerated else 0, vsync=vsync
+        )
+        self.renderer.logical_size = size
+
+        # 内部解像度のレンダーターゲット（表示時以外は常にこちらへ描画する）
+        self.render_scale = render_scale
+        self._target = None
+        if render_scale < 1.0:
+            self._target = video.Texture(self.renderer, render_size(render_scale, size), target=True)
+            self._bind_target()
+
+        # 未対応シーンを描画するオフスクリーンサーフェス
+        self._canvas = pygame.Surface(size)
+        self._canvas_texture: Optional[video.Texture] = None
+
+        self._textures: "OrderedDict[Hashable, Tuple[Hashable, object]]" = OrderedDict()
+        self._sprite_textures = {}
+
+    @property
+    def surface(self) -> pygame.Surface:
+        return self._canvas
+
+    def _bind_target(self) -> None:
+        """内部解像度のレンダーターゲットに切り替え、ゲーム内座標で描画できるよう縮小する"""
+        self.renderer.target = self._target
+        self.renderer.scale = (self.render_scale, self.render_scale)
+
+    def _get_texture(self, surface: pygame.Surface, cache_key: Hashable, version: Hashable):
+        """キーに対応するテクスチャを取得（内容が変わった場合のみ再転送）"""
+        entry = self._textures.get(cache_key)
+        if entry is not None:
+            self._textures.move_to_end(cache_key)
+            cached_version, texture = entry
+            if cached_version == version:
+                return texture
+            if (texture.width, texture.height) == surface.get_size():
+                texture.update(surface)
+                self._textures[cache_key] = (version, texture)
+                return texture
+
+        texture = self._video.Texture.from_surface(self.renderer, surface)
+        self._textures[cache_key] = (version, texture)
+        if len(self._textures) > self.text_cache_size * 2:
+            self._textures.popitem(last=False)
+        return texture
+
+    def _preload(self, surface: pygame.Surface, cache_key: Hashable) -> None:
+        self._get_texture(surface, cache_key, None)
+
+    def clear(self, color: Tuple[int, int, int]) -> None:
+        self.renderer.draw_color = (*color, 255)
+        self.renderer.clear()
+
+    def blit(
+        self,
+        surface: pygame.Surface,
+        pos: Tuple[int, int],
+        cache_key: Hashable = None,
+        version: Hashable = None,
+    ) -> None:
+        if cache_key is None:
+            texture = self._video.Texture.from_surface(self.renderer, surface)
+        else:
+            texture = self._get_texture(surface, cache_key, version)
+        texture.draw(dstrect=(pos[0], pos[1], texture.width, texture.height))
+
+    def sprite(
+        self,
+        key: Hashable,
+        factory: Callable[[], pygame.Surface],
+        center: Tuple[int, int],
+        alpha: int = 255,
+    ) -> None:
+        texture = self._sprite_textures.get(key)
+        if texture is None:
+            texture = self._video.Texture.from_surface(
+                self.renderer, self.get_sprite_surface(key, factory)
+            )
+            self._sprite_textures[key] = texture
+        texture.alpha = alpha
+        texture.draw(dstrect=(
+            center[0] - texture.width // 2,
+            center[1] - texture.height // 2,
+            texture.width,
+            texture.height,
+        ))
+
+    def lines(self, color: Tuple[int, int, int], points: Sequence[Tuple[float, float]]) -> None:
+        self.renderer.draw_color = (*color, 255)
+        for start, end in zip(points, points[1:]):
+            self.renderer.draw_line(start, end)
+
+    def fill_rect(self, color: Tuple[int, int, int], rect: pygame.Rect) -> None:
+        self.renderer.draw_color = (*color, 255)
+        self.renderer.fill_rect(rect)
+
+    def draw_with_surface(self, draw: Callable[[pygame.Surface], None]) -> None:
+        draw(self._canvas)
+        if self._canvas_texture is None:
+            self._canvas_texture = self._video.Texture.from_surface(self.renderer, self._canvas)
+        else:
+            self._canvas_texture.update(self._canvas)
+        self._canvas_texture.draw()
+
+    def present(self) -> None:
+        if self._target is not None:
+            # レンダーターゲットをウィンドウ全体に拡大して表示
+            self.renderer.target = None
+            self.renderer.draw_color = (0, 0, 0, 255)
+            self.renderer.clear()
+            self._target.draw(dstrect=(0, 0, *self.renderer.logical_size))
+            self.renderer.present()
+            self._bind_target()
+            return
+        self.renderer.present()
+
+    def read_pixels(self) -> pygame.Surface:
+        """現在の描画内容をサーフェスとして取得（検証用）"""
+        return self.renderer.to_surface()
+
+
+def create_renderer(
+    backend: str,
+    size: Tuple[int, int] = (SCREEN_WIDTH, SCREEN_HEIGHT),
+    accelerated: bool = True,
+    graphics: Optional[Dict[str, Any]] = None,
+) -> BaseRenderer:
+    """
+    バックエンド名からレンダラーを作成
+
+    surface バックエンドはディスプレイモードを設定してから使う。
+
+    Args:
+        graphics: 画質プリセットの設定（scaled, render_scale, fullscreen, antialias, text_cache_size）
+    """
+    graphics = graphics or {}
+    render_scale = min(1.0, max(0.1, float(graphics.get("render_scale", 1.0))))
+    # 内部解像度を下げる場合は拡大表示が必須
+    scaled = graphics.get("scaled", False) or render_scale < 1.0
+    fullscreen = graphics.get("fullscreen", False)
+    options = {
+        "text_cache_size": graphics.get("text_cache_size", TEXT_CACHE_SIZE),
+        "antialias": graphics.get("antialias", True),
+    }
+
+    if backend == BACKEND_TEXTURE:
+        return TextureRenderer(
+            size, accelerated=accelerated, scaled=scaled, fullscreen=fullscreen,
+            render_scale=render_scale, **options
+        )
+    if backend == BACKEND_SURFACE:
+        flags = 0
+        if scaled:
+            # 内部解像度のまま、ウィンドウ/全画面にGPUで拡大表示
+            flags |= pygame.SCALED | pygame.RESIZABLE
+        if fullscreen:
+            flags |= pygame.FULLSCREEN
+        screen = pygame.display.set_mode(render_size(render_scale, size), flags)
+        if render_scale < 1.0:
+            return ScaledSurfaceRenderer(screen, render_scale, **options)
+        return SurfaceRenderer(screen, **options)
+    raise ValueError(f"未対応の描画バックエンド: {backend}")
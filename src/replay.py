@@ -0,0 +1,252 @@
+"""
+リプレイ（テレメトリ再生）モジュール
+
+テレメトリの各フレームはカーソル・ターゲットの完全な状態を持つが、
+ヒット数やT0時間のような累積値は先頭から数えないと求まらない。
+そこで一定フレームごとの累積値をキーフレームインデックスとして
+テレメトリファイルの隣（拡張子 .idx）に保存し、任意の時刻へのシークを
+
+1. キーフレーム時刻の二分探索（O(log n)）
+2. キーフレーム間（最大 KEYFRAME_INTERVAL フレーム）の二分探索と累積値のデコード
+
+だけで行う。フレーム本体はメモリマップで読むため、長時間の記録でも
+全体を読み込まない。
+"""
+
+import os
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from .telemetry import (
+    FLAG_CLICK, FLAG_HIT, FLAG_ON_TARGET, FLAG_SPAWN,
+    list_telemetry_files, load_telemetry,
+)
+
+
+# キーフレームの間隔（フレーム数）
+KEYFRAME_INTERVAL = 256
+
+# キーフレーム: frame 番目のフレームを適用する前の累積値
+KEYFRAME_DTYPE = np.dtype([
+    ("t", "<f4"),               # frame 番目のフレームの時刻
+    ("frame", "<u4"),
+    ("hits", "<u4"),
+    ("clicks", "<u4"),
+    ("spawns", "<u4"),
+    ("on_target_time", "<f8"),  # ターゲット上にいた時間（秒）
+])
+
+# 前方への再生で逐次デコードする最大フレーム数（これを超える移動はシーク）
+SEQUENTIAL_DECODE_LIMIT = KEYFRAME_INTERVAL
+
+
+def get_index_path(telemetry_path: str) -> str:
+    """テレメトリファイルに対応するキーフレームインデックスのパス"""
+    return os.path.splitext(telemetry_path)[0] + ".idx"
+
+
+def list_replays() -> List[str]:
+    """再生できる記録（全モード）を古い順に取得"""
+    paths = list_telemetry_files("tracking") + list_telemetry_files("flicking")
+    return sorted(paths, key=os.path.basename)
+
+
+def _decode_counts(frames: np.ndarray, start: int, stop: int) -> Tuple[int, int, int, float]:
+    """
+    [start, stop) のフレームを適用したときの累積値の増分
+
+    Returns:
+        (ヒット数, クリック数, 出現数, ターゲット上の時間)
+    """
+    if stop <= start:
+        return 0, 0, 0, 0.0
+    block = frames[start:stop]
+    flags = block["flags"]
+    t = block["t"].astype(np.float64)
+    previous = float(frames["t"][start - 1]) if start > 0 else 0.0
+    dt = np.diff(t, prepend=previous)
+    on_target = (flags & FLAG_ON_TARGET) != 0
+    return (
+        int(np.count_nonzero(flags & FLAG_HIT)),
+        int(np.count_nonzero(flags & FLAG_CLICK)),
+        int(np.count_nonzero(flags & FLAG_SPAWN)),
+        float(dt[on_target].sum()),
+    )
+
+
+def build_keyframe_index(frames: np.ndarray, interval: int = KEYFRAME_INTERVAL) -> np.ndarray:
+    """
+    フレーム列からキーフレームインデックスを作成（ベクトル化）
+
+    Args:
+        frames: FRAME_DTYPE のフレーム列
+        interval: キーフレームの間隔（フレーム数）
+    """
+    count = len(frames)
+    positions = np.arange(0, count, interval, dtype=np.int64)
+    index = np.zeros(len(positions), dtype=KEYFRAME_DTYPE)
+    if count == 0:
+        return index
+
+    flags = np.asarray(frames["flags"])
+    t = np.asarray(frames["t"], dtype=np.float64)
+    dt = np.diff(t, prepend=0.0)
+
+    def exclusive_cumsum(values: np.ndarray) -> np.ndarray:
+        """各位置より前の合計"""
+        total = np.concatenate(([0], np.cumsum(values)))
+        return total[positions]
+
+    index["t"] = t[positions]
+    index["frame"] = positions
+    index["hits"] = exclusive_cumsum((flags & FLAG_HIT) != 0)
+    index["clicks"] = exclusive_cumsum((flags & FLAG_CLICK) != 0)
+    index["spawns"] = exclusive_cumsum((flags & FLAG_SPAWN) != 0)
+    index["on_target_time"] = exclusive_cumsum(np.where((flags & FLAG_ON_TARGET) != 0, dt, 0.0))
+    return index
+
+
+def save_keyframe_index(telemetry_path: str, index: np.ndarray) -> Optional[str]:
+    """
+    キーフレームインデックスを保存
+
+    拡張子を .npy にしないのは、テレメトリ一覧（*.npy）に混ざらないようにするため。
+    """
+    path = get_index_path(telemetry_path)
+    try:
+        with open(path, "wb") as f:
+            np.save(f, index)
+        return path
+    except Exception as e:
+        print(f"インデックス保存エラー: {e}")
+        return None
+
+
+def load_keyframe_index(telemetry_path: str, frames: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    キーフレームインデックスを読み込み（ない・古い場合は作成して保存）
+
+    Args:
+        frames: 読み込み済みのフレーム列（作成が必要な場合に使う）
+    """
+    if frames is None:
+        frames = load_telemetry(telemetry_path)
+    path = get_index_path(telemetry_path)
+    if os.path.exists(path):
+        index = np.load(path)
+        expected = (len(frames) + KEYFRAME_INTERVAL - 1) // KEYFRAME_INTERVAL
+        if index.dtype == KEYFRAME_DTYPE and len(index) == expected:
+            return index
+
+    index = build_keyframe_index(frames)
+    save_keyframe_index(telemetry_path, index)
+    return index
+
+
+class Replay:
+    """記録済みセッションの再生位置と累積値を管理するクラス"""
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: テレメトリファイルのパス
+        """
+        self.path = path
+        self.mode = os.path.basename(os.path.dirname(path))
+        self.frames = load_telemetry(path)
+        self.index = load_keyframe_index(path, self.frames)
+        self._times = self.frames["t"]
+        self._key_times = self.index["t"]
+
+        # 現在のフレーム（-1: 最初のフレームより前）と、そこまでの累積値
+        self.position = -1
+        self.hits = 0
+        self.clicks = 0
+        self.spawns = 0
+        self.on_target_time = 0.0
+
+    def __len__(self) -> int:
+        return len(self.frames)
+
+    @property
+    def duration(self) -> float:
+        """記録の長さ（秒）"""
+        return float(self._times[-1]) if len(self.frames) else 0.0
+
+    @property
+    def time(self) -> float:
+        """現在のフレームの時刻（秒）"""
+        return float(self._times[self.position]) if self.position >= 0 else 0.0
+
+    def frame_at(self, t: float) -> int:
+        """
+        時刻 t に表示されているフレーム（t 以前で最後のフレーム）
+
+        キーフレーム時刻とキーフレーム間の時刻をそれぞれ二分探索する。
+        """
+        if len(self.frames) == 0:
+            return -1
+        key = int(np.searchsorted(self._key_times, t, side="right")) - 1
+        if key < 0:
+            return -1
+        start = int(self.index["frame"][key])
+        stop = min(start + KEYFRAME_INTERVAL, len(self.frames))
+        return start + int(np.searchsorted(self._times[start:stop], t, side="right")) - 1
+
+    def seek_frame(self, frame: int) -> None:
+        """指定フレームへ移動（直前のキーフレームからデコード）"""
+        frame = max(-1, min(frame, len(self.frames) - 1))
+        if frame < 0:
+            self.position = -1
+            self.hits = self.clicks = self.spawns = 0
+            self.on_target_time = 0.0
+            return
+
+        key = self.index[frame // KEYFRAME_INTERVAL]
+        start = int(key["frame"])
+        hits, clicks, spawns, on_target = _decode_counts(self.frames, start, frame + 1)
+        self.position = frame
+        self.hits = int(key["hits"]) + hits
+        self.clicks = int(key["clicks"]) + clicks
+        self.spawns = int(key["spawns"]) + spawns
+        self.on_target_time = float(key["on_target_time"]) + on_target
+
+    def seek(self, t: float) -> None:
+        """時刻 t へ移動"""
+        self.seek_frame(self.frame_at(t))
+
+    def advance_to(self, t: float) -> None:
+        """
+        再生時に時刻 t まで進める
+
+        少しだけ前に進む場合は差分のみデコードし、それ以外はシークする。
+        """
+        frame = self.frame_at(t)
+        if self.position <= frame <= self.position + SEQUENTIAL_DECODE_LIMIT:
+            self.step(frame - self.position)
+        else:
+            self.seek_frame(frame)
+
+    def step(self, count: int = 1) -> None:
+        """フレーム単位で移動（負の値で戻る）"""
+        if count <= 0:
+            if count < 0:
+                self.seek_frame(self.position + count)
+            return
+        stop = min(self.position + count, len(self.frames) - 1)
+        hits, clicks, spawns, on_target = _decode_counts(self.frames, self.position + 1, stop + 1)
+        self.position = stop
+        self.hits += hits
+        self.clicks += clicks
+        self.spawns += spawns
+        self.on_target_time += on_target
+
+    def get_frame(self) -> Optional[np.void]:
+        """現在のフレームのレコード"""
+        return self.frames[self.position] if self.position >= 0 else None
+
+    def get_recent(self, count: int) -> np.ndarray:
+        """現在のフレームまでの直近 count フレーム"""
+        stop = self.position + 1
+        return self.frames[max(0, stop - count):stop]
@@ -6,6 +6,8 @@ import pygame
 from abc import ABC, abstractmethod
 from typing import Optional
 
+from ..render import SurfaceRenderer
+
 
 class Scene(ABC):
     """シーンの基底クラス"""
@@ -13,6 +15,7 @@ class Scene(ABC):
     def __init__(self, game):
         self.game = game
         self.next_scene: Optional[str] = None
+        self._surface_renderer = None
 
     @abstractmethod
     def handle_event(self, event: pygame.event.Event) -> None:
@@ -24,9 +27,32 @@ class Scene(ABC):
         """更新処理"""
         pass
 
-    @abstractmethod
     def draw(self, surface: pygame.Surface) -> None:
-        """描画処理"""
+        """
+        描画処理（サーフェスへ直接描画）
+
+        render() を実装したシーンはこの既定実装でサーフェスにも描画できる。
+        render() を実装しないシーンはこちらを実装する。
+        """
+        if self._surface_renderer is None or self._surface_renderer.screen is not surface:
+            self._surface_renderer = SurfaceRenderer(surface)
+        self.render(self._surface_renderer)
+
+    def render(self, renderer) -> None:
+        """
+        描画処理（レンダラー経由）
+
+        既定ではサーフェス描画（draw）の結果をそのまま反映する。
+        """
+        renderer.draw_with_surface(self.draw)
+
+    def write_snapshot(self, snapshot) -> None:
+        """
+        ライブテレメトリのスナップショットにシーン固有の値を書き込む
+
+        Args:
+            snapshot: live_bus.SNAPSHOT_DTYPE のレコード（共通の値は設定済み）
+        """
         pass
 
     def on_enter(self) -> None:
@@ -3,13 +3,25 @@ Flickingモード（瞬間エイム）
 """
 
 import pygame
-import time
+from datetime import datetime
+from typing import Optional
 from .base import Scene
 from ..target import Target
 from ..cursor import Cursor
 from ..ui.button import Button
+from ..ui.layer import StaticLayer
+from ..ui.chart import LineChart
 from ..session_logger import save_flicking_session, load_flicking_sessions
 from ..effects import ParticleSystem, ScoreAnimation
+from ..clock import NS_PER_MS
+from ..shot_log import make_shot, append_shots
+from ..live_bus import BUS_SESSION_ACTIVE, BUS_TARGET_VISIBLE
+from ..difficulty import load_difficulty_tiers, get_tier, step_tier, recorded_tier
+from ..render import NUMERIC_GLYPHS
+from ..telemetry import (
+    TelemetryRecorder,
+    FLAG_ON_TARGET, FLAG_CLICK, FLAG_HIT, FLAG_SPAWN,
+)
 from ..settings import (
     SCREEN_WIDTH, SCREEN_HEIGHT,
     COLOR_BACKGROUND, COLOR_TEXT, COLOR_ACCENT, COLOR_SUCCESS,
@@ -29,6 +41,10 @@ class FlickingScene(Scene):
         # ターゲット
         self.target = Target(radius=40)
         
+        # 難易度の段階（較正していない場合はこの固定値を使う）
+        self.base_radius = self.target.radius
+        self.difficulty_tiers = load_difficulty_tiers()
+        
         # カーソル
         self.cursor = game.cursor
         
@@ -36,19 +52,43 @@ class FlickingScene(Scene):
         self.target_count = 10  # ターゲット数
         self.current_target = 0
         self.session_active = False
+        self.session_start_ns = 0
         
         # 統計
         self.reaction_times = []
-        self.target_spawn_time = 0.0
         self.hits = 0
+        self.shots = []  # ショットごとの記録（セッション終了時に保存）
+        
+        # 反応時間の計測（ナノ秒）
+        # 出現時刻は出現したフレームが表示された時刻（表示されるまではNone）
+        self.target_spawn_ns: Optional[int] = None
+        self._spawn_frame = 0
+        # 左クリックのイベント到着時刻
+        self._click_ns: Optional[int] = None
         
         # リザルト表示
         self.show_result = False
+        self._result_version = 0
+        
+        # 静的レイヤー（開始画面・リザルト画面）
+        self.start_layer = StaticLayer(self._render_start)
+        self.result_layer = StaticLayer(self._render_result)
+        
+        # 直近5セッションのグラフ
+        self.result_chart = LineChart(
+            SCREEN_WIDTH // 2 - 200, 310, 400, 80,
+            "直近5セッション", self.font, (255, 100, 100),
+            show_labels=False
+        )
         
         # エフェクト
         self.particles = ParticleSystem()
         self.score_animation = None
         
+        # フレーム単位のテレメトリ記録
+        self.recorder = TelemetryRecorder()
+        self._spawn_flag = 0
+        
         # UI
         self.back_button = Button(
             10, 10, 100, 40,
@@ -73,49 +113,103 @@ class FlickingScene(Scene):
         self._click_processed = False
 
     def handle_event(self, event: pygame.event.Event) -> None:
-        if event.type == pygame.KEYDOWN:
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            if self._click_ns is None:
+                self._click_ns = self.game.clock.event_time_ns(event)
+        elif event.type == pygame.KEYDOWN:
             if event.key == pygame.K_ESCAPE:
                 if self.session_active:
-                    self._end_session()
+                    self.end_session()
                 else:
                     self.request_scene_change("launcher")
+            elif event.key in (pygame.K_LEFT, pygame.K_RIGHT):
+                # 開始前は左右キーで難易度を選ぶ
+                if not self.session_active and not self.show_result:
+                    step = -1 if event.key == pygame.K_LEFT else 1
+                    self.game.difficulty = step_tier(
+                        self.difficulty_tiers, "flicking", self.game.difficulty, step
+                    )
+
+    def on_enter(self) -> None:
+        """セッション中に戻ってきた場合は相対モードを再開（難易度の段階は較正し直した場合に備えて読み直す）"""
+        self.difficulty_tiers = load_difficulty_tiers()
+        if self.session_active:
+            self.game.input_handler.begin_raw_capture()
+
+    def on_exit(self) -> None:
+        """シーンを離れるときは相対モードを解除"""
+        self.game.input_handler.end_raw_capture()
 
     def update(self, dt: float) -> None:
-        mouse_pos = pygame.mouse.get_pos()
-        mouse_pressed = pygame.mouse.get_pressed()[0]
+        mouse_pos = self.game.input_handler.get_mouse_position()
+        input_handler = self.game.input_handler
+        mouse_pressed = input_handler.is_primary_pressed()
         self._mouse_just_pressed = mouse_pressed and not self._mouse_was_pressed
         self._mouse_was_pressed = mouse_pressed
         
         # 入力更新
-        self.game.input_handler.update()
+        input_handler.update()
         
         # カーソル更新
-        if self.game.input_handler.active_device == DeviceType.MOUSE:
+        if input_handler.active_device == DeviceType.MOUSE and not input_handler.is_raw_capture_active():
             self.cursor.set_position(mouse_pos[0], mouse_pos[1])
         else:
-            dx, dy = self.game.input_handler.get_cursor_velocity(dt)
+            # ゲームパッド・生マウス入力はカーソル側で小数点以下まで蓄積する
+            dx, dy = input_handler.get_cursor_velocity(dt)
             self.cursor.update(dx, dy)
         
+        # 相対モード・仮想デバイスではOSのポインタ位置が動かないため、UI判定にカーソル位置を使う
+        if input_handler.is_cursor_detached():
+            mouse_pos = self.cursor.get_center()
+        
         # ボタン更新
         if self.back_button.update(mouse_pos, self._mouse_just_pressed):
             self.request_scene_change("launcher")
         
         if not self.session_active and not self.show_result:
             if self.start_button.update(mouse_pos, self._mouse_just_pressed):
-                self._start_session()
+                self.start_session()
         
         if self.show_result:
             if self.retry_button.update(mouse_pos, self._mouse_just_pressed):
                 self._reset()
         
+        # 出現したフレームが表示されていれば、その表示時刻を出現時刻とする
+        clock = self.game.clock
+        if self.session_active and self.target_spawn_ns is None:
+            self.target_spawn_ns = clock.presented_at(self._spawn_frame)
+        
+        # テレメトリ記録（クリック判定でターゲットが移動する前の状態）
+        if self.session_active:
+            cursor_pos = self.cursor.get_position()
+            flags = self._spawn_flag
+            if self.target.check_hit(cursor_pos[0], cursor_pos[1]):
+                flags |= FLAG_ON_TARGET
+            if self._mouse_just_pressed and not self._click_processed:
+                flags |= FLAG_CLICK
+                if flags & FLAG_ON_TARGET:
+                    flags |= FLAG_HIT
+            self.recorder.record(
+                clock.seconds_since(self.session_start_ns),
+                cursor_pos[0], cursor_pos[1],
+                self.target.x, self.target.y, self.target.radius,
+                flags
+            )
+            self._spawn_flag = 0
+        
         # セッション中 - クリックで判定
         if self.session_active and self._mouse_just_pressed and not self._click_processed:
             self._click_processed = True
             cursor_pos = self.cursor.get_position()
+            reaction_time = self._reaction_time_ms()
+            is_hit = self.target.check_hit(cursor_pos[0], cursor_pos[1])
+            self.shots.append(make_shot(
+                len(self.shots), input_handler.get_active_device(), is_hit,
+                (self.target.x, self.target.y), cursor_pos, self.target.radius, reaction_time
+            ))
             
-            if self.target.check_hit(cursor_pos[0], cursor_pos[1]):
+            if is_hit:
                 # ヒット
-                reaction_time = (time.time() - self.target_spawn_time) * 1000  # ミリ秒
                 self.reaction_times.append(reaction_time)
                 self.hits += 1
                 # ヒットエフェクト
@@ -123,14 +217,14 @@ class FlickingScene(Scene):
                     self.target.x, self.target.y,
                     count=20, color=(100, 255, 150), speed=200
                 )
-                self._spawn_next_target()
+                self.spawn_next_target()
             else:
                 # ミス - 次のターゲットへ
                 self.particles.emit_burst(
                     cursor_pos[0], cursor_pos[1],
                     count=10, color=(255, 100, 100), speed=100
                 )
-                self._spawn_next_target()
+                self.spawn_next_target()
         
         # パーティクル更新
         if self.session_active:
@@ -139,28 +233,51 @@ class FlickingScene(Scene):
         # クリックリセット
         if not mouse_pressed:
             self._click_processed = False
+        self._click_ns = None
 
-    def draw(self, surface: pygame.Surface) -> None:
-        surface.fill(COLOR_BACKGROUND)
+    def write_snapshot(self, snapshot) -> None:
+        """セッション中のターゲット・反応時間をスナップショットに書き込む"""
+        if not self.session_active:
+            return
+        snapshot["target_x"] = self.target.x
+        snapshot["target_y"] = self.target.y
+        snapshot["target_r"] = self.target.radius
+        snapshot["session_time"] = self.game.clock.seconds_since(self.session_start_ns)
+        snapshot["hits"] = self.hits
+        snapshot["shots"] = len(self.shots)
+        if self.reaction_times:
+            snapshot["last_reaction_ms"] = self.reaction_times[-1]
+            snapshot["mean_reaction_ms"] = sum(self.reaction_times) / len(self.reaction_times)
+        snapshot["flags"] = BUS_SESSION_ACTIVE | BUS_TARGET_VISIBLE
+
+    def render(self, renderer) -> None:
+        if self.session_active:
+            renderer.clear(COLOR_BACKGROUND)
+        elif self.show_result:
+            self.result_layer.render(renderer, self._result_version)
+        else:
+            self.start_layer.render(renderer, (self.target_count, self._difficulty_label()))
         
         # 戻るボタン
-        self.back_button.draw(surface)
+        self.back_button.render(renderer)
         
         if self.session_active:
-            self._draw_session(surface)
+            self._draw_session(renderer)
         elif self.show_result:
-            self._draw_result(surface)
+            self._draw_result(renderer)
         else:
-            self._draw_start(surface)
+            self.start_button.render(renderer)
         
         # パーティクル描画
-        self.particles.draw(surface)
+        self.particles.render(renderer)
         
         # カーソル描画
-        self.cursor.draw(surface)
+        self.cursor.render(renderer)
 
-    def _draw_start(self, surface: pygame.Surface) -> None:
-        """開始前の画面"""
+    def _render_start(self, surface: pygame.Surface) -> None:
+        """開始前の画面（静的レイヤー）"""
+        surface.fill(COLOR_BACKGROUND)
+        
         title = self.font_large.render("Flicking Mode", True, COLOR_ACCENT)
         title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 150))
         surface.blit(title, title_rect)
@@ -173,47 +290,64 @@ class FlickingScene(Scene):
         count_rect = count_text.get_rect(center=(SCREEN_WIDTH // 2, 240))
         surface.blit(count_text, count_rect)
         
-        self.start_button.draw(surface)
+        label = self._difficulty_label()
+        if label:
+            difficulty_text = self.font.render(label, True, COLOR_TEXT)
+            difficulty_rect = difficulty_text.get_rect(center=(SCREEN_WIDTH // 2, 275))
+            surface.blit(difficulty_text, difficulty_rect)
+
+    def _difficulty_label(self):
+        """開始画面の難易度の表示（較正していない場合はNone）"""
+        if get_tier(self.difficulty_tiers, "flicking", self.game.difficulty) is None:
+            return None
+        return f"難易度: {self.game.difficulty}（← → で変更）"
 
-    def _draw_session(self, surface: pygame.Surface) -> None:
+    def _draw_session(self, renderer) -> None:
         """セッション中の画面"""
         # ターゲット描画
-        self.target.draw(surface)
+        self.target.render(renderer)
         
         # 進捗
-        progress_text = self.font.render(
-            f"{self.current_target}/{self.target_count}", True, COLOR_TEXT
+        renderer.glyph_text(
+            self.font, f"{self.current_target}/{self.target_count}", COLOR_TEXT,
+            (SCREEN_WIDTH - 80, 10)
         )
-        surface.blit(progress_text, (SCREEN_WIDTH - 80, 10))
         
         # ヒット数
-        hit_text = self.font.render(f"Hits: {self.hits}", True, COLOR_SUCCESS)
-        surface.blit(hit_text, (SCREEN_WIDTH - 80, 40))
+        renderer.glyph_text(self.font, f"Hits: {self.hits}", COLOR_SUCCESS, (SCREEN_WIDTH - 80, 40))
         
         # 直近の反応速度
         if self.reaction_times:
             last_rt = self.reaction_times[-1]
             rt_color = COLOR_SUCCESS if last_rt < 300 else COLOR_TEXT
-            rt_text = self.font.render(f"{last_rt:.0f}ms", True, rt_color)
-            surface.blit(rt_text, (SCREEN_WIDTH // 2 - 30, 10))
+            renderer.glyph_text(self.font, f"{last_rt:.0f}ms", rt_color, (SCREEN_WIDTH // 2 - 30, 10))
 
-    def _draw_result(self, surface: pygame.Surface) -> None:
-        """リザルト画面"""
+    def _draw_result(self, renderer) -> None:
+        """リザルト画面（動的部分）"""
         # スコアアニメーション更新
         if self.score_animation:
             self.score_animation.update(self.game.dt)
         
+        # 命中率（アニメーション付き）
+        accuracy = (self.hits / self.target_count) * 100 if self.target_count > 0 else 0
+        display_acc = self.score_animation.get_value() if self.score_animation else accuracy
+        acc_color = COLOR_SUCCESS if display_acc >= 70 else (255, 150, 100)
+        renderer.text(
+            self.font_large, f"命中率: {display_acc:.0f}%", acc_color,
+            (SCREEN_WIDTH // 2, 140), anchor="center"
+        )
+        
+        self.retry_button.render(renderer)
+
+    def _render_result(self, surface: pygame.Surface) -> None:
+        """リザルト画面（静的レイヤー）"""
+        surface.fill(COLOR_BACKGROUND)
+        
         title = self.font_large.render("結果", True, COLOR_ACCENT)
         title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 80))
         surface.blit(title, title_rect)
         
-        # 命中率（アニメーション付き）
         accuracy = (self.hits / self.target_count) * 100 if self.target_count > 0 else 0
-        display_acc = self.score_animation.get_value() if self.score_animation else accuracy
-        acc_color = COLOR_SUCCESS if display_acc >= 70 else (255, 150, 100)
-        acc_text = self.font_large.render(f"命中率: {display_acc:.0f}%", True, acc_color)
-        acc_rect = acc_text.get_rect(center=(SCREEN_WIDTH // 2, 140))
-        surface.blit(acc_text, acc_rect)
         
         # 平均反応速度
         if self.reaction_times:
@@ -244,80 +378,67 @@ class FlickingScene(Scene):
         surface.blit(grade_text, grade_rect)
         
         # 直近5セッションのグラフ
-        sessions = load_flicking_sessions(5)
-        if sessions:
-            self._draw_result_graph(surface, sessions, 310)
+        if self.result_chart.get_count() > 0:
+            self.result_chart.draw(surface)
         else:
             grade = "C - Keep practicing"
         
         grade_text = self.font.render(grade, True, COLOR_TEXT)
         grade_rect = grade_text.get_rect(center=(SCREEN_WIDTH // 2, 330))
         surface.blit(grade_text, grade_rect)
-        
-        self.retry_button.draw(surface)
-
-    def _draw_result_graph(self, surface: pygame.Surface, sessions: list, y_pos: int) -> None:
-        """リザルトグラフを描画"""
-        graph_width = 400
-        graph_height = 80
-        x_pos = SCREEN_WIDTH // 2 - graph_width // 2
-        
-        # タイトル
-        title = self.font.render("直近5セッション", True, COLOR_TEXT)
-        surface.blit(title, (x_pos, y_pos - 20))
-        
-        # 枠
-        pygame.draw.rect(surface, (60, 60, 80), (x_pos, y_pos, graph_width, graph_height), 2)
-        
-        if len(sessions) < 2:
-            return
-        
-        # データ
-        accuracies = [s['accuracy'] for s in sessions]
-        max_val = max(accuracies) if max(accuracies) > 0 else 100
-        min_val = min(accuracies) if min(accuracies) < max_val else 0
-        value_range = max_val - min_val if max_val > min_val else 1
-        
-        # 点とライン
-        points = []
-        for i, acc in enumerate(accuracies):
-            px = x_pos + (i / (len(accuracies) - 1)) * graph_width
-            py = y_pos + graph_height - ((acc - min_val) / value_range) * graph_height
-            points.append((int(px), int(py)))
-        
-        # ライン描画
-        if len(points) >= 2:
-            pygame.draw.lines(surface, (255, 100, 100), False, points, 2)
-        
-        # 点描画
-        for point in points:
-            pygame.draw.circle(surface, (255, 100, 100), point, 4)
 
-    def _start_session(self) -> None:
-        """セッション開始"""
+    def start_session(self) -> None:
+        """セッション開始（スタートボタン・ボット・アロケーション検査から呼ぶ）"""
         self.session_active = True
         self.current_target = 0
         self.hits = 0
         self.reaction_times = []
+        self.shots = []
         self.show_result = False
+        self.session_start_ns = self.game.clock.now_ns()
+        
+        # 選択中の難易度の半径
+        tier = get_tier(self.difficulty_tiers, "flicking", self.game.difficulty) or {}
+        self.target.radius = tier.get("radius", self.base_radius)
+        
+        # 進捗・ヒット数・反応速度の数値のグリフ
+        for color in (COLOR_TEXT, COLOR_SUCCESS):
+            self.game.renderer.preload_glyphs(self.font, NUMERIC_GLYPHS, color)
         
-        self._spawn_next_target()
+        self.recorder.start("flicking")
+        self.game.input_handler.begin_raw_capture()
+        self.spawn_next_target()
 
-    def _spawn_next_target(self) -> None:
+    def spawn_next_target(self) -> None:
         """次のターゲットを出現"""
         self.current_target += 1
         
         if self.current_target > self.target_count:
-            self._end_session()
+            self.end_session()
             return
         
         self.target.spawn_random()
-        self.target_spawn_time = time.time()
+        # このフレームが表示された時刻を次の update で出現時刻にする
+        self._spawn_frame = self.game.clock.frame_index
+        self.target_spawn_ns = None
+        self._spawn_flag = FLAG_SPAWN
 
-    def _end_session(self) -> None:
+    def _reaction_time_ms(self) -> float:
+        """
+        ターゲットが表示されてからクリックするまでの時間（ミリ秒）
+
+        クリックはイベントの到着時刻、出現はそのフレームの表示時刻を使う。
+        """
+        clock = self.game.clock
+        click_ns = self._click_ns if self._click_ns is not None else clock.now_ns()
+        spawn_ns = self.target_spawn_ns if self.target_spawn_ns is not None else click_ns
+        return max(0, click_ns - spawn_ns) / NS_PER_MS
+
+    def end_session(self) -> None:
         """セッション終了"""
         self.session_active = False
         self.show_result = True
+        self.game.input_handler.end_raw_capture()
         self.target.is_active = False
         
         # セッション結果を保存
@@ -328,8 +449,27 @@ class FlickingScene(Scene):
         # スコアアニメーション開始
         self.score_animation = ScoreAnimation(accuracy, duration=1.5)
         
-        save_flicking_session(accuracy, avg_reaction, min_reaction, self.hits, self.target_count)
+        timestamp = datetime.now()
+        tier = recorded_tier(self.difficulty_tiers, "flicking", self.game.difficulty)
+        save_flicking_session(
+            accuracy, avg_reaction, min_reaction, self.hits, self.target_count, timestamp, tier
+        )
+        append_shots(self.shots, timestamp)
+        self.recorder.finish(timestamp)
         print(f"Flicking結果を保存: 命中率 {accuracy:.0f}%, 平均 {avg_reaction:.0f}ms")
+        
+        # リザルト画面用の履歴（同じ段階のみ）は終了時に1回だけ読み込む
+        self.result_chart.set_data([s['accuracy'] for s in load_flicking_sessions(5, tier)])
+        self._result_version += 1
+
+    def cancel_session(self) -> None:
+        """セッションを記録せずに終了（アロケーション検査など、結果を残さない計測用）"""
+        if not self.session_active:
+            return
+        self.session_active = False
+        self.recorder.cancel()
+        self.particles.clear()
+        self.game.input_handler.end_raw_capture()
 
     def _reset(self) -> None:
         """リセット"""
@@ -338,3 +478,4 @@ class FlickingScene(Scene):
         self.current_target = 0
         self.hits = 0
         self.reaction_times = []
+        self.shots = []
@@ -6,6 +6,7 @@ import pygame
 from .base import Scene
 from ..ui.button import Button
 from ..ui.slider import Slider
+from ..ui.layer import StaticLayer, WidgetLayer
 from ..profile import save_profile, create_profile_from_input_handler
 from ..settings import SCREEN_WIDTH, SCREEN_HEIGHT, COLOR_BACKGROUND, COLOR_TEXT, COLOR_ACCENT
 
@@ -86,6 +87,27 @@ class LauncherScene(Scene):
             color=(100, 60, 60), handle_color=(255, 120, 120)
         )
         
+        self.sliders = [
+            self.sensitivity_slider,
+            self.deadzone_slider,
+            self.tracking_time_slider,
+            self.flicking_count_slider,
+        ]
+        
+        self.buttons = [
+            self.tracking_button,
+            self.flicking_button,
+            self.save_button,
+            self.stats_button,
+        ]
+        
+        # 静的レイヤー（テキスト）とその上に合成するウィジェット
+        self.background_layer = StaticLayer(self._render_background)
+        self.widget_layer = WidgetLayer(self.background_layer, self.buttons + self.sliders)
+        
+        # 入力スライダーを同期済みのデバイス世代
+        self._device_version = game.input_handler.device_version
+        
         # マウス状態
         self._mouse_just_pressed = False
         self._mouse_was_pressed = False
@@ -95,8 +117,19 @@ class LauncherScene(Scene):
             if event.key == pygame.K_ESCAPE:
                 self.game.running = False
 
+    def _sync_device_sliders(self) -> None:
+        """選択デバイスが変わった場合、入力スライダーをそのデバイスの設定に合わせる"""
+        input_handler = self.game.input_handler
+        if self._device_version == input_handler.device_version:
+            return
+        self._device_version = input_handler.device_version
+        self.sensitivity_slider.set_value(input_handler.gamepad_sensitivity)
+        self.deadzone_slider.set_value(input_handler.deadzone)
+
     def update(self, dt: float) -> None:
-        mouse_pos = pygame.mouse.get_pos()
+        self._sync_device_sliders()
+        
+        mouse_pos = self.game.input_handler.get_mouse_position()
         mouse_pressed = pygame.mouse.get_pressed()[0]
         self._mouse_just_pressed = mouse_pressed and not self._mouse_was_pressed
         self._mouse_was_pressed = mouse_pressed
@@ -118,12 +151,19 @@ class LauncherScene(Scene):
             self.request_scene_change("flicking")
         
         if self.save_button.update(mouse_pos, self._mouse_just_pressed):
-            profile = create_profile_from_input_handler(self.game.input_handler)
+            profile = create_profile_from_input_handler(
+                self.game.input_handler, self.game.cursor, self.game.graphics_profile
+            )
+            profile["difficulty"] = self.game.difficulty
             if save_profile(profile):
                 print("設定を保存しました")
         
+        was_hovered = self.stats_button.is_hovered
         if self.stats_button.update(mouse_pos, self._mouse_just_pressed):
             self.request_scene_change("stats")
+        elif self.stats_button.is_hovered and not was_hovered:
+            # クリックされる前に統計の読み込みを始めておく
+            self.game.scenes["stats"].prefetch()
         
         # スライダー更新
         if self.sensitivity_slider.update(mouse_pos, mouse_pressed, self._mouse_just_pressed):
@@ -136,7 +176,22 @@ class LauncherScene(Scene):
         self.tracking_time_slider.update(mouse_pos, mouse_pressed, self._mouse_just_pressed)
         self.flicking_count_slider.update(mouse_pos, mouse_pressed, self._mouse_just_pressed)
 
-    def draw(self, surface: pygame.Surface) -> None:
+    def render(self, renderer) -> None:
+        # 背景はデバイス状態が変わったときだけ再構築し、
+        # ボタン・スライダーは見た目が変わったものだけ合成し直す
+        input_handler = self.game.input_handler
+        layer_key = (
+            input_handler.get_active_device(),
+            input_handler.get_gamepad_name(),
+            len(input_handler.devices),
+        )
+        self.widget_layer.render(renderer, layer_key)
+        
+        # カーソル描画
+        self.game.cursor.render(renderer)
+
+    def _render_background(self, surface: pygame.Surface) -> None:
+        """静的レイヤーを描画（ボタン・スライダーは WidgetLayer が合成）"""
         surface.fill(COLOR_BACKGROUND)
         
         # タイトル
@@ -155,7 +210,10 @@ class LauncherScene(Scene):
         surface.blit(device_text, (SCREEN_WIDTH // 2 - 100, 180))
         
         if self.game.input_handler.is_gamepad_connected():
-            status_text = self.font.render("🎮 ゲームパッド: 接続中", True, (100, 255, 150))
+            name = self.game.input_handler.get_gamepad_name()
+            count = len(self.game.input_handler.devices)
+            label = f"🎮 {name}" if count == 1 else f"🎮 {name} ({count}台接続中)"
+            status_text = self.font.render(label, True, (100, 255, 150))
         else:
             status_text = self.font.render("🖱 マウスモード", True, (200, 200, 200))
         surface.blit(status_text, (SCREEN_WIDTH // 2 - 80, 210))
@@ -167,21 +225,6 @@ class LauncherScene(Scene):
         flicking_desc = self.font.render("素早くターゲットを撃つ", True, (150, 150, 150))
         surface.blit(flicking_desc, (SCREEN_WIDTH // 2 + 110, 325))
         
-        # ボタン描画
-        self.tracking_button.draw(surface)
-        self.flicking_button.draw(surface)
-        self.save_button.draw(surface)
-        self.stats_button.draw(surface)
-        
-        # スライダー描画
-        self.sensitivity_slider.draw(surface)
-        self.deadzone_slider.draw(surface)
-        self.tracking_time_slider.draw(surface)
-        self.flicking_count_slider.draw(surface)
-        
         # 操作説明
         help_text = self.font.render("ESC: 終了", True, (100, 100, 100))
         surface.blit(help_text, (10, SCREEN_HEIGHT - 30))
-        
-        # カーソル描画
-        self.game.cursor.draw(surface)
@@ -0,0 +1,298 @@
+"""
+リプレイ画面（記録済みセッションの再生）
+"""
+
+import os
+import pygame
+from typing import List, Optional
+
+import numpy as np
+
+from .base import Scene
+from ..target import Target
+from ..cursor import Cursor
+from ..ui.button import Button
+from ..ui.layer import StaticLayer
+from ..replay import Replay, list_replays
+from ..telemetry import FLAG_CLICK, FLAG_HIT
+from ..settings import (
+    SCREEN_WIDTH, SCREEN_HEIGHT,
+    COLOR_BACKGROUND, COLOR_TEXT, COLOR_ACCENT, COLOR_SUCCESS,
+)
+
+
+# 再生速度の段階
+PLAYBACK_SPEEDS = (0.25, 0.5, 1.0, 2.0, 4.0, 8.0)
+
+# 矢印キーでのシーク幅（秒、Shift併用時は長い方）
+SEEK_STEP = 5.0
+SEEK_STEP_LONG = 30.0
+
+# カーソル軌跡のフレーム数とクリック表示の秒数
+TRAIL_FRAMES = 72
+CLICK_MARKER_SECONDS = 1.0
+
+COLOR_TRAIL = (120, 160, 220)
+COLOR_MISS = (255, 100, 100)
+COLOR_TIMELINE = (60, 60, 80)
+TIMELINE_KNOB_RADIUS = 8
+
+
+def _render_hit_marker() -> pygame.Surface:
+    """ヒットしたクリックの目印（緑の円）"""
+    surface = pygame.Surface((21, 21), pygame.SRCALPHA)
+    pygame.draw.circle(surface, COLOR_SUCCESS, (10, 10), 10, 2)
+    return surface
+
+
+def _render_miss_marker() -> pygame.Surface:
+    """ミスしたクリックの目印（赤の×）"""
+    surface = pygame.Surface((17, 17), pygame.SRCALPHA)
+    pygame.draw.line(surface, COLOR_MISS, (0, 0), (16, 16), 2)
+    pygame.draw.line(surface, COLOR_MISS, (0, 16), (16, 0), 2)
+    return surface
+
+
+def _render_timeline_knob() -> pygame.Surface:
+    """シークバーのつまみ"""
+    size = TIMELINE_KNOB_RADIUS * 2 + 1
+    surface = pygame.Surface((size, size), pygame.SRCALPHA)
+    pygame.draw.circle(surface, COLOR_TEXT, (TIMELINE_KNOB_RADIUS, TIMELINE_KNOB_RADIUS), TIMELINE_KNOB_RADIUS)
+    return surface
+
+
+class ReplayScene(Scene):
+    """リプレイ - カーソル軌跡・ターゲット・クリックを再生する"""
+
+    def __init__(self, game):
+        super().__init__(game)
+
+        self.font = game.font
+        self.font_large = game.font_large
+
+        # 再生状態
+        self.paths: List[str] = []
+        self.path_index = -1
+        self.replay: Optional[Replay] = None
+        self.play_time = 0.0
+        self.speed_index = PLAYBACK_SPEEDS.index(1.0)
+        self.paused = False
+
+        # 再生用の描画部品（ゲーム本体のカーソルとは別）
+        self.target = Target()
+        self.replay_cursor = Cursor()
+
+        # シークバー
+        self.timeline_rect = pygame.Rect(100, SCREEN_HEIGHT - 70, SCREEN_WIDTH - 200, 12)
+        self._dragging = False
+
+        # 静的レイヤー（背景・タイトル・操作説明）
+        self.background_layer = StaticLayer(self._render_background)
+
+        # UI
+        self.back_button = Button(
+            10, 10, 100, 40,
+            "戻る", self.font
+        )
+
+        # マウス状態
+        self._mouse_just_pressed = False
+        self._mouse_was_pressed = False
+
+    def on_enter(self) -> None:
+        """記録一覧を読み直し、最新の記録を開く"""
+        self.paths = list_replays()
+        self._open(len(self.paths) - 1)
+
+    def on_exit(self) -> None:
+        """メモリマップを解放"""
+        self.replay = None
+        self._dragging = False
+
+    def _open(self, index: int) -> None:
+        """一覧の index 番目の記録を開く"""
+        if not self.paths:
+            self.path_index = -1
+            self.replay = None
+            return
+        self.path_index = max(0, min(index, len(self.paths) - 1))
+        self.replay = Replay(self.paths[self.path_index])
+        self.play_time = 0.0
+        self.paused = False
+        self.replay.seek(0.0)
+
+    def _seek(self, t: float) -> None:
+        """時刻 t へシーク"""
+        if self.replay is None:
+            return
+        self.play_time = max(0.0, min(t, self.replay.duration))
+        self.replay.seek(self.play_time)
+
+    def _step(self, count: int) -> None:
+        """一時停止してフレーム単位で移動"""
+        if self.replay is None:
+            return
+        self.paused = True
+        self.replay.step(count)
+        self.play_time = self.replay.time
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        if event.type != pygame.KEYDOWN:
+            return
+
+        if event.key == pygame.K_ESCAPE:
+            self.request_scene_change("stats")
+        elif event.key == pygame.K_PAGEUP:
+            self._open(self.path_index - 1)
+        elif event.key == pygame.K_PAGEDOWN:
+            self._open(self.path_index + 1)
+        elif self.replay is None:
+            return
+        elif event.key == pygame.K_SPACE:
+            self.paused = not self.paused
+            if not self.paused and self.play_time >= self.replay.duration:
+                self._seek(0.0)
+        elif event.key in (pygame.K_LEFT, pygame.K_RIGHT):
+            step = SEEK_STEP_LONG if event.mod & pygame.KMOD_SHIFT else SEEK_STEP
+            self._seek(self.play_time + (step if event.key == pygame.K_RIGHT else -step))
+        elif event.key == pygame.K_PERIOD:
+            self._step(1)
+        elif event.key == pygame.K_COMMA:
+            self._step(-1)
+        elif event.key == pygame.K_UP:
+            self.speed_index = min(self.speed_index + 1, len(PLAYBACK_SPEEDS) - 1)
+        elif event.key == pygame.K_DOWN:
+            self.speed_index = max(self.speed_index - 1, 0)
+        elif event.key == pygame.K_HOME:
+            self._seek(0.0)
+        elif event.key == pygame.K_END:
+            self._seek(self.replay.duration)
+
+    def update(self, dt: float) -> None:
+        mouse_pos = self.game.input_handler.get_mouse_position()
+        mouse_pressed = pygame.mouse.get_pressed()[0]
+        self._mouse_just_pressed = mouse_pressed and not self._mouse_was_pressed
+        self._mouse_was_pressed = mouse_pressed
+
+        self.game.cursor.set_position(mouse_pos[0], mouse_pos[1])
+
+        if self.back_button.update(mouse_pos, self._mouse_just_pressed):
+            self.request_scene_change("stats")
+
+        if self.replay is None:
+            return
+
+        # シークバーのクリック・ドラッグ
+        if self._mouse_just_pressed and self.timeline_rect.inflate(0, 16).collidepoint(mouse_pos):
+            self._dragging = True
+        if not mouse_pressed:
+            self._dragging = False
+        if self._dragging:
+            ratio = (mouse_pos[0] - self.timeline_rect.x) / self.timeline_rect.width
+            self._seek(max(0.0, min(ratio, 1.0)) * self.replay.duration)
+            return
+
+        # 再生
+        if not self.paused:
+            self.play_time += dt * PLAYBACK_SPEEDS[self.speed_index]
+            if self.play_time >= self.replay.duration:
+                self.play_time = self.replay.duration
+                self.paused = True
+            self.replay.advance_to(self.play_time)
+
+    def render(self, renderer) -> None:
+        # 背景・タイトル・シークバーの枠は記録を切り替えたときだけ変化する
+        self.background_layer.render(renderer, (self.path_index, len(self.paths)))
+
+        if self.replay is not None and self.replay.position >= 0:
+            self._draw_playfield(renderer)
+            self._draw_hud(renderer)
+        self._draw_timeline(renderer)
+
+        self.back_button.render(renderer)
+        self.game.cursor.render(renderer)
+
+    def _render_background(self, surface: pygame.Surface) -> None:
+        """静的レイヤーを描画"""
+        surface.fill(COLOR_BACKGROUND)
+        pygame.draw.rect(surface, COLOR_TIMELINE, self.timeline_rect, border_radius=4)
+
+        if self.replay is None:
+            message = self.font_large.render("再生できる記録がありません", True, COLOR_TEXT)
+            surface.blit(message, message.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)))
+            return
+
+        name = os.path.splitext(os.path.basename(self.replay.path))[0]
+        title = self.font.render(
+            f"リプレイ: {self.replay.mode} {name} ({self.path_index + 1}/{len(self.paths)})",
+            True, COLOR_ACCENT
+        )
+        surface.blit(title, title.get_rect(center=(SCREEN_WIDTH // 2, 30)))
+
+        help_text = self.font.render(
+            "Space: 再生/停止  ←→: シーク  , .: コマ送り  ↑↓: 速度  PgUp/PgDn: 記録の切替",
+            True, (100, 100, 100)
+        )
+        surface.blit(help_text, (10, SCREEN_HEIGHT - 30))
+
+    def _draw_playfield(self, renderer) -> None:
+        """ターゲット・カーソル軌跡・クリック位置を描画"""
+        replay = self.replay
+        frame = replay.get_frame()
+
+        # ターゲット
+        self.target.x = float(frame["target_x"])
+        self.target.y = float(frame["target_y"])
+        self.target.radius = float(frame["target_r"])
+        self.target.render(renderer)
+
+        # カーソル軌跡
+        recent = replay.get_recent(TRAIL_FRAMES)
+        if len(recent) >= 2:
+            points = np.column_stack((recent["cursor_x"], recent["cursor_y"])).tolist()
+            renderer.lines(COLOR_TRAIL, points)
+
+        # 直近のクリック（ヒット: 緑の円, ミス: 赤の×）
+        since = replay.time - CLICK_MARKER_SECONDS
+        marker_frames = replay.get_recent(TRAIL_FRAMES * 4)
+        marker_frames = marker_frames[(marker_frames["t"] >= since) & ((marker_frames["flags"] & FLAG_CLICK) != 0)]
+        for record in marker_frames:
+            center = (int(record["cursor_x"]), int(record["cursor_y"]))
+            if record["flags"] & FLAG_HIT:
+                renderer.sprite(("replay_hit",), _render_hit_marker, center)
+            else:
+                renderer.sprite(("replay_miss",), _render_miss_marker, center)
+
+        # 記録されたカーソル
+        self.replay_cursor.set_position(float(frame["cursor_x"]), float(frame["cursor_y"]))
+        self.replay_cursor.render(renderer)
+
+    def _draw_hud(self, renderer) -> None:
+        """再生位置・速度・累積スコアを描画（毎フレーム変わるためグリフ単位で描画）"""
+        replay = self.replay
+        state = "一時停止" if self.paused else "再生中"
+        status = f"{replay.time:.2f} / {replay.duration:.2f}s  x{PLAYBACK_SPEEDS[self.speed_index]:g}  {state}"
+        renderer.glyph_text(self.font, status, COLOR_TEXT, (self.timeline_rect.x, self.timeline_rect.y - 30))
+
+        if replay.mode == "flicking":
+            score = f"Hits: {replay.hits} / Clicks: {replay.clicks}  Targets: {replay.spawns}"
+        else:
+            t0 = replay.on_target_time / replay.time * 100 if replay.time > 0 else 0.0
+            score = f"T0: {t0:.1f}%"
+        # 右揃え（グリフ単位の描画はカーニングを考慮しないため幅は近似）
+        score_width = self.font.size(score)[0]
+        renderer.glyph_text(
+            self.font, score, COLOR_SUCCESS,
+            (self.timeline_rect.right - score_width, self.timeline_rect.y - 30)
+        )
+
+    def _draw_timeline(self, renderer) -> None:
+        """シークバーの再生済み部分とつまみを描画（枠は静的レイヤー）"""
+        rect = self.timeline_rect
+        if self.replay is None or self.replay.duration <= 0:
+            return
+        ratio = min(self.play_time / self.replay.duration, 1.0)
+        filled = rect.copy()
+        filled.width = int(rect.width * ratio)
+        renderer.fill_rect(COLOR_ACCENT, filled)
+        renderer.sprite(("timeline_knob",), _render_timeline_knob, (rect.x + filled.width, rect.centery))
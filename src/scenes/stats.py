@@ -2,21 +2,103 @@
 統計・分析ダッシュボード画面
 """
 
+import numpy as np
 import pygame
 from .base import Scene
+from .. import profiling
 from ..ui.button import Button
-from ..session_logger import (
-    get_tracking_stats,
-    get_flicking_stats,
-    load_tracking_sessions,
-    load_flicking_sessions
-)
+from ..ui.layer import StaticLayer
+from ..ui.chart import LineChart, MinMaxPyramid
+from ..session_logger import get_tracking_stats, get_flicking_stats, get_csv_path, NO_TIER
+from ..export import load_columns
+from ..shot_log import get_reaction_percentiles, get_shot_log_path
+from ..difficulty import TIERS, available_tiers, load_difficulty_tiers
+from ..catalog import get_catalog_path, load_catalog
+from ..heatmap import compute_loss_heatmap, compute_miss_heatmap, render_heatmap, MISS_RANGE
+from ..stats_loader import StatsLoader
 from ..settings import (
     SCREEN_WIDTH, SCREEN_HEIGHT,
     COLOR_BACKGROUND, COLOR_TEXT, COLOR_ACCENT, COLOR_SUCCESS
 )
 
 
+# 画面に入ったときに読み込むセクション（ヒートマップは表示時のみ）
+BASE_SECTIONS = ("tracking", "flicking", "reactions", "tracking_chart", "flicking_chart")
+
+# 読み込み中・失敗時の表示色
+COLOR_PLACEHOLDER = (150, 150, 150)
+
+
+def _tier_sessions(mode: str, difficulty):
+    """
+    段階のセッションの時刻（ショット記録の session 値・カタログのセッションID）
+
+    Returns:
+        マイクロ秒の配列（difficulty が None の場合は絞り込まないので None）
+    """
+    if difficulty is None:
+        return None
+    columns = load_columns(mode, ["timestamp", "difficulty"])
+    return columns["timestamp"][columns["difficulty"] == difficulty].astype(np.int64)
+
+
+def _load_chart(mode: str, column: str, difficulty=None) -> MinMaxPyramid:
+    """スコア推移グラフのピラミッドを作成（ワーカースレッドで呼ぶ）"""
+    columns = load_columns(mode, [column, "difficulty"])
+    values = columns[column]
+    if difficulty is not None:
+        values = values[columns["difficulty"] == difficulty]
+    return MinMaxPyramid(values)
+
+
+def _load_reactions(difficulty=None) -> dict:
+    """反応時間のパーセンタイルを計算（ワーカースレッドで呼ぶ）"""
+    return get_reaction_percentiles(sessions=_tier_sessions("flicking", difficulty))
+
+
+def _difficulty_filters() -> list:
+    """
+    統計を絞り込む難易度の選択肢（None は全段階、NO_TIER は段階を使わなかったセッション）
+    """
+    tiers = load_difficulty_tiers()
+    calibrated = set(available_tiers(tiers, "tracking")) | set(available_tiers(tiers, "flicking"))
+    return [None] + [name for name in TIERS if name in calibrated] + [NO_TIER]
+
+
+def _difficulty_filter_label(difficulty) -> str:
+    """難易度の絞り込みの表示名"""
+    if difficulty is None:
+        return "全て"
+    return difficulty or "段階なし"
+
+
+def _compute_heatmaps(difficulty=None) -> dict:
+    """ヒートマップのヒストグラムを計算（ワーカースレッドで呼ぶ）"""
+    catalog = load_catalog()
+    tracking_sessions = catalog.query("tracking", sessions=_tier_sessions("tracking", difficulty))
+    flicking_sessions = catalog.query("flicking", sessions=_tier_sessions("flicking", difficulty))
+    loss_hist, loss_samples = compute_loss_heatmap(sessions=tracking_sessions)
+    miss_hist, miss_count = compute_miss_heatmap(sessions=flicking_sessions)
+    return {
+        "loss_hist": loss_hist,
+        "loss_samples": loss_samples,
+        "loss_sessions": len(tracking_sessions),
+        "miss_hist": miss_hist,
+        "miss_count": miss_count,
+        "miss_sessions": len(flicking_sessions),
+    }
+
+
+def _stats_sources() -> list:
+    """統計の読み込み元ファイル（変更の検出用）"""
+    return [
+        get_csv_path("tracking"),
+        get_csv_path("flicking"),
+        get_shot_log_path(),
+        get_catalog_path(),
+    ]
+
+
 class StatsScene(Scene):
     """統計・分析ダッシュボード"""
 
@@ -32,26 +114,121 @@ class StatsScene(Scene):
             "戻る", self.font
         )
         
-        # 統計データ
-        self.tracking_stats = {}
-        self.flicking_stats = {}
+        self.view_button = Button(
+            SCREEN_WIDTH - 170, 10, 160, 40,
+            "ヒートマップ", self.font
+        )
+        
+        self.replay_button = Button(
+            SCREEN_WIDTH - 340, 10, 160, 40,
+            "リプレイ", self.font
+        )
+        
+        # 難易度の絞り込み（None: 全段階）。段階の違うスコアを混ぜずに集計する
+        self.difficulty_filter = None
+        self.difficulty_button = Button(
+            SCREEN_WIDTH - 530, 10, 180, 40,
+            self._difficulty_button_text(), self.font
+        )
+        
+        # 統計データ（ワーカースレッドで読み込み、届いたセクションから表示）
+        # 読み込み関数はワーカースレッドで呼ばれた時点の絞り込みを使う
+        self.loader = StatsLoader(
+            {
+                "tracking": lambda: get_tracking_stats(self.difficulty_filter),
+                "flicking": lambda: get_flicking_stats(self.difficulty_filter),
+                "reactions": lambda: _load_reactions(self.difficulty_filter),
+                "tracking_chart": lambda: _load_chart("tracking", "t0_rate", self.difficulty_filter),
+                "flicking_chart": lambda: _load_chart("flicking", "accuracy", self.difficulty_filter),
+                "heatmaps": lambda: _compute_heatmaps(self.difficulty_filter),
+            },
+            _stats_sources,
+        )
+        self._loaded_generation = 0
+        self._stats_version = 0
+        
+        # 静的レイヤー（統計テキスト）
+        self.background_layer = StaticLayer(self._render_background)
+        
+        # スコア推移グラフ（全履歴、パン・ズーム対応）
+        graph_width = 480
+        graph_height = 150
+        graph_y = 400
+        self.tracking_chart = LineChart(
+            120, graph_y, graph_width, graph_height,
+            "Tracking - T0率推移", self.font, (80, 140, 80)
+        )
+        self.flicking_chart = LineChart(
+            SCREEN_WIDTH // 2 + 80, graph_y, graph_width, graph_height,
+            "Flicking - 命中率推移", self.font, (255, 100, 100)
+        )
+        self.charts = [self.tracking_chart, self.flicking_chart]
+        
+        # ヒートマップ（表示時に読み込みを依頼し、統計の再読み込みまでキャッシュ）
+        self.show_heatmap = False
+        self.loss_heatmap_rect = pygame.Rect(120, 360, 480, 270)
+        self.miss_heatmap_rect = pygame.Rect(SCREEN_WIDTH // 2 + 185, 360, 270, 270)
+        self._loss_surface = None
+        self._miss_surface = None
         
         # マウス状態
         self._mouse_just_pressed = False
         self._mouse_was_pressed = False
 
     def on_enter(self) -> None:
-        """シーン開始時にデータ読み込み"""
-        self.tracking_stats = get_tracking_stats()
-        self.flicking_stats = get_flicking_stats()
+        """読み込みを依頼する（結果は update で届いたものから反映）"""
+        with profiling.span("stats_load"):
+            self._request_sections()
+            self._sync_loader()
+
+    def prefetch(self) -> None:
+        """画面に入る前に読み込みを始める（ランチャーのボタンのホバー時）"""
+        self.loader.request(BASE_SECTIONS)
+
+    def _request_sections(self) -> None:
+        """表示中の項目の読み込みを依頼"""
+        self.loader.request(BASE_SECTIONS + (("heatmaps",) if self.show_heatmap else ()))
+
+    def _sync_loader(self) -> None:
+        """届いた読み込み結果を反映"""
+        if self._loaded_generation != self.loader.generation:
+            # 読み込み元が変わったので古い表示を捨てる
+            self._loaded_generation = self.loader.generation
+            for chart in self.charts:
+                chart.set_pyramid(None)
+            self._loss_surface = None
+            self._miss_surface = None
+            self._stats_version += 1
+        
+        arrived = self.loader.poll()
+        for name in arrived:
+            if name == "tracking_chart":
+                self.tracking_chart.set_pyramid(self.loader.get(name))
+            elif name == "flicking_chart":
+                self.flicking_chart.set_pyramid(self.loader.get(name))
+            elif name == "heatmaps":
+                self._render_heatmaps()
+        if arrived:
+            self._stats_version += 1
 
     def handle_event(self, event: pygame.event.Event) -> None:
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_ESCAPE:
                 self.request_scene_change("launcher")
+            elif event.key == pygame.K_r:
+                for chart in self.charts:
+                    chart.reset_view()
+            elif event.key == pygame.K_h:
+                self._toggle_view()
+            elif event.key == pygame.K_d:
+                self._cycle_difficulty_filter()
+        
+        if not self.show_heatmap:
+            for chart in self.charts:
+                chart.handle_event(event)
 
     def update(self, dt: float) -> None:
-        mouse_pos = pygame.mouse.get_pos()
+        mouse_pos = self.game.input_handler.get_mouse_position()
         mouse_pressed = pygame.mouse.get_pressed()[0]
         self._mouse_just_pressed = mouse_pressed and not self._mouse_was_pressed
         self._mouse_was_pressed = mouse_pressed
@@ -59,15 +236,96 @@ class StatsScene(Scene):
         # カーソル位置更新
         self.game.cursor.set_position(mouse_pos[0], mouse_pos[1])
         
+        self._sync_loader()
+        
         # ボタン更新
         if self.back_button.update(mouse_pos, self._mouse_just_pressed):
             self.request_scene_change("launcher")
+        
+        if self.view_button.update(mouse_pos, self._mouse_just_pressed):
+            self._toggle_view()
+        
+        if self.replay_button.update(mouse_pos, self._mouse_just_pressed):
+            self.request_scene_change("replay")
+        
+        if self.difficulty_button.update(mouse_pos, self._mouse_just_pressed):
+            self._cycle_difficulty_filter()
 
-    def draw(self, surface: pygame.Surface) -> None:
-        surface.fill(COLOR_BACKGROUND)
+    def _difficulty_button_text(self) -> str:
+        """絞り込みボタンの表示"""
+        return f"難易度: {_difficulty_filter_label(self.difficulty_filter)}"
+
+    def _cycle_difficulty_filter(self) -> None:
+        """難易度の絞り込みを次の選択肢に切り替えて読み直す"""
+        filters = _difficulty_filters()
+        index = filters.index(self.difficulty_filter) if self.difficulty_filter in filters else -1
+        self.difficulty_filter = filters[(index + 1) % len(filters)]
+        self.difficulty_button.set_text(self._difficulty_button_text())
+        self.loader.invalidate()
+        self._request_sections()
+
+    def _toggle_view(self) -> None:
+        """グラフ表示とヒートマップ表示を切り替え"""
+        self.show_heatmap = not self.show_heatmap
+        self.view_button.set_text("グラフ" if self.show_heatmap else "ヒートマップ")
+        if self.show_heatmap:
+            self._request_sections()
+
+    def _render_heatmaps(self) -> None:
+        """届いたヒストグラムをサーフェスに変換してキャッシュ"""
+        heatmaps = self.loader.get("heatmaps")
+        if heatmaps is None:
+            return
+        
+        with profiling.span("heatmap_render"):
+            self._loss_surface = render_heatmap(heatmaps["loss_hist"], self.loss_heatmap_rect.size)
+            self._miss_surface = render_heatmap(heatmaps["miss_hist"], self.miss_heatmap_rect.size)
+        
+        # ミス位置にはターゲット中心と外周の目安を重ねる
+        size = self.miss_heatmap_rect.width
+        center = (size // 2, size // 2)
+        pygame.draw.line(self._miss_surface, (120, 120, 140), (center[0], 0), (center[0], size))
+        pygame.draw.line(self._miss_surface, (120, 120, 140), (0, center[1]), (size, center[1]))
+        pygame.draw.circle(
+            self._miss_surface, (200, 200, 220), center, int(size / (2 * MISS_RANGE)), 1
+        )
+
+    def _draw_placeholder(self, surface: pygame.Surface, name: str, pos) -> bool:
+        """
+        未読み込みのセクションの代わりに表示
+
+        Returns:
+            True: 代わりを表示した（セクションは描画しない）
+        """
+        if self.loader.is_loaded(name) and not self.loader.failed(name):
+            return False
+        message = "読み込みエラー" if self.loader.failed(name) else "読み込み中..."
+        text = self.font.render(message, True, COLOR_PLACEHOLDER)
+        surface.blit(text, pos)
+        return True
+
+    def render(self, renderer) -> None:
+        # 統計・ヒートマップは読み込み時・表示切り替え時にのみ変化する
+        self.background_layer.render(renderer, (self._stats_version, self.show_heatmap))
         
-        # 戻るボタン
-        self.back_button.draw(surface)
+        # グラフ（ビューポートごとにキャッシュ済み）
+        if not self.show_heatmap:
+            for chart in self.charts:
+                if chart.get_count() > 0:
+                    chart.render(renderer)
+        
+        # ボタン
+        self.back_button.render(renderer)
+        self.view_button.render(renderer)
+        self.replay_button.render(renderer)
+        self.difficulty_button.render(renderer)
+        
+        # カーソル描画
+        self.game.cursor.render(renderer)
+
+    def _render_background(self, surface: pygame.Surface) -> None:
+        """静的レイヤーを描画"""
+        surface.fill(COLOR_BACKGROUND)
         
         # タイトル
         title = self.font_large.render("統計・分析", True, COLOR_ACCENT)
@@ -85,11 +343,46 @@ class StatsScene(Scene):
         # Flicking統計
         self._draw_flicking_stats(surface, right_x, y_start)
         
-        # グラフ
-        self._draw_graphs(surface, y_start + 250)
+        if self.show_heatmap:
+            self._draw_heatmaps(surface)
+            help_message = "H: グラフ表示 / D: 難易度"
+        else:
+            for chart, name in ((self.tracking_chart, "tracking_chart"), (self.flicking_chart, "flicking_chart")):
+                self._draw_placeholder(surface, name, chart.rect.topleft)
+            help_message = "ホイール: ズーム / ドラッグ: 移動 / R: 全体表示 / H: ヒートマップ / D: 難易度"
+        
+        # 操作説明
+        help_text = self.font.render(help_message, True, (100, 100, 100))
+        surface.blit(help_text, (10, SCREEN_HEIGHT - 30))
+
+    def _draw_heatmaps(self, surface: pygame.Surface) -> None:
+        """キャッシュ済みヒートマップを描画"""
+        loss_rect = self.loss_heatmap_rect
+        miss_rect = self.miss_heatmap_rect
+        
+        if self._draw_placeholder(surface, "heatmaps", (loss_rect.x, loss_rect.y - 25)):
+            pygame.draw.rect(surface, (60, 60, 80), loss_rect, 2)
+            pygame.draw.rect(surface, (60, 60, 80), miss_rect, 2)
+            return
         
-        # カーソル描画
-        self.game.cursor.draw(surface)
+        heatmaps = self.loader.get("heatmaps")
+        loss_title = self.font.render(
+            f"Tracking - ターゲットを見失った位置 ({heatmaps['loss_sessions']}セッション, "
+            f"{heatmaps['loss_samples']}フレーム)", True, COLOR_TEXT
+        )
+        surface.blit(loss_title, (loss_rect.x, loss_rect.y - 25))
+        miss_title = self.font.render(
+            f"Flicking - ミス位置 ({heatmaps['miss_sessions']}セッション, {heatmaps['miss_count']}回)",
+            True, COLOR_TEXT
+        )
+        surface.blit(miss_title, (miss_rect.x, miss_rect.y - 25))
+        
+        if self._loss_surface:
+            surface.blit(self._loss_surface, loss_rect)
+        if self._miss_surface:
+            surface.blit(self._miss_surface, miss_rect)
+        pygame.draw.rect(surface, (60, 60, 80), loss_rect, 2)
+        pygame.draw.rect(surface, (60, 60, 80), miss_rect, 2)
 
     def _draw_tracking_stats(self, surface: pygame.Surface, x: int, y: int) -> None:
         """Tracking統計を描画"""
@@ -98,29 +391,33 @@ class StatsScene(Scene):
         surface.blit(title, (x, y))
         y += 40
         
-        if self.tracking_stats['count'] == 0:
+        if self._draw_placeholder(surface, "tracking", (x, y)):
+            return
+        tracking_stats = self.loader.get("tracking")
+        
+        if tracking_stats['count'] == 0:
             no_data = self.font.render("データなし", True, (150, 150, 150))
             surface.blit(no_data, (x, y))
             return
         
         # セッション数
         count_text = self.font.render(
-            f"セッション数: {self.tracking_stats['count']}", True, COLOR_TEXT
+            f"セッション数: {tracking_stats['count']}", True, COLOR_TEXT
         )
         surface.blit(count_text, (x, y))
         y += 30
         
         # 平均T0率
         avg_text = self.font.render(
-            f"平均T0率: {self.tracking_stats['avg']:.1f}%", True, COLOR_TEXT
+            f"平均T0率: {tracking_stats['avg']:.1f}%", True, COLOR_TEXT
         )
         surface.blit(avg_text, (x, y))
         y += 30
         
         # 最高T0率
-        best_color = COLOR_SUCCESS if self.tracking_stats['best'] >= 70 else COLOR_TEXT
+        best_color = COLOR_SUCCESS if tracking_stats['best'] >= 70 else COLOR_TEXT
         best_text = self.font.render(
-            f"最高T0率: {self.tracking_stats['best']:.1f}%", True, best_color
+            f"最高T0率: {tracking_stats['best']:.1f}%", True, best_color
         )
         surface.blit(best_text, (x, y))
 
@@ -131,106 +428,52 @@ class StatsScene(Scene):
         surface.blit(title, (x, y))
         y += 40
         
-        if self.flicking_stats['count'] == 0:
+        if self._draw_placeholder(surface, "flicking", (x, y)):
+            return
+        flicking_stats = self.loader.get("flicking")
+        
+        if flicking_stats['count'] == 0:
             no_data = self.font.render("データなし", True, (150, 150, 150))
             surface.blit(no_data, (x, y))
             return
         
         # セッション数
         count_text = self.font.render(
-            f"セッション数: {self.flicking_stats['count']}", True, COLOR_TEXT
+            f"セッション数: {flicking_stats['count']}", True, COLOR_TEXT
         )
         surface.blit(count_text, (x, y))
         y += 30
         
         # 平均命中率
         avg_text = self.font.render(
-            f"平均命中率: {self.flicking_stats['avg_acc']:.1f}%", True, COLOR_TEXT
+            f"平均命中率: {flicking_stats['avg_acc']:.1f}%", True, COLOR_TEXT
         )
         surface.blit(avg_text, (x, y))
         y += 30
         
         # 最高命中率
-        best_color = COLOR_SUCCESS if self.flicking_stats['best_acc'] >= 80 else COLOR_TEXT
+        best_color = COLOR_SUCCESS if flicking_stats['best_acc'] >= 80 else COLOR_TEXT
         best_text = self.font.render(
-            f"最高命中率: {self.flicking_stats['best_acc']:.1f}%", True, best_color
+            f"最高命中率: {flicking_stats['best_acc']:.1f}%", True, best_color
         )
         surface.blit(best_text, (x, y))
         y += 30
         
         # 平均反応速度
-        if self.flicking_stats['avg_reaction'] > 0:
+        if flicking_stats['avg_reaction'] > 0:
             reaction_text = self.font.render(
-                f"平均反応速度: {self.flicking_stats['avg_reaction']:.0f}ms", True, COLOR_TEXT
+                f"平均反応速度: {flicking_stats['avg_reaction']:.0f}ms", True, COLOR_TEXT
             )
             surface.blit(reaction_text, (x, y))
-
-    def _draw_graphs(self, surface: pygame.Surface, y_start: int) -> None:
-        """スコア推移グラフを描画"""
-        graph_height = 120
-        graph_width = 500
-        center_x = SCREEN_WIDTH // 2
-        
-        # Trackingグラフ
-        if self.tracking_stats['count'] > 0 and self.tracking_stats['recent']:
-            self._draw_line_graph(
-                surface,
-                center_x - graph_width // 2,
-                y_start,
-                graph_width,
-                graph_height,
-                self.tracking_stats['recent'],
-                "Tracking - 直近10セッション",
-                (80, 140, 80)
+            y += 30
+        
+        # 反応時間の分布（ショット記録から）
+        reaction_percentiles = self.loader.get("reactions", {})
+        if "p50" in reaction_percentiles:
+            percentile_text = self.font.render(
+                f"反応時間 中央値/90%: {reaction_percentiles['p50']:.0f}"
+                f"/{reaction_percentiles['p90']:.0f}ms "
+                f"({reaction_percentiles['count']}ヒット)",
+                True, COLOR_TEXT
             )
-
-    def _draw_line_graph(
-        self,
-        surface: pygame.Surface,
-        x: int,
-        y: int,
-        width: int,
-        height: int,
-        data: list,
-        title: str,
-        color: tuple
-    ) -> None:
-        """折れ線グラフを描画"""
-        if not data:
-            return
-        
-        # タイトル
-        title_text = self.font.render(title, True, COLOR_TEXT)
-        surface.blit(title_text, (x, y - 25))
-        
-        # 枠
-        pygame.draw.rect(surface, (60, 60, 80), (x, y, width, height), 2)
-        
-        # データ点
-        if len(data) < 2:
-            return
-        
-        max_val = max(data) if max(data) > 0 else 100
-        min_val = min(data) if min(data) < max_val else 0
-        value_range = max_val - min_val if max_val > min_val else 1
-        
-        points = []
-        for i, value in enumerate(data):
-            px = x + (i / (len(data) - 1)) * width
-            py = y + height - ((value - min_val) / value_range) * height
-            points.append((int(px), int(py)))
-        
-        # 線を描画
-        if len(points) >= 2:
-            pygame.draw.lines(surface, color, False, points, 2)
-        
-        # 点を描画
-        for point in points:
-            pygame.draw.circle(surface, color, point, 4)
-        
-        # 最大値・最小値ラベル
-        max_label = self.font.render(f"{max_val:.0f}", True, (150, 150, 150))
-        surface.blit(max_label, (x - 40, y))
-        
-        min_label = self.font.render(f"{min_val:.0f}", True, (150, 150, 150))
-        surface.blit(min_label, (x - 40, y + height - 15))
+            surface.blit(percentile_text, (x, y))
@@ -3,13 +3,20 @@ Trackingモード（追いエイム）
 """
 
 import pygame
-import time
+from datetime import datetime
 from .base import Scene
 from ..target import Target
 from ..cursor import Cursor
 from ..ui.button import Button
+from ..ui.layer import StaticLayer
+from ..ui.chart import LineChart
 from ..session_logger import save_tracking_session, load_tracking_sessions
 from ..effects import ParticleSystem, ScoreAnimation
+from ..telemetry import TelemetryRecorder, FLAG_ON_TARGET
+from ..live_metrics import LiveTrackingMetrics
+from ..live_bus import BUS_SESSION_ACTIVE, BUS_ON_TARGET, BUS_TARGET_VISIBLE
+from ..difficulty import load_difficulty_tiers, get_tier, step_tier, recorded_tier
+from ..render import NUMERIC_GLYPHS
 from ..settings import (
     SCREEN_WIDTH, SCREEN_HEIGHT,
     COLOR_BACKGROUND, COLOR_TEXT, COLOR_ACCENT, COLOR_SUCCESS,
@@ -31,27 +38,50 @@ class TrackingScene(Scene):
         self.target.spawn_random()
         self.target.set_random_velocity()
         
+        # 難易度の段階（較正していない場合はこの固定値を使う）
+        self.base_radius = self.target.radius
+        self.base_speed = self.target.base_speed
+        self.difficulty_tiers = load_difficulty_tiers()
+        
         # カーソル
         self.cursor = game.cursor
         
         # セッション設定
         self.session_duration = 30.0  # 秒
-        self.session_start_time = 0.0
+        self.session_start_ns = 0
         self.session_active = False
         
         # 統計
         self.time_on_target = 0.0
         self.total_time = 0.0
         
+        # 直近1秒・5秒のリアルタイム指標（HUD表示用）
+        self.live_metrics = LiveTrackingMetrics()
+        
         # リザルト表示
         self.show_result = False
         self.result_t0_rate = 0.0
+        self._result_version = 0
+        
+        # 静的レイヤー（開始画面・リザルト画面）
+        self.start_layer = StaticLayer(self._render_start)
+        self.result_layer = StaticLayer(self._render_result)
+        
+        # 直近5セッションのグラフ
+        self.result_chart = LineChart(
+            SCREEN_WIDTH // 2 - 200, 280, 400, 100,
+            "直近5セッション", self.font, (100, 255, 150),
+            show_labels=False
+        )
         
         # エフェクト
         self.particles = ParticleSystem()
         self.score_animation = None
         self.was_on_target = False
         
+        # フレーム単位のテレメトリ記録
+        self.recorder = TelemetryRecorder()
+        
         # UI
         self.back_button = Button(
             10, 10, 100, 40,
@@ -78,33 +108,56 @@ class TrackingScene(Scene):
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_ESCAPE:
                 if self.session_active:
-                    self._end_session()
+                    self.end_session()
                 else:
                     self.request_scene_change("launcher")
+            elif event.key in (pygame.K_LEFT, pygame.K_RIGHT):
+                # 開始前は左右キーで難易度を選ぶ
+                if not self.session_active and not self.show_result:
+                    step = -1 if event.key == pygame.K_LEFT else 1
+                    self.game.difficulty = step_tier(
+                        self.difficulty_tiers, "tracking", self.game.difficulty, step
+                    )
+
+    def on_enter(self) -> None:
+        """セッション中に戻ってきた場合は相対モードを再開（難易度の段階は較正し直した場合に備えて読み直す）"""
+        self.difficulty_tiers = load_difficulty_tiers()
+        if self.session_active:
+            self.game.input_handler.begin_raw_capture()
+
+    def on_exit(self) -> None:
+        """シーンを離れるときは相対モードを解除"""
+        self.game.input_handler.end_raw_capture()
 
     def update(self, dt: float) -> None:
-        mouse_pos = pygame.mouse.get_pos()
-        mouse_pressed = pygame.mouse.get_pressed()[0]
+        mouse_pos = self.game.input_handler.get_mouse_position()
+        input_handler = self.game.input_handler
+        mouse_pressed = input_handler.is_primary_pressed()
         self._mouse_just_pressed = mouse_pressed and not self._mouse_was_pressed
         self._mouse_was_pressed = mouse_pressed
         
         # 入力更新
-        self.game.input_handler.update()
+        input_handler.update()
         
         # カーソル更新
-        if self.game.input_handler.active_device == DeviceType.MOUSE:
+        if input_handler.active_device == DeviceType.MOUSE and not input_handler.is_raw_capture_active():
             self.cursor.set_position(mouse_pos[0], mouse_pos[1])
         else:
-            dx, dy = self.game.input_handler.get_cursor_velocity(dt)
+            # ゲームパッド・生マウス入力はカーソル側で小数点以下まで蓄積する
+            dx, dy = input_handler.get_cursor_velocity(dt)
             self.cursor.update(dx, dy)
         
+        # 相対モード・仮想デバイスではOSのポインタ位置が動かないため、UI判定にカーソル位置を使う
+        if input_handler.is_cursor_detached():
+            mouse_pos = self.cursor.get_center()
+        
         # ボタン更新
         if self.back_button.update(mouse_pos, self._mouse_just_pressed):
             self.request_scene_change("launcher")
         
         if not self.session_active and not self.show_result:
             if self.start_button.update(mouse_pos, self._mouse_just_pressed):
-                self._start_session()
+                self.start_session()
         
         if self.show_result:
             if self.retry_button.update(mouse_pos, self._mouse_just_pressed):
@@ -130,35 +183,74 @@ class TrackingScene(Scene):
             self.was_on_target = is_on_target
             self.total_time += dt
             
+            self.live_metrics.update(
+                dt, cursor_pos[0], cursor_pos[1],
+                self.target.x, self.target.y, self.target.radius,
+                self.target.velocity_x, self.target.velocity_y
+            )
+            
+            self.recorder.record(
+                self.total_time, cursor_pos[0], cursor_pos[1],
+                self.target.x, self.target.y, self.target.radius,
+                FLAG_ON_TARGET if is_on_target else 0
+            )
+            
             # パーティクル更新
             self.particles.update(dt)
             
             # セッション終了判定
-            elapsed = time.time() - self.session_start_time
+            elapsed = self.game.clock.seconds_since(self.session_start_ns)
             if elapsed >= self.session_duration:
-                self._end_session()
+                self.end_session()
 
-    def draw(self, surface: pygame.Surface) -> None:
-        surface.fill(COLOR_BACKGROUND)
+    def write_snapshot(self, snapshot) -> None:
+        """セッション中のターゲット・T0率をスナップショットに書き込む"""
+        if not self.session_active:
+            return
+        snapshot["target_x"] = self.target.x
+        snapshot["target_y"] = self.target.y
+        snapshot["target_r"] = self.target.radius
+        snapshot["session_time"] = self.total_time
+        snapshot["remaining"] = max(
+            0.0, self.session_duration - self.game.clock.seconds_since(self.session_start_ns)
+        )
+        if self.total_time > 0:
+            snapshot["t0_rate"] = self.time_on_target / self.total_time * 100
+        snapshot["t0_1s"] = self.live_metrics.t0_short()
+        snapshot["t0_5s"] = self.live_metrics.t0_long()
+        flags = BUS_SESSION_ACTIVE | BUS_TARGET_VISIBLE
+        if self.was_on_target:
+            flags |= BUS_ON_TARGET
+        snapshot["flags"] = flags
+
+    def render(self, renderer) -> None:
+        if self.session_active:
+            renderer.clear(COLOR_BACKGROUND)
+        elif self.show_result:
+            self.result_layer.render(renderer, self._result_version)
+        else:
+            self.start_layer.render(renderer, (self.session_duration, self._difficulty_label()))
         
         # 戻るボタン
-        self.back_button.draw(surface)
+        self.back_button.render(renderer)
         
         if self.session_active:
-            self._draw_session(surface)
+            self._draw_session(renderer)
         elif self.show_result:
-            self._draw_result(surface)
+            self._draw_result(renderer)
         else:
-            self._draw_start(surface)
+            self.start_button.render(renderer)
         
         # パーティクル描画
-        self.particles.draw(surface)
+        self.particles.render(renderer)
         
         # カーソル描画（常に最前面）
-        self.cursor.draw(surface)
+        self.cursor.render(renderer)
 
-    def _draw_start(self, surface: pygame.Surface) -> None:
-        """開始前の画面"""
+    def _render_start(self, surface: pygame.Surface) -> None:
+        """開始前の画面（静的レイヤー）"""
+        surface.fill(COLOR_BACKGROUND)
+        
         title = self.font_large.render("Tracking Mode", True, COLOR_ACCENT)
         title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 150))
         surface.blit(title, title_rect)
@@ -171,48 +263,75 @@ class TrackingScene(Scene):
         time_rect = time_text.get_rect(center=(SCREEN_WIDTH // 2, 240))
         surface.blit(time_text, time_rect)
         
-        self.start_button.draw(surface)
+        label = self._difficulty_label()
+        if label:
+            difficulty_text = self.font.render(label, True, COLOR_TEXT)
+            difficulty_rect = difficulty_text.get_rect(center=(SCREEN_WIDTH // 2, 275))
+            surface.blit(difficulty_text, difficulty_rect)
 
-    def _draw_session(self, surface: pygame.Surface) -> None:
+    def _difficulty_label(self):
+        """開始画面の難易度の表示（較正していない場合はNone）"""
+        if get_tier(self.difficulty_tiers, "tracking", self.game.difficulty) is None:
+            return None
+        return f"難易度: {self.game.difficulty}（← → で変更）"
+
+    def _draw_session(self, renderer) -> None:
         """セッション中の画面"""
         # ターゲット描画
-        self.target.draw(surface)
+        self.target.render(renderer)
         
         # 残り時間
-        elapsed = time.time() - self.session_start_time
+        elapsed = self.game.clock.seconds_since(self.session_start_ns)
         remaining = max(0, self.session_duration - elapsed)
-        time_text = self.font_large.render(f"{remaining:.1f}s", True, COLOR_TEXT)
-        surface.blit(time_text, (SCREEN_WIDTH - 100, 10))
+        renderer.glyph_text(self.font_large, f"{remaining:.1f}s", COLOR_TEXT, (SCREEN_WIDTH - 100, 10))
         
         # リアルタイムT0率
         if self.total_time > 0:
             current_t0 = (self.time_on_target / self.total_time) * 100
             t0_color = COLOR_SUCCESS if current_t0 >= 50 else COLOR_TEXT
-            t0_text = self.font.render(f"T0: {current_t0:.1f}%", True, t0_color)
-            surface.blit(t0_text, (SCREEN_WIDTH - 100, 50))
+            renderer.glyph_text(self.font, f"T0: {current_t0:.1f}%", t0_color, (SCREEN_WIDTH - 100, 50))
+        
+        # 直近の指標
+        metrics = self.live_metrics
+        x = SCREEN_WIDTH - 200
+        renderer.glyph_text(
+            self.font, f"1s: {metrics.t0_short():5.1f}%  5s: {metrics.t0_long():5.1f}%",
+            COLOR_TEXT, (x, 80)
+        )
+        renderer.glyph_text(self.font, f"距離: {metrics.mean_distance():5.1f}px", COLOR_TEXT, (x, 105))
+        renderer.glyph_text(
+            self.font, f"遅れ: {metrics.lag():5.1f}  行過: {metrics.overshoot():5.1f}",
+            COLOR_TEXT, (x, 130)
+        )
         
         # オンターゲット表示
         cursor_pos = self.cursor.get_position()
         if self.target.check_hit(cursor_pos[0], cursor_pos[1]):
-            hit_text = self.font.render("ON TARGET", True, COLOR_SUCCESS)
-            surface.blit(hit_text, (SCREEN_WIDTH // 2 - 50, 10))
+            renderer.text(self.font, "ON TARGET", COLOR_SUCCESS, (SCREEN_WIDTH // 2 - 50, 10))
 
-    def _draw_result(self, surface: pygame.Surface) -> None:
-        """リザルト画面"""
+    def _draw_result(self, renderer) -> None:
+        """リザルト画面（動的部分）"""
         # スコアアニメーション更新
         if self.score_animation:
             self.score_animation.update(self.game.dt)
         
-        title = self.font_large.render("結果", True, COLOR_ACCENT)
-        title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 100))
-        surface.blit(title, title_rect)
-        
         # T0率（アニメーション付き）
         display_t0 = self.score_animation.get_value() if self.score_animation else self.result_t0_rate
         t0_color = COLOR_SUCCESS if display_t0 >= 50 else (255, 150, 100)
-        t0_text = self.font_large.render(f"T0率: {display_t0:.1f}%", True, t0_color)
-        t0_rect = t0_text.get_rect(center=(SCREEN_WIDTH // 2, 170))
-        surface.blit(t0_text, t0_rect)
+        renderer.text(
+            self.font_large, f"T0率: {display_t0:.1f}%", t0_color,
+            (SCREEN_WIDTH // 2, 170), anchor="center"
+        )
+        
+        self.retry_button.render(renderer)
+
+    def _render_result(self, surface: pygame.Surface) -> None:
+        """リザルト画面（静的レイヤー）"""
+        surface.fill(COLOR_BACKGROUND)
+        
+        title = self.font_large.render("結果", True, COLOR_ACCENT)
+        title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 100))
+        surface.blit(title, title_rect)
         
         # 評価
         if self.result_t0_rate >= 80:
@@ -229,64 +348,41 @@ class TrackingScene(Scene):
         surface.blit(grade_text, grade_rect)
         
         # 直近5セッションのグラフ
-        sessions = load_tracking_sessions(5)
-        if sessions:
-            self._draw_result_graph(surface, sessions, 280)
-        
-        self.retry_button.draw(surface)
+        if self.result_chart.get_count() > 0:
+            self.result_chart.draw(surface)
 
-    def _draw_result_graph(self, surface: pygame.Surface, sessions: list, y_pos: int) -> None:
-        """リザルトグラフを描画"""
-        graph_width = 400
-        graph_height = 100
-        x_pos = SCREEN_WIDTH // 2 - graph_width // 2
-        
-        # タイトル
-        title = self.font.render("直近5セッション", True, COLOR_TEXT)
-        surface.blit(title, (x_pos, y_pos - 25))
-        
-        # 枠
-        pygame.draw.rect(surface, (60, 60, 80), (x_pos, y_pos, graph_width, graph_height), 2)
-        
-        if len(sessions) < 2:
-            return
-        
-        # データ
-        t0_rates = [s['t0_rate'] for s in sessions]
-        max_val = max(t0_rates) if max(t0_rates) > 0 else 100
-        min_val = min(t0_rates) if min(t0_rates) < max_val else 0
-        value_range = max_val - min_val if max_val > min_val else 1
-        
-        # 点とライン
-        points = []
-        for i, t0 in enumerate(t0_rates):
-            px = x_pos + (i / (len(t0_rates) - 1)) * graph_width
-            py = y_pos + graph_height - ((t0 - min_val) / value_range) * graph_height
-            points.append((int(px), int(py)))
-        
-        # ライン描画
-        if len(points) >= 2:
-            pygame.draw.lines(surface, (100, 255, 150), False, points, 2)
-        
-        # 点描画
-        for point in points:
-            pygame.draw.circle(surface, (100, 255, 150), point, 4)
-
-    def _start_session(self) -> None:
-        """セッション開始"""
+    def start_session(self) -> None:
+        """セッション開始（スタートボタン・ボット・アロケーション検査から呼ぶ）"""
         self.session_active = True
-        self.session_start_time = time.time()
+        self.session_start_ns = self.game.clock.now_ns()
         self.time_on_target = 0.0
         self.total_time = 0.0
+        self.live_metrics.reset()
         self.show_result = False
         
+        # 選択中の難易度の速さ・半径
+        tier = get_tier(self.difficulty_tiers, "tracking", self.game.difficulty) or {}
+        self.target.radius = tier.get("radius", self.base_radius)
+        self.target.set_speed(tier.get("speed", self.base_speed))
+        
         self.target.spawn_random()
+        self.target.reset_motion()
         self.target.set_random_velocity()
+        
+        # 残り時間・T0率・直近の指標の数値のグリフ
+        renderer = self.game.renderer
+        renderer.preload_glyphs(self.font_large, NUMERIC_GLYPHS, COLOR_TEXT)
+        for color in (COLOR_TEXT, COLOR_SUCCESS):
+            renderer.preload_glyphs(self.font, NUMERIC_GLYPHS, color)
+        
+        self.recorder.start("tracking")
+        self.game.input_handler.begin_raw_capture()
 
-    def _end_session(self) -> None:
+    def end_session(self) -> None:
         """セッション終了"""
         self.session_active = False
         self.show_result = True
+        self.game.input_handler.end_raw_capture()
         
         if self.total_time > 0:
             self.result_t0_rate = (self.time_on_target / self.total_time) * 100
@@ -296,9 +392,25 @@ class TrackingScene(Scene):
         # スコアアニメーション開始
         self.score_animation = ScoreAnimation(self.result_t0_rate, duration=1.5)
         
-        # セッション結果を保存
-        save_tracking_session(self.result_t0_rate, self.session_duration)
+        # セッション結果を難易度の段階とともに保存（テレメトリも同じ時刻で保存）
+        timestamp = datetime.now()
+        tier = recorded_tier(self.difficulty_tiers, "tracking", self.game.difficulty)
+        save_tracking_session(self.result_t0_rate, self.session_duration, timestamp, tier)
+        self.recorder.finish(timestamp)
         print(f"Tracking結果を保存: T0率 {self.result_t0_rate:.1f}%")
+        
+        # リザルト画面用の履歴（同じ段階のみ）は終了時に1回だけ読み込む
+        self.result_chart.set_data([s['t0_rate'] for s in load_tracking_sessions(5, tier)])
+        self._result_version += 1
+
+    def cancel_session(self) -> None:
+        """セッションを記録せずに終了（アロケーション検査など、結果を残さない計測用）"""
+        if not self.session_active:
+            return
+        self.session_active = False
+        self.recorder.cancel()
+        self.particles.clear()
+        self.game.input_handler.end_raw_capture()
 
     def _reset(self) -> None:
         """リセット"""
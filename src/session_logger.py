@@ -4,6 +4,7 @@
 
 import csv
 import os
+import tempfile
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
@@ -11,6 +12,19 @@ from typing import Dict, List, Any, Optional
 DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "sessions")
 
 
+# モード別のCSVの列（先頭行のヘッダー）
+SESSION_COLUMNS: Dict[str, List[str]] = {
+    "tracking": ['timestamp', 'mode', 't0_rate', 'duration', 'difficulty'],
+    "flicking": [
+        'timestamp', 'mode', 'accuracy',
+        'avg_reaction_ms', 'min_reaction_ms', 'hits', 'total', 'difficulty'
+    ],
+}
+
+# 難易度の段階を使わなかったセッション（較正前・difficulty 列がない旧形式の行）の difficulty 値
+NO_TIER = ""
+
+
 def ensure_data_dir() -> None:
     """データディレクトリを作成"""
     os.makedirs(DATA_DIR, exist_ok=True)
@@ -22,43 +36,127 @@ def get_csv_path(mode: str) -> str:
     return os.path.join(DATA_DIR, f"{mode}.csv")
 
 
-def save_tracking_session(t0_rate: float, duration: float) -> bool:
+def upgrade_csv(mode: str) -> None:
     """
-    Trackingセッションの結果を保存
-    
-    Args:
-        t0_rate: T0率 (%)
-        duration: セッション時間 (秒)
+    ヘッダーが現在の列と違う旧形式のCSVを現在の列に書き換える
+
+    追記の前に呼ぶ。旧形式にない列（difficulty など）は空欄になる。
+    一時ファイルに書き出してから置き換えるため、途中で失敗しても元のファイルは残る。
     """
-    csv_path = get_csv_path("tracking")
-    file_exists = os.path.exists(csv_path)
-    
+    csv_path = get_csv_path(mode)
+    columns = SESSION_COLUMNS[mode]
+    if not os.path.exists(csv_path):
+        return
+    with open(csv_path, 'r', newline='', encoding='utf-8') as f:
+        header = next(csv.reader(f), None)
+    if header is None or header == columns:
+        return
+
+    fd, temp_path = tempfile.mkstemp(
+        prefix=f".{mode}_", suffix=".csv", dir=os.path.dirname(csv_path)
+    )
+    try:
+        with open(csv_path, 'r', newline='', encoding='utf-8') as src, \
+                os.fdopen(fd, 'w', newline='', encoding='utf-8') as dst:
+            reader = csv.DictReader(src)
+            writer = csv.writer(dst)
+            writer.writerow(columns)
+            for row in reader:
+                writer.writerow([row.get(name) or "" for name in columns])
+        os.replace(temp_path, csv_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def _append_row(mode: str, row: List[Any]) -> bool:
+    """1行をCSVに追記（新規作成時はヘッダーも書く）"""
     try:
+        upgrade_csv(mode)
+        csv_path = get_csv_path(mode)
+        file_exists = os.path.exists(csv_path)
         with open(csv_path, 'a', newline='', encoding='utf-8') as f:
             writer = csv.writer(f)
             
             # ヘッダー
             if not file_exists:
-                writer.writerow(['timestamp', 'mode', 't0_rate', 'duration'])
+                writer.writerow(SESSION_COLUMNS[mode])
             
-            writer.writerow([
-                datetime.now().isoformat(),
-                'tracking',
-                f"{t0_rate:.2f}",
-                f"{duration:.1f}"
-            ])
+            writer.writerow(row)
         return True
     except Exception as e:
         print(f"セッション保存エラー: {e}")
         return False
 
 
+def format_tracking_row(
+    timestamp: datetime,
+    t0_rate: float,
+    duration: float,
+    difficulty: str = NO_TIER
+) -> List[Any]:
+    """Trackingセッション1件をCSVの1行に変換"""
+    return [
+        timestamp.isoformat(),
+        'tracking',
+        f"{t0_rate:.2f}",
+        f"{duration:.1f}",
+        difficulty
+    ]
+
+
+def format_flicking_row(
+    timestamp: datetime,
+    accuracy: float,
+    avg_reaction: float,
+    min_reaction: float,
+    hits: int,
+    total: int,
+    difficulty: str = NO_TIER
+) -> List[Any]:
+    """Flickingセッション1件をCSVの1行に変換（反応速度が0以下の場合は空欄）"""
+    return [
+        timestamp.isoformat(),
+        'flicking',
+        f"{accuracy:.1f}",
+        f"{avg_reaction:.0f}" if avg_reaction > 0 else "",
+        f"{min_reaction:.0f}" if min_reaction > 0 else "",
+        hits,
+        total,
+        difficulty
+    ]
+
+
+def save_tracking_session(
+    t0_rate: float,
+    duration: float,
+    timestamp: Optional[datetime] = None,
+    difficulty: str = NO_TIER
+) -> bool:
+    """
+    Trackingセッションの結果を保存
+    
+    Args:
+        t0_rate: T0率 (%)
+        duration: セッション時間 (秒)
+        timestamp: セッション時刻（Noneの場合は現在時刻。テレメトリと対応付ける場合に指定）
+        difficulty: 難易度の段階名（段階を使わなかった場合は NO_TIER）
+    """
+    return _append_row(
+        "tracking",
+        format_tracking_row(timestamp or datetime.now(), t0_rate, duration, difficulty)
+    )
+
+
 def save_flicking_session(
     accuracy: float,
     avg_reaction: float,
     min_reaction: float,
     hits: int,
-    total: int
+    total: int,
+    timestamp: Optional[datetime] = None,
+    difficulty: str = NO_TIER
 ) -> bool:
     """
     Flickingセッションの結果を保存
@@ -69,38 +167,23 @@ def save_flicking_session(
         min_reaction: 最速反応速度 (ms)
         hits: ヒット数
         total: 総ターゲット数
+        timestamp: セッション時刻（Noneの場合は現在時刻。ショット記録・テレメトリと対応付ける場合に指定）
+        difficulty: 難易度の段階名（段階を使わなかった場合は NO_TIER）
     """
-    csv_path = get_csv_path("flicking")
-    file_exists = os.path.exists(csv_path)
-    
-    try:
-        with open(csv_path, 'a', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            
-            # ヘッダー
-            if not file_exists:
-                writer.writerow([
-                    'timestamp', 'mode', 'accuracy',
-                    'avg_reaction_ms', 'min_reaction_ms', 'hits', 'total'
-                ])
-            
-            writer.writerow([
-                datetime.now().isoformat(),
-                'flicking',
-                f"{accuracy:.1f}",
-                f"{avg_reaction:.0f}" if avg_reaction > 0 else "",
-                f"{min_reaction:.0f}" if min_reaction > 0 else "",
-                hits,
-                total
-            ])
-        return True
-    except Exception as e:
-        print(f"セッション保存エラー: {e}")
-        return False
+    return _append_row("flicking", format_flicking_row(
+        timestamp or datetime.now(),
+        accuracy, avg_reaction, min_reaction, hits, total, difficulty
+    ))
+
 
+def load_tracking_sessions(limit: int = 20, difficulty: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Trackingセッション履歴を読み込み
 
-def load_tracking_sessions(limit: int = 20) -> List[Dict[str, Any]]:
-    """Trackingセッション履歴を読み込み"""
+    Args:
+        limit: 新しい方から読み込む件数
+        difficulty: この段階のセッションだけを読み込む（Noneの場合は全段階）
+    """
     csv_path = get_csv_path("tracking")
     sessions = []
     
@@ -111,11 +194,15 @@ def load_tracking_sessions(limit: int = 20) -> List[Dict[str, Any]]:
         with open(csv_path, 'r', encoding='utf-8') as f:
             reader = csv.DictReader(f)
             for row in reader:
+                tier = row.get('difficulty') or NO_TIER
+                if difficulty is not None and tier != difficulty:
+                    continue
                 sessions.append({
                     'timestamp': row['timestamp'],
                     'mode': row['mode'],
                     't0_rate': float(row['t0_rate']),
-                    'duration': float(row['duration'])
+                    'duration': float(row['duration']),
+                    'difficulty': tier
                 })
     except Exception as e:
         print(f"セッション読み込みエラー: {e}")
@@ -123,8 +210,14 @@ def load_tracking_sessions(limit: int = 20) -> List[Dict[str, Any]]:
     return sessions[-limit:]
 
 
-def load_flicking_sessions(limit: int = 20) -> List[Dict[str, Any]]:
-    """Flickingセッション履歴を読み込み"""
+def load_flicking_sessions(limit: int = 20, difficulty: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Flickingセッション履歴を読み込み
+
+    Args:
+        limit: 新しい方から読み込む件数
+        difficulty: この段階のセッションだけを読み込む（Noneの場合は全段階）
+    """
     csv_path = get_csv_path("flicking")
     sessions = []
     
@@ -135,6 +228,9 @@ def load_flicking_sessions(limit: int = 20) -> List[Dict[str, Any]]:
         with open(csv_path, 'r', encoding='utf-8') as f:
             reader = csv.DictReader(f)
             for row in reader:
+                tier = row.get('difficulty') or NO_TIER
+                if difficulty is not None and tier != difficulty:
+                    continue
                 sessions.append({
                     'timestamp': row['timestamp'],
                     'mode': row['mode'],
@@ -142,7 +238,8 @@ def load_flicking_sessions(limit: int = 20) -> List[Dict[str, Any]]:
                     'avg_reaction_ms': float(row['avg_reaction_ms']) if row['avg_reaction_ms'] else 0,
                     'min_reaction_ms': float(row['min_reaction_ms']) if row['min_reaction_ms'] else 0,
                     'hits': int(row['hits']),
-                    'total': int(row['total'])
+                    'total': int(row['total']),
+                    'difficulty': tier
                 })
     except Exception as e:
         print(f"セッション読み込みエラー: {e}")
@@ -150,9 +247,9 @@ def load_flicking_sessions(limit: int = 20) -> List[Dict[str, Any]]:
     return sessions[-limit:]
 
 
-def get_tracking_stats() -> Dict[str, Any]:
-    """Tracking統計を取得"""
-    sessions = load_tracking_sessions(100)
+def get_tracking_stats(difficulty: Optional[str] = None) -> Dict[str, Any]:
+    """Tracking統計を取得（difficulty を指定した場合はその段階のセッションだけ）"""
+    sessions = load_tracking_sessions(100, difficulty)
     
     if not sessions:
         return {'count': 0, 'avg': 0, 'best': 0, 'recent': []}
@@ -167,9 +264,9 @@ def get_tracking_stats() -> Dict[str, Any]:
     }
 
 
-def get_flicking_stats() -> Dict[str, Any]:
-    """Flicking統計を取得"""
-    sessions = load_flicking_sessions(100)
+def get_flicking_stats(difficulty: Optional[str] = None) -> Dict[str, Any]:
+    """Flicking統計を取得（difficulty を指定した場合はその段階のセッションだけ）"""
+    sessions = load_flicking_sessions(100, difficulty)
     
     if not sessions:
         return {'count': 0, 'avg_acc': 0, 'best_acc': 0, 'avg_reaction': 0, 'recent': []}
@@ -6,21 +6,69 @@
 SCREEN_WIDTH = 1280
 SCREEN_HEIGHT = 720
 WINDOW_TITLE = "PyAim Cross-Platform Tracker"
+RENDER_BACKEND = "surface"  # "surface"（ソフトウェアblit）または "texture"（SDL2 Renderer）
 TARGET_FPS = 144
 
+# 画質プリセット
+# ゲーム内座標は SCREEN_WIDTH x SCREEN_HEIGHT 固定。
+# render_scale: ゲーム内座標に対する内部解像度の倍率（0.5 = 640x360）。1未満の場合は
+#               内部解像度で描画してウィンドウ/全画面に拡大表示する（描画する画素数が減る）
+# scaled: 内部解像度のままウィンドウ/全画面に拡大表示（pygame.SCALED）
+# particle_density: パーティクル発生数の倍率
+# antialias: テキスト・ターゲットのアンチエイリアス
+# text_cache_size: レンダラーがキャッシュするテキストの最大数
+# 全画面表示はベンチマークで計測できないため、プリセットに含めずユーザー設定とする
+GRAPHICS_PRESETS = {
+    "low": {
+        "render_scale": 0.5,
+        "scaled": True,
+        "particle_density": 0.25,
+        "antialias": False,
+        "text_cache_size": 64,
+    },
+    "medium": {
+        "render_scale": 0.75,
+        "scaled": True,
+        "particle_density": 0.5,
+        "antialias": True,
+        "text_cache_size": 128,
+    },
+    "high": {
+        "render_scale": 1.0,
+        "scaled": True,
+        "particle_density": 1.0,
+        "antialias": True,
+        "text_cache_size": 256,
+    },
+}
+GRAPHICS_PRESET_ORDER = ("low", "medium", "high")  # 軽い順
+DEFAULT_GRAPHICS_PRESET = "high"
+GRAPHICS_FULLSCREEN = False  # 全画面表示（プロファイルの graphics.fullscreen で指定）
+
+# GC設定（セッション中の循環GCによるフレーム時間の跳ねを防ぐ）
+GC_SESSION_MODE = "disable"  # "disable" = 自動GC停止, "raise" = 閾値を上げる, "off" = 制御しない
+GC_SESSION_THRESHOLD = (50000, 50, 100)  # "raise" のときの gc.set_threshold
+GC_SESSION_MAX_PENDING = 200000  # "disable" 中でもこの数を超えたら第0世代だけ回収
+
 # カーソル設定
 CURSOR_SIZE = 24
 CURSOR_COLOR = (255, 50, 50)  # 赤
 CURSOR_CENTER_DOT_SIZE = 4
 CURSOR_CENTER_DOT_COLOR = (255, 255, 255)  # 白
+CURSOR_HARDWARE = False  # マウス操作時にOSのカーソルとしてレティクルを表示
 
 # マウス設定
 MOUSE_SENSITIVITY = 1.0
+MOUSE_RAW_INPUT = False  # セッション中に相対モードで生の移動量を使う
 
 # ゲームパッド設定
 GAMEPAD_SENSITIVITY = 500.0  # ピクセル/秒
 GAMEPAD_DEADZONE = 0.15  # デッドゾーン (0.0 - 0.3)
 GAMEPAD_RESPONSE_CURVE = 1.0  # 1.0 = Linear, 2.0+ = Exponential
+GAMEPAD_DEADZONE_MODE = "radial"  # "radial" = 円形, "axial" = 軸ごと（四角形）
+GAMEPAD_ANTI_DEADZONE = 0.0  # デッドゾーン直外の最小出力 (0.0 - 0.5)
+RESPONSE_LUT_SIZE = 1024  # 反応曲線ルックアップテーブルの分割数
+GAMEPAD_POLL_RATE = 0  # 別スレッドでのサンプリング周波数 (Hz, 0 = 無効, 500 - 1000)
 
 # 反応曲線タイプ
 class ResponseCurve:
@@ -28,6 +76,17 @@ class ResponseCurve:
     EXPONENTIAL = 2.0
     EXPONENTIAL_STRONG = 3.0
 
+# デッドゾーン形状
+class DeadzoneMode:
+    RADIAL = "radial"
+    AXIAL = "axial"
+
+# GC方針
+class GCMode:
+    DISABLE = "disable"
+    RAISE = "raise"
+    OFF = "off"
+
 # 色定義
 COLOR_BACKGROUND = (20, 20, 30)
 COLOR_TEXT = (220, 220, 220)
@@ -39,3 +98,4 @@ COLOR_WARNING = (255, 200, 100)
 class DeviceType:
     MOUSE = "mouse"
     GAMEPAD = "gamepad"
+    BOT = "bot"  # 仮想デバイス（ボットによる自動操作）
@@ -0,0 +1,171 @@
+"""
+Flickingのショット（1クリックごと）記録モジュール
+
+ショットを固定長レコードとしてバイナリファイル（data/shots/flicking.shots）に
+追記する。ファイルは先頭の固定長ヘッダーとレコードの連続だけで構成されるため、
+追記はレコードのバイト列を書き足すだけで済み、分析時は全体をメモリマップで読める。
+書き込み途中で終了した場合の端数バイトは読み込み時に無視する。
+"""
+
+import math
+import os
+import struct
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .session_logger import DATA_DIR
+from .settings import DeviceType
+
+
+SHOT_DIR = os.path.join(os.path.dirname(DATA_DIR), "shots")
+
+# 1ショット分のレコード
+SHOT_DTYPE = np.dtype([
+    ("session", "<i8"),          # セッション終了時刻（UNIX時間、マイクロ秒。CSVの timestamp と同じ時刻）
+    ("shot", "<u2"),             # セッション内の番号
+    ("device", "u1"),            # 入力デバイス（DEVICE_CODES）
+    ("hit", "u1"),               # 1: ヒット, 0: ミス
+    ("spawn_x", "<f4"),          # ターゲット出現位置
+    ("spawn_y", "<f4"),
+    ("click_x", "<f4"),          # クリック位置
+    ("click_y", "<f4"),
+    ("target_r", "<f4"),         # ターゲット半径
+    ("miss_distance", "<f4"),    # ターゲット外周からの距離（ヒット時は0）
+    ("reaction_ms", "<f4"),      # 表示からクリックまでの時間
+])
+
+# ファイルヘッダー: マジック, 形式バージョン, レコード長
+_HEADER = struct.Struct("<8sII")
+SHOT_MAGIC = b"PYAIMSHT"
+SHOT_VERSION = 1
+HEADER_SIZE = _HEADER.size
+
+# デバイス種別の保存値
+DEVICE_CODES = {DeviceType.MOUSE: 0, DeviceType.GAMEPAD: 1, DeviceType.BOT: 2}
+
+
+def get_shot_log_path(mode: str = "flicking") -> str:
+    """ショット記録ファイルのパス"""
+    os.makedirs(SHOT_DIR, exist_ok=True)
+    return os.path.join(SHOT_DIR, f"{mode}.shots")
+
+
+def to_session_key(timestamp: datetime) -> int:
+    """セッション時刻をレコードの session 値に変換"""
+    return int(np.datetime64(timestamp, "us").astype(np.int64))
+
+
+def make_shot(
+    shot: int,
+    device: str,
+    hit: bool,
+    spawn_pos: Tuple[float, float],
+    click_pos: Tuple[float, float],
+    target_r: float,
+    reaction_ms: float,
+) -> tuple:
+    """1ショット分のレコード（session は保存時に設定）"""
+    distance = math.hypot(click_pos[0] - spawn_pos[0], click_pos[1] - spawn_pos[1])
+    return (
+        0, shot, DEVICE_CODES.get(device, 0), 1 if hit else 0,
+        spawn_pos[0], spawn_pos[1], click_pos[0], click_pos[1],
+        target_r, 0.0 if hit else max(0.0, distance - target_r), reaction_ms,
+    )
+
+
+def append_shots(shots: Sequence[tuple], timestamp: datetime, mode: str = "flicking") -> bool:
+    """
+    1セッション分のショットを追記
+
+    Args:
+        shots: make_shot() で作成したレコードの列
+        timestamp: セッション時刻（CSVに保存した時刻）
+    """
+    if not shots:
+        return True
+    records = np.array(list(shots), dtype=SHOT_DTYPE)
+    records["session"] = to_session_key(timestamp)
+
+    path = get_shot_log_path(mode)
+    try:
+        with open(path, "ab") as f:
+            size = f.tell()
+            if size == 0:
+                f.write(_HEADER.pack(SHOT_MAGIC, SHOT_VERSION, SHOT_DTYPE.itemsize))
+            else:
+                # 前回の書き込みが途中で終わっていれば端数を切り捨ててから追記
+                partial = (size - HEADER_SIZE) % SHOT_DTYPE.itemsize
+                if partial:
+                    f.truncate(size - partial)
+            f.write(records.tobytes())
+        return True
+    except Exception as e:
+        print(f"ショット記録の保存エラー: {e}")
+        return False
+
+
+def load_shots(mode: str = "flicking") -> np.ndarray:
+    """
+    全ショットをメモリマップで読み込み
+
+    Returns:
+        SHOT_DTYPE の配列（記録がない・形式が違う場合は空配列）
+    """
+    path = get_shot_log_path(mode)
+    empty = np.zeros(0, dtype=SHOT_DTYPE)
+    if not os.path.exists(path):
+        return empty
+
+    size = os.path.getsize(path)
+    if size < HEADER_SIZE:
+        return empty
+    with open(path, "rb") as f:
+        magic, version, itemsize = _HEADER.unpack(f.read(HEADER_SIZE))
+    if magic != SHOT_MAGIC or version != SHOT_VERSION or itemsize != SHOT_DTYPE.itemsize:
+        print(f"ショット記録の形式が異なるため読み込みません: {path}")
+        return empty
+
+    count = (size - HEADER_SIZE) // SHOT_DTYPE.itemsize
+    if count == 0:
+        return empty
+    return np.memmap(path, dtype=SHOT_DTYPE, mode="r", offset=HEADER_SIZE, shape=(count,))
+
+
+def get_reaction_percentiles(
+    percentiles: Sequence[float] = (50, 90),
+    hits_only: bool = True,
+    shots: Optional[np.ndarray] = None,
+    sessions: Optional[np.ndarray] = None,
+) -> Dict[str, float]:
+    """
+    反応時間のパーセンタイル
+
+    Args:
+        sessions: 集計するセッションの session 値（Noneの場合は全セッション）
+
+    Returns:
+        {"count": ショット数, "p50": ..., "p90": ...}（記録がない場合は count のみ）
+    """
+    if shots is None:
+        shots = load_shots()
+    if sessions is not None:
+        shots = shots[np.isin(shots["session"], sessions)]
+    reactions = shots["reaction_ms"]
+    if hits_only:
+        reactions = reactions[shots["hit"] != 0]
+    result: Dict[str, float] = {"count": len(reactions)}
+    if len(reactions):
+        values = np.percentile(reactions, percentiles)
+        for p, value in zip(percentiles, values):
+            result[f"p{p:g}"] = float(value)
+    return result
+
+
+def split_sessions(shots: np.ndarray) -> List[np.ndarray]:
+    """ショット列をセッションごとに分割（記録順に並んでいる前提）"""
+    if len(shots) == 0:
+        return []
+    boundaries = np.flatnonzero(np.diff(shots["session"])) + 1
+    return np.split(shots, boundaries)
@@ -0,0 +1,151 @@
+"""
+統計データのバックグラウンド読み込みモジュール
+
+統計画面が使う履歴の集計（CSV・ショット記録・テレメトリの読み込み）を
+ワーカースレッドで行い、結果を項目（セクション）ごとにメインスレッドへ渡す。
+画面遷移時は読み込みを依頼するだけなので、履歴の大きさによらず1フレームで終わる。
+
+読み込み元ファイルのサイズと更新時刻が前回の依頼と同じ場合は読み直さないため、
+ランチャーでのプリフェッチや統計画面への再入場では結果をそのまま使える。
+"""
+
+import os
+import queue
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+
+# 読み込み失敗を表す結果
+LOAD_FAILED = object()
+
+# ファイルの状態（サイズ・更新時刻）の組
+Signature = Tuple[Tuple[int, int], ...]
+
+
+def _file_signature(paths: Iterable[str]) -> Signature:
+    """ファイルのサイズと更新時刻（存在しない場合は (-1, -1)）"""
+    signature = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            signature.append((stat.st_size, stat.st_mtime_ns))
+        except OSError:
+            signature.append((-1, -1))
+    return tuple(signature)
+
+
+class StatsLoader:
+    """
+    統計データをワーカースレッドで読み込むクラス
+
+    依頼は読み込み元ファイルの状態ごとに世代番号を持ち、
+    ファイルが変わると新しい世代として結果を破棄して読み直す。
+    ワーカーは古い世代の残りのセクションを読み飛ばす。
+    """
+
+    def __init__(
+        self,
+        tasks: Dict[str, Callable[[], Any]],
+        sources: Callable[[], List[str]],
+    ):
+        """
+        Args:
+            tasks: セクション名 → 読み込み関数（ワーカースレッドで呼ぶ）
+            sources: 読み込み元ファイルのパスを返す関数（変更の検出に使う）
+        """
+        self.tasks = tasks
+        self.sources = sources
+
+        self.generation = 0
+        self._signature: Optional[Signature] = None
+        self.results: Dict[str, Any] = {}
+        self._pending: Set[str] = set()
+
+        self._jobs: "queue.Queue[Tuple[int, str]]" = queue.Queue()
+        self._done: "queue.Queue[Tuple[int, str, Any]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+
+    def request(self, sections: Iterable[str]) -> None:
+        """
+        セクションの読み込みを依頼（メインスレッドから呼ぶ）
+
+        読み込み元が前回から変わっていれば結果を破棄して新しい世代で読み直す。
+        読み込み済み・読み込み中のセクションは依頼しない。
+        """
+        signature = _file_signature(self.sources())
+        if signature != self._signature:
+            self._signature = signature
+            self.generation += 1
+            self.results.clear()
+            self._pending.clear()
+
+        for name in sections:
+            if name in self.results or name in self._pending:
+                continue
+            self._pending.add(name)
+            self._jobs.put((self.generation, name))
+        self._ensure_thread()
+
+    def invalidate(self) -> None:
+        """
+        読み込み元が変わっていなくても次の依頼で読み直す（集計の条件を変えたとき）
+        """
+        self._signature = None
+
+    def poll(self) -> List[str]:
+        """
+        届いた結果を取り込む（メインスレッドから呼ぶ）
+
+        Returns:
+            今回取り込んだセクション名
+        """
+        arrived = []
+        while True:
+            try:
+                generation, name, value = self._done.get_nowait()
+            except queue.Empty:
+                break
+            if generation != self.generation:
+                continue
+            self._pending.discard(name)
+            self.results[name] = value
+            arrived.append(name)
+        return arrived
+
+    def is_loaded(self, name: str) -> bool:
+        """セクションが読み込み済みか（失敗した場合も True）"""
+        return name in self.results
+
+    def is_loading(self) -> bool:
+        """読み込み中のセクションがあるか"""
+        return bool(self._pending)
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """読み込み済みの結果（未読み込み・失敗の場合は default）"""
+        value = self.results.get(name, LOAD_FAILED)
+        return default if value is LOAD_FAILED else value
+
+    def failed(self, name: str) -> bool:
+        """セクションの読み込みに失敗したか"""
+        return self.results.get(name) is LOAD_FAILED
+
+    def _ensure_thread(self) -> None:
+        """ワーカースレッドを起動（起動済みなら何もしない）"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(target=self._run, name="StatsLoader", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        """ワーカースレッド本体"""
+        while True:
+            generation, name = self._jobs.get()
+            # 新しい世代が依頼済みなら古い依頼は読まない
+            if generation != self.generation:
+                continue
+            try:
+                value = self.tasks[name]()
+            except Exception as e:
+                print(f"統計の読み込みエラー ({name}): {e}")
+                value = LOAD_FAILED
+            self._done.put((generation, name, value))
@@ -54,6 +54,13 @@ class Target:
         self.velocity_x = math.cos(angle) * self.speed
         self.velocity_y = math.sin(angle) * self.speed
 
+    def reset_motion(self) -> None:
+        """方向転換・速度変化のタイマーを初期状態に戻す（前のセッションの状態を持ち越さない）"""
+        self.direction_change_timer = 0.0
+        self.direction_change_interval = random.uniform(1.5, 3.0)
+        self.speed_variation_timer = 0.0
+        self.speed_variation_interval = random.uniform(0.5, 1.5)
+
     def update(self, dt: float) -> None:
         """ターゲットを更新"""
         if not self.is_active:
@@ -127,6 +134,32 @@ class Target:
         # 中心のドット
         pygame.draw.circle(surface, (255, 255, 255), (cx, cy), int(self.radius * 0.2))
 
+    def _render_sprite(self) -> pygame.Surface:
+        """ターゲットをスプライトとして描画"""
+        return self._render_sprite_with(pygame.draw.circle)
+
+    def _render_sprite_aa(self) -> pygame.Surface:
+        """ターゲットをアンチエイリアス付きスプライトとして描画"""
+        return self._render_sprite_with(pygame.draw.aacircle)
+
+    def _render_sprite_with(self, circle) -> pygame.Surface:
+        """指定の円描画関数でスプライトを作成"""
+        r = int(self.radius)
+        surface = pygame.Surface((r * 2 + 1, r * 2 + 1), pygame.SRCALPHA)
+        circle(surface, self.outline_color, (r, r), r)
+        circle(surface, self.color, (r, r), int(self.radius * 0.7))
+        circle(surface, (255, 255, 255), (r, r), int(self.radius * 0.2))
+        return surface
+
+    def render(self, renderer) -> None:
+        """レンダラー経由で描画（見た目ごとにスプライトをキャッシュ）"""
+        if not self.is_active:
+            return
+        antialias = renderer.antialias and hasattr(pygame.draw, "aacircle")
+        key = ("target", int(self.radius), self.color, self.outline_color, antialias)
+        factory = self._render_sprite_aa if antialias else self._render_sprite
+        renderer.sprite(key, factory, (int(self.x), int(self.y)))
+
     def check_hit(self, cursor_x: float, cursor_y: float) -> bool:
         """カーソルとの当たり判定"""
         distance = math.sqrt((self.x - cursor_x) ** 2 + (self.y - cursor_y) ** 2)
@@ -0,0 +1,142 @@
+"""
+フレーム単位のテレメトリ記録モジュール
+
+セッション中のカーソル・ターゲット位置を固定長レコードとして記録し、
+セッションごとに .npy ファイルへ保存する。
+"""
+
+import glob
+import os
+from datetime import datetime
+from typing import List, Optional
+
+import numpy as np
+
+from .session_logger import DATA_DIR
+
+
+TELEMETRY_DIR = os.path.join(os.path.dirname(DATA_DIR), "telemetry")
+
+# 1フレーム分のレコード
+FRAME_DTYPE = np.dtype([
+    ("t", "<f4"),          # セッション開始からの経過時間（秒）
+    ("cursor_x", "<f4"),
+    ("cursor_y", "<f4"),
+    ("target_x", "<f4"),
+    ("target_y", "<f4"),
+    ("target_r", "<f4"),   # ターゲット半径
+    ("flags", "u1"),
+])
+
+# ファイル名（セッション時刻。セッション履歴CSVの timestamp と同じ時刻）の形式
+FILENAME_FORMAT = "%Y%m%dT%H%M%S_%f"
+
+# flags のビット
+FLAG_ON_TARGET = 0x01  # カーソルがターゲット上にある
+FLAG_CLICK = 0x02      # このフレームでクリックした
+FLAG_HIT = 0x04        # クリックがヒットした
+FLAG_SPAWN = 0x08      # このフレームでターゲットが出現した
+
+
+def get_telemetry_dir(mode: str) -> str:
+    """モード別のテレメトリディレクトリを取得"""
+    path = os.path.join(TELEMETRY_DIR, mode)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def list_telemetry_files(mode: str) -> List[str]:
+    """モード別のテレメトリファイルを古い順に取得"""
+    return sorted(glob.glob(os.path.join(TELEMETRY_DIR, mode, "*.npy")))
+
+
+def load_telemetry(path: str) -> np.ndarray:
+    """テレメトリファイルをメモリマップで読み込み"""
+    return np.load(path, mmap_mode="r")
+
+
+class TelemetryRecorder:
+    """セッション中のフレームレコードを事前確保バッファに記録するクラス"""
+
+    def __init__(self, capacity: int = 8192):
+        """
+        Args:
+            capacity: 初期バッファ容量（フレーム数）
+        """
+        self._buffer = np.zeros(capacity, dtype=FRAME_DTYPE)
+        self._count = 0
+        self.mode: Optional[str] = None
+
+    def start(self, mode: str) -> None:
+        """記録を開始"""
+        self.mode = mode
+        self._count = 0
+
+    def is_recording(self) -> bool:
+        """記録中かどうか"""
+        return self.mode is not None
+
+    def record(
+        self,
+        t: float,
+        cursor_x: float,
+        cursor_y: float,
+        target_x: float,
+        target_y: float,
+        target_r: float,
+        flags: int = 0,
+    ) -> None:
+        """1フレーム分を記録"""
+        if self.mode is None:
+            return
+
+        if self._count >= len(self._buffer):
+            # 容量を倍に拡張（償却O(1)）
+            grown = np.zeros(len(self._buffer) * 2, dtype=FRAME_DTYPE)
+            grown[:self._count] = self._buffer
+            self._buffer = grown
+
+        self._buffer[self._count] = (t, cursor_x, cursor_y, target_x, target_y, target_r, flags)
+        self._count += 1
+
+    def get_frames(self) -> np.ndarray:
+        """記録済みフレームのビューを取得"""
+        return self._buffer[:self._count]
+
+    def finish(self, timestamp: Optional[datetime] = None) -> Optional[str]:
+        """
+        記録を終了してファイルに保存
+
+        Args:
+            timestamp: セッション時刻（CSVに保存した時刻。Noneの場合は現在時刻）。
+                ファイル名とカタログのセッションIDになる
+
+        Returns:
+            保存先パス（記録がない・失敗した場合はNone）
+        """
+        mode = self.mode
+        self.mode = None
+        if mode is None or self._count == 0:
+            return None
+
+        filename = (timestamp or datetime.now()).strftime(FILENAME_FORMAT) + ".npy"
+        path = os.path.join(get_telemetry_dir(mode), filename)
+        try:
+            np.save(path, self.get_frames())
+        except Exception as e:
+            print(f"テレメトリ保存エラー: {e}")
+            return None
+
+        # リプレイのシーク用インデックス（記録直後のメモリ上のフレームから作成）
+        from .replay import build_keyframe_index, save_keyframe_index
+        save_keyframe_index(path, build_keyframe_index(self.get_frames()))
+
+        # 全セッションの索引にこのファイルだけを追加（他のファイルは照合しない）
+        from .catalog import add_catalog_entry
+        add_catalog_entry(mode, filename)
+        return path
+
+    def cancel(self) -> None:
+        """記録を破棄"""
+        self.mode = None
+        self._count = 0
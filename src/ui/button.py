@@ -3,11 +3,21 @@
 """
 
 import pygame
-from typing import Tuple, Callable, Optional
+from typing import Dict, Hashable, Tuple, Callable, Optional
+
+
+# ホバーアニメーションのスケールを量子化する刻み（キャッシュするサーフェス数を抑える）
+SCALE_STEP = 0.005
 
 
 class Button:
-    """クリック可能なボタン"""
+    """
+    クリック可能なボタン
+
+    見た目の状態（通常・ホバー・無効）と量子化したスケールごとに
+    描画済みサーフェスをキャッシュし、毎フレームはblitのみ行う。
+    状態が変わったフレームだけ is_dirty() が True になる。
+    """
 
     def __init__(
         self,
@@ -37,6 +47,11 @@ class Button:
         # アニメーション
         self.scale = 1.0
         self.target_scale = 1.0
+        
+        # 状態ごとの描画済みサーフェス
+        self._surfaces: Dict[Hashable, pygame.Surface] = {}
+        self._drawn_key: Optional[Hashable] = None
+        self._drawn_rect: Optional[pygame.Rect] = None
 
     def update(self, mouse_pos: Tuple[int, int], mouse_clicked: bool, dt: float = 0.016) -> bool:
         """
@@ -59,43 +74,97 @@ class Button:
         self.target_scale = 1.05 if self.is_hovered else 1.0
         
         # スケールアニメーション（スムーズに遷移）
-        self.scale += (self.target_scale - self.scale) * 10 * dt
+        if self.scale != self.target_scale:
+            self.scale += (self.target_scale - self.scale) * 10 * dt
+            # 目標付近で止める（漸近し続けて毎フレーム dirty にならないように）
+            if abs(self.target_scale - self.scale) < SCALE_STEP / 2:
+                self.scale = self.target_scale
         
         if self.is_hovered and mouse_clicked:
             return True
         return False
 
-    def draw(self, surface: pygame.Surface) -> None:
-        """ボタンを描画"""
-        # スケール適用
-        if abs(self.scale - 1.0) > 0.01:
-            # スケールされた矩形を計算
-            scaled_width = int(self.rect.width * self.scale)
-            scaled_height = int(self.rect.height * self.scale)
-            scaled_x = self.rect.centerx - scaled_width // 2
-            scaled_y = self.rect.centery - scaled_height // 2
-            draw_rect = pygame.Rect(scaled_x, scaled_y, scaled_width, scaled_height)
-        else:
-            draw_rect = self.rect
+    def _get_scale_step(self) -> int:
+        """描画に使うスケールの量子化インデックス"""
+        if abs(self.scale - 1.0) <= 0.01:
+            return 0
+        return round((self.scale - 1.0) / SCALE_STEP)
+
+    def get_state_key(self) -> Hashable:
+        """見た目を決める状態（同じなら描画結果も同じ）"""
+        if not self.enabled:
+            return ("disabled", 0)
+        return ("hover" if self.is_hovered else "normal", self._get_scale_step())
+
+    def is_dirty(self) -> bool:
+        """前回の描画から見た目が変わったか"""
+        return self.get_state_key() != self._drawn_key
+
+    def invalidate(self) -> None:
+        """キャッシュを破棄（テキストや色を変更した後に呼ぶ）"""
+        self._surfaces.clear()
+        self._drawn_key = None
+
+    def set_text(self, text: str) -> None:
+        """表示テキストを変更"""
+        if text != self.text:
+            self.text = text
+            self.invalidate()
+
+    def _render(self, key: Hashable) -> pygame.Surface:
+        """指定状態のボタンをサーフェスに描画"""
+        state, step = key
+        scale = 1.0 + step * SCALE_STEP
+        width = int(self.rect.width * scale)
+        height = int(self.rect.height * scale)
+        rendered = pygame.Surface((width, height), pygame.SRCALPHA)
+        draw_rect = rendered.get_rect()
         
         # 背景色
-        color = self.hover_color if self.is_hovered else self.color
-        if not self.enabled:
+        color = self.hover_color if state == "hover" else self.color
+        if state == "disabled":
             color = (40, 40, 50)
         
-        pygame.draw.rect(surface, color, draw_rect, border_radius=self.border_radius)
+        pygame.draw.rect(rendered, color, draw_rect, border_radius=self.border_radius)
         
         # 枠線
-        border_color = (100, 100, 140) if self.is_hovered else (80, 80, 100)
-        pygame.draw.rect(surface, border_color, draw_rect, width=2, border_radius=self.border_radius)
+        border_color = (100, 100, 140) if state == "hover" else (80, 80, 100)
+        pygame.draw.rect(rendered, border_color, draw_rect, width=2, border_radius=self.border_radius)
         
         # テキスト
-        text_color = self.text_color if self.enabled else (100, 100, 100)
+        text_color = self.text_color if state != "disabled" else (100, 100, 100)
         text_surface = self.font.render(self.text, True, text_color)
         text_rect = text_surface.get_rect(center=draw_rect.center)
-        surface.blit(text_surface, text_rect)
+        rendered.blit(text_surface, text_rect)
+        return rendered
+
+    def draw(self, surface: pygame.Surface) -> None:
+        """ボタンを描画（状態ごとのキャッシュを転送）"""
+        key = self.get_state_key()
+        rendered = self._surfaces.get(key)
+        if rendered is None:
+            rendered = self._render(key)
+            self._surfaces[key] = rendered
+        self._drawn_rect = surface.blit(rendered, rendered.get_rect(center=self.rect.center))
+        self._drawn_key = key
+
+    def render(self, renderer) -> None:
+        """レンダラー経由で描画（状態ごとのサーフェスをテクスチャとして使う）"""
+        key = self.get_state_key()
+        rendered = self._surfaces.get(key)
+        if rendered is None:
+            rendered = self._render(key)
+            self._surfaces[key] = rendered
+        rect = rendered.get_rect(center=self.rect.center)
+        renderer.blit(rendered, rect.topleft, cache_key=("button", id(self), self.text, key))
+        self._drawn_key = key
+
+    def get_drawn_rect(self) -> Optional[pygame.Rect]:
+        """前回描画した範囲"""
+        return self._drawn_rect
 
     def set_position(self, x: int, y: int) -> None:
         """ボタン位置を設定"""
         self.rect.x = x
         self.rect.y = y
+        self._drawn_key = None
@@ -0,0 +1,289 @@
+"""
+折れ線グラフUIコンポーネント（大量データ対応）
+"""
+
+import math
+import pygame
+import numpy as np
+from collections import OrderedDict
+from typing import List, Optional, Sequence, Tuple
+from ..settings import COLOR_BACKGROUND, COLOR_TEXT
+
+
+class MinMaxPyramid:
+    """
+    区間ごとの最小値・最大値を事前計算したピラミッド
+
+    レベルkは2^k個ずつまとめた最小値・最大値を持つ。
+    任意区間をN個のバケットに分けた最小・最大を、
+    生データではなく適切なレベルから O(N) で求められる。
+    """
+
+    def __init__(self, values: np.ndarray):
+        values = np.asarray(values, dtype=np.float64)
+        self.size = len(values)
+        self.levels: List[Tuple[np.ndarray, np.ndarray]] = [(values, values)]
+
+        mins, maxs = values, values
+        while len(mins) > 1:
+            if len(mins) % 2:
+                # 奇数長の場合は末尾を複製してペアにする
+                mins = np.append(mins, mins[-1])
+                maxs = np.append(maxs, maxs[-1])
+            mins = np.minimum(mins[0::2], mins[1::2])
+            maxs = np.maximum(maxs[0::2], maxs[1::2])
+            self.levels.append((mins, maxs))
+
+    def query(self, start: int, end: int, buckets: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        区間 [start, end) をバケットに分割した最小値・最大値を取得
+
+        Returns:
+            (各バケットの中心インデックス, 最小値, 最大値)
+        """
+        per_bucket = (end - start) / buckets
+        level = max(0, min(len(self.levels) - 1, int(math.log2(per_bucket)) if per_bucket >= 1 else 0))
+        block = 1 << level
+
+        level_min, level_max = self.levels[level]
+        first = start // block
+        last = min(len(level_min), -(-end // block))
+        level_min = level_min[first:last]
+        level_max = level_max[first:last]
+
+        edges = np.unique(np.linspace(0, len(level_min), buckets + 1).astype(np.int64)[:-1])
+        mins = np.minimum.reduceat(level_min, edges)
+        maxs = np.maximum.reduceat(level_max, edges)
+
+        bounds = np.append(edges, len(level_min))
+        centers = (first + (bounds[:-1] + bounds[1:]) / 2.0) * block
+        return centers, mins, maxs
+
+
+class LineChart:
+    """
+    パン・ズーム対応の折れ線グラフ
+
+    表示区間のデータ点がピクセル数を超える場合は min/max ピラミッドから
+    1ピクセル列あたり1本の縦線（最小〜最大）に間引いて描画する。
+    描画結果はビューポートごとにキャッシュされる。
+    """
+
+    # 生データ描画時に点を打つ上限（ピクセル幅あたり）
+    POINT_SPACING = 8
+    # 最小表示点数
+    MIN_SPAN = 4
+    # キャッシュするビューポート数
+    CACHE_SIZE = 16
+
+    def __init__(
+        self,
+        x: int,
+        y: int,
+        width: int,
+        height: int,
+        title: str,
+        font: pygame.font.Font,
+        color: Tuple[int, int, int],
+        show_labels: bool = True,
+        background: Tuple[int, int, int] = COLOR_BACKGROUND,
+    ):
+        self.rect = pygame.Rect(x, y, width, height)
+        self.title = title
+        self.font = font
+        self.color = color
+        self.show_labels = show_labels
+        self.background = background
+
+        # 描画領域（タイトルと軸ラベルを含む）
+        self.label_margin = 45 if show_labels else 0
+        self.title_height = 25
+        self.bounds = pygame.Rect(
+            x - self.label_margin, y - self.title_height,
+            width + self.label_margin, height + self.title_height
+        )
+
+        self.pyramid: Optional[MinMaxPyramid] = None
+        self.view_start = 0.0
+        self.view_end = 0.0
+
+        self._cache: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+        # データを差し替えるたびに増える（テクスチャの再転送の判定用）
+        self._data_version = 0
+        self._drag_x: Optional[int] = None
+        # 最後のマウスイベントの位置（ゲーム内座標、動かすまではグラフの外）
+        self._mouse_pos: Tuple[int, int] = (-1, -1)
+
+    def set_data(self, values: Sequence[float]) -> None:
+        """データを設定し、全体表示に戻す"""
+        values = np.asarray(values, dtype=np.float64)
+        self.set_pyramid(MinMaxPyramid(values) if len(values) else None)
+
+    def set_pyramid(self, pyramid: Optional[MinMaxPyramid]) -> None:
+        """作成済みのピラミッドを設定し、全体表示に戻す（別スレッドで作成した場合など）"""
+        self.pyramid = pyramid if pyramid is not None and pyramid.size else None
+        self._cache.clear()
+        self._data_version += 1
+        self.reset_view()
+
+    def get_count(self) -> int:
+        """データ点数を取得"""
+        return self.pyramid.size if self.pyramid else 0
+
+    def reset_view(self) -> None:
+        """全体表示"""
+        self.view_start = 0.0
+        self.view_end = float(self.get_count())
+
+    def zoom(self, factor: float, anchor: float = 0.5) -> None:
+        """
+        表示区間を拡大・縮小
+
+        Args:
+            factor: 1未満で拡大、1超で縮小
+            anchor: 固定点（グラフ幅に対する比率 0.0 - 1.0）
+        """
+        count = self.get_count()
+        if count < 2:
+            return
+
+        span = self.view_end - self.view_start
+        new_span = max(min(self.MIN_SPAN, count), min(count, span * factor))
+        pivot = self.view_start + span * anchor
+        self.view_start = pivot - new_span * anchor
+        self.view_end = self.view_start + new_span
+        self._clamp_view()
+
+    def pan(self, pixels: float) -> None:
+        """表示区間をピクセル単位で移動"""
+        span = self.view_end - self.view_start
+        shift = -pixels / self.rect.width * span
+        self.view_start += shift
+        self.view_end += shift
+        self._clamp_view()
+
+    def _clamp_view(self) -> None:
+        """表示区間をデータ範囲内に収める"""
+        count = self.get_count()
+        span = self.view_end - self.view_start
+        if self.view_start < 0:
+            self.view_start, self.view_end = 0.0, span
+        if self.view_end > count:
+            self.view_start, self.view_end = max(0.0, count - span), float(count)
+
+    def handle_event(self, event: pygame.event.Event) -> bool:
+        """
+        マウスホイールでズーム、ドラッグでパン
+
+        Returns:
+            True: 表示区間が変化した
+        """
+        if event.type in (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN):
+            # ホイールイベントは座標を持たないため、直前のマウスイベントの位置を使う
+            self._mouse_pos = event.pos
+
+        if event.type == pygame.MOUSEWHEEL:
+            mouse_x, mouse_y = self._mouse_pos
+            if self.rect.collidepoint(mouse_x, mouse_y):
+                anchor = (mouse_x - self.rect.x) / self.rect.width
+                self.zoom(0.8 ** event.y, anchor)
+                return True
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            if self.rect.collidepoint(event.pos):
+                self._drag_x = event.pos[0]
+        elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
+            self._drag_x = None
+        elif event.type == pygame.MOUSEMOTION and self._drag_x is not None:
+            self.pan(event.pos[0] - self._drag_x)
+            self._drag_x = event.pos[0]
+            return True
+        return False
+
+    def _get_surface(self, target: pygame.Surface) -> Tuple[pygame.Surface, tuple]:
+        """
+        現在のビューポートのグラフを取得（ビューポートごとのキャッシュを使用）
+
+        Returns:
+            (グラフのサーフェス, ビューポートのキー)
+        """
+        start = int(math.floor(self.view_start))
+        end = int(math.ceil(self.view_end))
+        key = (start, end)
+
+        chart_surface = self._cache.get(key)
+        if chart_surface is None:
+            chart_surface = self._render(target, start, end)
+            self._cache[key] = chart_surface
+            if len(self._cache) > self.CACHE_SIZE:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(key)
+        return chart_surface, key
+
+    def draw(self, surface: pygame.Surface) -> None:
+        """グラフを描画（ビューポートごとのキャッシュを使用）"""
+        chart_surface, _ = self._get_surface(surface)
+        surface.blit(chart_surface, self.bounds.topleft)
+
+    def render(self, renderer) -> None:
+        """レンダラー経由で描画（ビューポートかデータが変わったときだけテクスチャを更新）"""
+        chart_surface, key = self._get_surface(renderer.surface)
+        renderer.blit(
+            chart_surface, self.bounds.topleft,
+            cache_key=("chart", id(self)), version=(self._data_version, key)
+        )
+
+    def _render(self, target: pygame.Surface, start: int, end: int) -> pygame.Surface:
+        """指定区間のグラフをサーフェスに描画"""
+        chart_surface = pygame.Surface(self.bounds.size, 0, target)
+        chart_surface.fill(self.background)
+        ox, oy = self.label_margin, self.title_height
+        width, height = self.rect.width, self.rect.height
+
+        # タイトル
+        title_text = self.font.render(self.title, True, COLOR_TEXT)
+        chart_surface.blit(title_text, (ox, 0))
+
+        # 枠
+        pygame.draw.rect(chart_surface, (60, 60, 80), (ox, oy, width, height), 2)
+
+        span = end - start
+        if self.pyramid is None or span < 2:
+            return chart_surface
+
+        # 1ピクセル列あたり1バケット以下に抑える
+        buckets = min(span, width)
+        centers, mins, maxs = self.pyramid.query(start, end, buckets)
+
+        max_val = float(maxs.max()) if maxs.max() > 0 else 100.0
+        min_val = float(mins.min()) if mins.min() < max_val else 0.0
+        value_range = max_val - min_val if max_val > min_val else 1.0
+
+        xs = ox + (centers - 0.5 - start) / max(1, span - 1) * width
+        y_max = oy + height - (maxs - min_val) / value_range * height
+        y_min = oy + height - (mins - min_val) / value_range * height
+
+        if buckets < span:
+            # 間引き描画: 各列で最大→最小を結ぶ包絡線
+            points = np.empty((len(xs) * 2, 2))
+            points[0::2, 0] = xs
+            points[1::2, 0] = xs
+            points[0::2, 1] = y_max
+            points[1::2, 1] = y_min
+            pygame.draw.lines(chart_surface, self.color, False, points.astype(np.int32).tolist(), 2)
+        else:
+            points = np.column_stack((xs, y_max)).astype(np.int32).tolist()
+            pygame.draw.lines(chart_surface, self.color, False, points, 2)
+            if len(points) * self.POINT_SPACING <= width:
+                for point in points:
+                    pygame.draw.circle(chart_surface, self.color, point, 4)
+
+        # 最大値・最小値ラベル
+        if self.show_labels:
+            max_label = self.font.render(f"{max_val:.0f}", True, (150, 150, 150))
+            chart_surface.blit(max_label, (0, oy))
+
+            min_label = self.font.render(f"{min_val:.0f}", True, (150, 150, 150))
+            chart_surface.blit(min_label, (0, oy + height - 15))
+
+        return chart_surface
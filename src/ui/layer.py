@@ -0,0 +1,135 @@
+"""
+静的レイヤー（背景キャッシュ）モジュール
+"""
+
+import pygame
+from typing import Callable, Hashable, List, Optional, Sequence, Tuple
+
+
+class StaticLayer:
+    """
+    ほとんど変化しない描画内容をサーフェスにキャッシュするレイヤー
+
+    描画関数は key が変わったとき（またはサイズ変更時）にのみ呼ばれ、
+    それ以外のフレームではキャッシュ済みサーフェスを1回blitするだけになる。
+    """
+
+    def __init__(self, render: Callable[[pygame.Surface], None]):
+        """
+        Args:
+            render: キャッシュサーフェスに静的内容を描画する関数
+        """
+        self._render = render
+        self._surface: Optional[pygame.Surface] = None
+        self._key: Optional[Tuple[Tuple[int, int], Hashable]] = None
+        # 再構築のたびに増える（上に合成するレイヤーの同期用）
+        self.version = 0
+
+    def invalidate(self) -> None:
+        """次回描画時に再構築させる"""
+        self._key = None
+
+    def get_surface(self, target: pygame.Surface, key: Hashable = None) -> pygame.Surface:
+        """
+        キャッシュ済みサーフェスを取得（必要なら再構築）
+
+        Args:
+            target: 描画先サーフェス（サイズとピクセル形式の基準）
+            key: 静的内容の入力を表す値（変化したら再構築）
+        """
+        full_key = (target.get_size(), key)
+        if self._surface is None or self._surface.get_size() != full_key[0]:
+            self._surface = pygame.Surface(full_key[0], 0, target)
+            self._key = None
+        if self._key != full_key:
+            self._render(self._surface)
+            self._key = full_key
+            self.version += 1
+        return self._surface
+
+    def draw(self, surface: pygame.Surface, key: Hashable = None) -> None:
+        """キャッシュ済みの静的内容を描画先に転送"""
+        surface.blit(self.get_surface(surface, key), (0, 0))
+
+    def render(self, renderer, key: Hashable = None) -> None:
+        """レンダラー経由で描画（再構築されたときだけテクスチャを更新）"""
+        layer_surface = self.get_surface(renderer.surface, key)
+        renderer.blit(layer_surface, (0, 0), cache_key=("layer", id(self)), version=self.version)
+
+
+class WidgetLayer:
+    """
+    静的レイヤーの上にウィジェットを合成して保持するレイヤー
+
+    ウィジェットは get_state_key() / is_dirty() / draw() / get_drawn_rect() を持つ
+    （Button, Slider）。背景が再構築されたときは全ウィジェットを合成し直し、
+    それ以外のフレームでは見た目が変わったウィジェットの範囲だけを
+    背景から復元して描き直す。
+    """
+
+    def __init__(self, background: StaticLayer, widgets: Sequence):
+        """
+        Args:
+            background: 下に敷く静的レイヤー
+            widgets: 合成するウィジェット
+        """
+        self.background = background
+        self.widgets = list(widgets)
+        self._surface: Optional[pygame.Surface] = None
+        self._background_version = -1
+        # 合成結果が変わるたびに増える
+        self.version = 0
+
+    def invalidate(self) -> None:
+        """次回描画時に全ウィジェットを合成し直させる"""
+        self._background_version = -1
+
+    def get_surface(self, target: pygame.Surface, key: Hashable = None) -> pygame.Surface:
+        """
+        合成済みサーフェスを取得（必要な部分だけ更新）
+
+        Args:
+            target: 描画先サーフェス
+            key: 背景の静的内容の入力を表す値
+        """
+        base = self.background.get_surface(target, key)
+        if (
+            self._surface is None
+            or self._surface.get_size() != base.get_size()
+            or self._background_version != self.background.version
+        ):
+            self._surface = base.copy()
+            self._background_version = self.background.version
+            self.version += 1
+            for widget in self.widgets:
+                widget.draw(self._surface)
+            return self._surface
+
+        dirty = [widget for widget in self.widgets if widget.is_dirty()]
+        if not dirty:
+            return self._surface
+        self.version += 1
+
+        # 変化したウィジェットの旧範囲を背景で消す
+        restored: List[pygame.Rect] = []
+        for widget in dirty:
+            rect = widget.get_drawn_rect()
+            if rect is not None:
+                self._surface.blit(base, rect, rect)
+                restored.append(rect)
+
+        # 消した範囲に重なるウィジェットも含めて描き直す（描画順は維持）
+        for widget in self.widgets:
+            rect = widget.get_drawn_rect()
+            if widget in dirty or (rect is not None and rect.collidelist(restored) != -1):
+                widget.draw(self._surface)
+        return self._surface
+
+    def draw(self, surface: pygame.Surface, key: Hashable = None) -> None:
+        """合成済みの内容を描画先に転送"""
+        surface.blit(self.get_surface(surface, key), (0, 0))
+
+    def render(self, renderer, key: Hashable = None) -> None:
+        """レンダラー経由で描画（合成結果が変わったときだけテクスチャを更新）"""
+        layer_surface = self.get_surface(renderer.surface, key)
+        renderer.blit(layer_surface, (0, 0), cache_key=("layer", id(self)), version=self.version)
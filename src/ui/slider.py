@@ -3,11 +3,17 @@
 """
 
 import pygame
-from typing import Tuple
+from typing import Hashable, Optional, Tuple
 
 
 class Slider:
-    """値調整用スライダー"""
+    """
+    値調整用スライダー
+
+    ラベル・トラック・ハンドルをまとめて1枚のサーフェスにキャッシュする。
+    再描画はラベル文字列かハンドルのピクセル位置（値のバケット）が
+    変わったときのみ行う。
+    """
 
     def __init__(
         self,
@@ -37,6 +43,13 @@ class Slider:
         self.handle_radius = height // 2 + 2
         self.dragging = False
         self.track_y = y + height // 2
+        
+        # 描画済みサーフェス（ラベル上端からハンドル下端まで）
+        self._label_offset = 25
+        self._surface: Optional[pygame.Surface] = None
+        self._surface_key: Optional[Hashable] = None
+        self._drawn_key: Optional[Hashable] = None
+        self._drawn_rect: Optional[pygame.Rect] = None
 
     def _value_to_x(self) -> int:
         """値をX座標に変換"""
@@ -79,28 +92,66 @@ class Slider:
         
         return False
 
-    def draw(self, surface: pygame.Surface) -> None:
-        """スライダーを描画"""
-        # ラベル（整数値の場合は小数点なし）
+    def _get_label_text(self) -> str:
+        """ラベル文字列（整数値の場合は小数点なし）"""
         if self.value == int(self.value):
-            label_text = f"{self.label}: {int(self.value)}"
-        else:
-            label_text = f"{self.label}: {self.value:.2f}"
+            return f"{self.label}: {int(self.value)}"
+        return f"{self.label}: {self.value:.2f}"
+
+    def get_state_key(self) -> Hashable:
+        """見た目を決める状態（同じなら描画結果も同じ）"""
+        return (self._get_label_text(), self._value_to_x())
+
+    def is_dirty(self) -> bool:
+        """前回の描画から見た目が変わったか"""
+        return self.get_state_key() != self._drawn_key
+
+    def _render(self, key: Hashable) -> pygame.Surface:
+        """現在の状態をサーフェスに描画（座標はスライダー左上基準）"""
+        label_text, handle_x = key
+        origin_x = self.rect.x - self.handle_radius
+        origin_y = self.rect.y - self._label_offset
         label_surface = self.font.render(label_text, True, self.text_color)
-        surface.blit(label_surface, (self.rect.x, self.rect.y - 25))
+        width = max(self.rect.width + self.handle_radius * 2, label_surface.get_width())
+        height = max(
+            self.track_y + self.handle_radius + 1 - origin_y,
+            self._label_offset + label_surface.get_height(),
+        )
+        rendered = pygame.Surface((width, height), pygame.SRCALPHA)
+        
+        # ラベル
+        rendered.blit(label_surface, (self.rect.x - origin_x, 0))
         
         # トラック（背景）
-        track_rect = pygame.Rect(self.rect.x, self.track_y - 3, self.rect.width, 6)
-        pygame.draw.rect(surface, self.color, track_rect, border_radius=3)
+        track_x = self.rect.x - origin_x
+        track_y = self.track_y - origin_y
+        track_rect = pygame.Rect(track_x, track_y - 3, self.rect.width, 6)
+        pygame.draw.rect(rendered, self.color, track_rect, border_radius=3)
         
         # 塗りつぶし部分
-        handle_x = self._value_to_x()
-        fill_rect = pygame.Rect(self.rect.x, self.track_y - 3, handle_x - self.rect.x, 6)
-        pygame.draw.rect(surface, self.handle_color, fill_rect, border_radius=3)
+        handle_x -= origin_x
+        fill_rect = pygame.Rect(track_x, track_y - 3, handle_x - track_x, 6)
+        pygame.draw.rect(rendered, self.handle_color, fill_rect, border_radius=3)
         
         # ハンドル
-        pygame.draw.circle(surface, self.handle_color, (handle_x, self.track_y), self.handle_radius)
-        pygame.draw.circle(surface, (255, 255, 255), (handle_x, self.track_y), self.handle_radius - 3)
+        pygame.draw.circle(rendered, self.handle_color, (handle_x, track_y), self.handle_radius)
+        pygame.draw.circle(rendered, (255, 255, 255), (handle_x, track_y), self.handle_radius - 3)
+        return rendered
+
+    def draw(self, surface: pygame.Surface) -> None:
+        """スライダーを描画（状態が変わったときのみ再レンダリング）"""
+        key = self.get_state_key()
+        if self._surface is None or self._surface_key != key:
+            self._surface = self._render(key)
+            self._surface_key = key
+        self._drawn_rect = surface.blit(
+            self._surface, (self.rect.x - self.handle_radius, self.rect.y - self._label_offset)
+        )
+        self._drawn_key = key
+
+    def get_drawn_rect(self) -> Optional[pygame.Rect]:
+        """前回描画した範囲"""
+        return self._drawn_rect
 
     def set_value(self, value: float) -> None:
         """値を設定"""
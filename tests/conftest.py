@@ -0,0 +1,14 @@
+"""
+テスト共通設定
+
+ウィンドウ・音声のないヘッドレス環境で動かすため、pygame の初期化前に
+SDL のダミードライバを指定する。
+"""
+
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
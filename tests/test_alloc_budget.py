@@ -0,0 +1,38 @@
+"""
+定常状態のメモリ確保の予算テスト
+
+各シーンをヘッドレスで両方の描画バックエンドで動かし、1フレームあたりの
+残留ブロック数と一時確保が alloc_diagnostics の予算内かを調べる。
+"""
+
+import pytest
+
+from src import difficulty, profile, session_logger, shot_log, telemetry
+from src.alloc_diagnostics import CHECK_SCENES, collect_scene_allocations
+from src.render import BACKENDS
+from src.settings import DEFAULT_GRAPHICS_PRESET
+
+
+@pytest.fixture(scope="module", params=BACKENDS)
+def allocations(request, tmp_path_factory):
+    """バックエンドごとに全シーンを1回だけ動かして集計（保存先は一時フォルダ）"""
+    root = tmp_path_factory.mktemp(request.param)
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(session_logger, "DATA_DIR", str(root / "sessions"))
+        patch.setattr(shot_log, "SHOT_DIR", str(root / "shots"))
+        patch.setattr(telemetry, "TELEMETRY_DIR", str(root / "telemetry"))
+        patch.setattr(profile, "DEFAULT_PROFILE_PATH", str(root / "profile.json"))
+        patch.setattr(difficulty, "DIFFICULTY_PATH", str(root / "difficulty.json"))
+
+        # 初回起動時の画質ベンチマークを行わないよう画質設定を入れておく
+        data = profile.get_default_profile()
+        data["graphics"] = {"preset": DEFAULT_GRAPHICS_PRESET}
+        profile.save_profile(data)
+
+        yield collect_scene_allocations(request.param)
+
+
+@pytest.mark.parametrize("scene", CHECK_SCENES)
+def test_steady_state_allocations_within_budget(allocations, scene):
+    assert scene in allocations.stats
+    assert allocations.check_budget(scene_name=scene) == []
@@ -0,0 +1,47 @@
+"""
+列指向エクスポートのテスト
+
+不正な行（時刻・数値）は行ごと読み飛ばし、残りの行は読み込めることを調べる。
+"""
+
+import numpy as np
+import pytest
+
+from src import export, session_logger, telemetry
+
+
+TRACKING_CSV = (
+    "timestamp,mode,t0_rate,duration,difficulty\n"
+    "2026-01-18T12:00:00,tracking,65.4,30.0,normal\n"
+    "not-a-date,tracking,70.0,30.0,normal\n"
+    ",tracking,71.0,30.0,normal\n"
+    "2026-01-18T12:01:00,tracking,abc,30.0,normal\n"
+    "2026-01-18T12:02:00,tracking,80.0,30.0,hard\n"
+)
+
+
+@pytest.fixture
+def history(tmp_path, monkeypatch):
+    """不正な行を含む tracking.csv（保存先は一時フォルダ）"""
+    monkeypatch.setattr(session_logger, "DATA_DIR", str(tmp_path / "sessions"))
+    monkeypatch.setattr(telemetry, "TELEMETRY_DIR", str(tmp_path / "telemetry"))
+    with open(session_logger.get_csv_path("tracking"), "w", encoding="utf-8", newline="") as f:
+        f.write(TRACKING_CSV)
+    return tmp_path
+
+
+def test_load_columns_skips_malformed_rows(history):
+    columns = export.load_columns("tracking")
+    assert columns["timestamp"].tolist() == [
+        np.datetime64("2026-01-18T12:00:00", "us").item(),
+        np.datetime64("2026-01-18T12:02:00", "us").item(),
+    ]
+    assert columns["t0_rate"].tolist() == [65.4, 80.0]
+    assert columns["difficulty"].tolist() == ["normal", "hard"]
+
+
+def test_export_skips_malformed_rows(history):
+    paths = export.export_sessions(str(history / "out"), fmt=export.FORMAT_NPY, modes=["tracking"])
+    t0_rate = np.load(str(history / "out" / "tracking" / "t0_rate.npy"))
+    assert len(paths) == len(export.COLUMNS["tracking"])
+    assert t0_rate.tolist() == [65.4, 80.0]